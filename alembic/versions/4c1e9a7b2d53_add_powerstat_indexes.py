@@ -0,0 +1,64 @@
+"""add powerstat indexes
+
+Revision ID: 4c1e9a7b2d53
+Revises: 98cf8338630e
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1e9a7b2d53'
+down_revision: Union[str, Sequence[str], None] = '98cf8338630e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (stat, id) serves range filters on the stat alone, keyset pages sorted
+# by the stat and, combined with BitmapAnd, multi-stat filters.
+POWERSTATS = ("intelligence", "strength", "speed", "durability", "power", "combat")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction, but it doesn't block writes
+    with op.get_context().autocommit_block():
+        for stat in POWERSTATS:
+            op.create_index(
+                op.f(f'ix_superheroes_{stat}_id'),
+                'superheroes',
+                [stat, 'id'],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        # Duplicates the primary key index
+        op.drop_index(
+            op.f('ix_superheroes_id'),
+            table_name='superheroes',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_superheroes_id'),
+            'superheroes',
+            ['id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for stat in POWERSTATS:
+            op.drop_index(
+                op.f(f'ix_superheroes_{stat}_id'),
+                table_name='superheroes',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
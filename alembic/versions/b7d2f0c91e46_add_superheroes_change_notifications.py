@@ -0,0 +1,88 @@
+"""add superheroes change notifications
+
+Revision ID: b7d2f0c91e46
+Revises: 4c1e9a7b2d53
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f0c91e46'
+down_revision: Union[str, Sequence[str], None] = '4c1e9a7b2d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHANNEL = 'superheroes_changes'
+# Larger statements notify without ids, listeners reload the whole table
+MAX_NOTIFY_IDS = 500
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('table_versions',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('table_name', name=op.f('pk_table_versions'))
+    )
+    op.execute("INSERT INTO table_versions (table_name, version) VALUES ('superheroes', 0)")
+    # Statement level: one version bump and one notification per statement.
+    # The version row lock is held until commit, so notifications
+    # arrive in version order.
+    op.execute(f"""
+        CREATE FUNCTION superheroes_notify_changes() RETURNS trigger AS $$
+        DECLARE
+            new_version bigint;
+            changed_ids integer[];
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                SELECT array_agg(id) INTO changed_ids FROM old_rows;
+            ELSE
+                SELECT array_agg(id) INTO changed_ids FROM new_rows;
+            END IF;
+            IF changed_ids IS NULL THEN
+                RETURN NULL;
+            END IF;
+
+            UPDATE table_versions SET version = version + 1
+            WHERE table_name = 'superheroes'
+            RETURNING version INTO new_version;
+
+            PERFORM pg_notify('{CHANNEL}', json_build_object(
+                'version', new_version,
+                'op', TG_OP,
+                'ids', CASE WHEN cardinality(changed_ids) <= {MAX_NOTIFY_IDS} THEN changed_ids END
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # Transition tables allow one event per trigger
+    op.execute("""
+        CREATE TRIGGER superheroes_notify_insert AFTER INSERT ON superheroes
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION superheroes_notify_changes()
+    """)
+    op.execute("""
+        CREATE TRIGGER superheroes_notify_update AFTER UPDATE ON superheroes
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION superheroes_notify_changes()
+    """)
+    op.execute("""
+        CREATE TRIGGER superheroes_notify_delete AFTER DELETE ON superheroes
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION superheroes_notify_changes()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER superheroes_notify_delete ON superheroes")
+    op.execute("DROP TRIGGER superheroes_notify_update ON superheroes")
+    op.execute("DROP TRIGGER superheroes_notify_insert ON superheroes")
+    op.execute("DROP FUNCTION superheroes_notify_changes()")
+    op.drop_table('table_versions')
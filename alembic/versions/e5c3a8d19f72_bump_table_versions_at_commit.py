@@ -0,0 +1,121 @@
+"""bump table versions at commit
+
+Revision ID: e5c3a8d19f72
+Revises: b7d2f0c91e46
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c3a8d19f72'
+down_revision: Union[str, Sequence[str], None] = 'b7d2f0c91e46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHANNEL = 'superheroes_changes'
+# Larger statements notify without ids, listeners reload the whole table
+MAX_NOTIFY_IDS = 500
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One row per writing transaction, removed again at its commit
+    op.execute("""
+        CREATE UNLOGGED TABLE table_version_marks (
+            table_name varchar NOT NULL,
+            xact_id xid8 NOT NULL DEFAULT pg_current_xact_id(),
+            CONSTRAINT pk_table_version_marks PRIMARY KEY (table_name, xact_id)
+        )
+    """)
+    # Runs deferred, right before commit: the version row is locked only for
+    # the commit itself and always last, so writers don't queue behind each
+    # other's transactions nor deadlock on it. Versions still follow commit order.
+    op.execute("""
+        CREATE FUNCTION table_versions_bump() RETURNS trigger AS $$
+        DECLARE
+            new_version bigint;
+        BEGIN
+            DELETE FROM table_version_marks
+            WHERE table_name = NEW.table_name AND xact_id = NEW.xact_id;
+
+            UPDATE table_versions SET version = version + 1
+            WHERE table_name = NEW.table_name
+            RETURNING version INTO new_version;
+
+            PERFORM pg_notify(NEW.table_name || '_changes', json_build_object(
+                'version', new_version
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE CONSTRAINT TRIGGER table_versions_bump AFTER INSERT ON table_version_marks
+        DEFERRABLE INITIALLY DEFERRED
+        FOR EACH ROW EXECUTE FUNCTION table_versions_bump()
+    """)
+    # Statements only publish changed ids and mark the transaction,
+    # the version comes once per transaction with the commit
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION superheroes_notify_changes() RETURNS trigger AS $$
+        DECLARE
+            changed_ids integer[];
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                SELECT array_agg(id) INTO changed_ids FROM old_rows;
+            ELSE
+                SELECT array_agg(id) INTO changed_ids FROM new_rows;
+            END IF;
+            IF changed_ids IS NULL THEN
+                RETURN NULL;
+            END IF;
+
+            INSERT INTO table_version_marks (table_name) VALUES ('superheroes')
+            ON CONFLICT DO NOTHING;
+
+            PERFORM pg_notify('{CHANNEL}', json_build_object(
+                'ids', CASE WHEN cardinality(changed_ids) <= {MAX_NOTIFY_IDS} THEN changed_ids END
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION superheroes_notify_changes() RETURNS trigger AS $$
+        DECLARE
+            new_version bigint;
+            changed_ids integer[];
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                SELECT array_agg(id) INTO changed_ids FROM old_rows;
+            ELSE
+                SELECT array_agg(id) INTO changed_ids FROM new_rows;
+            END IF;
+            IF changed_ids IS NULL THEN
+                RETURN NULL;
+            END IF;
+
+            UPDATE table_versions SET version = version + 1
+            WHERE table_name = 'superheroes'
+            RETURNING version INTO new_version;
+
+            PERFORM pg_notify('{CHANNEL}', json_build_object(
+                'version', new_version,
+                'op', TG_OP,
+                'ids', CASE WHEN cardinality(changed_ids) <= {MAX_NOTIFY_IDS} THEN changed_ids END
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER table_versions_bump ON table_version_marks")
+    op.execute("DROP FUNCTION table_versions_bump()")
+    op.execute("DROP TABLE table_version_marks")
@@ -0,0 +1,74 @@
+"""
+Ingestion rate of synthetic heroes: COPY-based `bulk_load` vs INSERTs.
+
+All writes happen inside a transaction that is rolled back.
+Row-by-row `create` and batched `upsert_many` are measured on a sample
+and reported as rows/sec next to `bulk_load` of the full row count.
+
+Usage (needs a migrated database from `.env`):
+    python -m benchmarks.bench_bulk_load [--rows 1000000] [--sample 2000]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Iterator
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.settings import settings
+from src.apps.superheroes.repositories.superheroes import SuperheroesRepositoryImpl
+from src.apps.superheroes.schemas.superheroes import SuperheroCreateSchema
+
+
+def synthetic_heroes(count: int, prefix: str) -> Iterator[SuperheroCreateSchema]:
+    for i in range(count):
+        yield SuperheroCreateSchema(
+            name=f"{prefix}-{i}",
+            intelligence=i % 101,
+            strength=(i * 7) % 101,
+            speed=(i * 13) % 101,
+            durability=(i * 17) % 101,
+            power=(i * 19) % 101,
+            combat=(i * 23) % 101,
+        )
+
+
+async def main(rows: int, sample: int, batch_size: int) -> None:
+    engine = create_async_engine(settings.db.dsn)
+    async with engine.connect() as conn:
+        await conn.begin()
+        repo = SuperheroesRepositoryImpl(async_sessionmaker(bind=conn, expire_on_commit=False)())
+
+        started = time.perf_counter()
+        for hero in synthetic_heroes(sample, "bench-create"):
+            await repo.create(hero)
+        create_rate = sample / (time.perf_counter() - started)
+
+        heroes = list(synthetic_heroes(sample, "bench-upsert"))
+        started = time.perf_counter()
+        for i in range(0, sample, batch_size):
+            await repo.upsert_many(heroes[i : i + batch_size], conflict_fields=("name",))
+        upsert_rate = sample / (time.perf_counter() - started)
+
+        report = await repo.bulk_load(synthetic_heroes(rows, "bench-copy"), conflict_fields=("name",))
+        # Second load of the same rows hits the conflict path for every row
+        merge = await repo.bulk_load(synthetic_heroes(rows, "bench-copy"), conflict_fields=("name",))
+
+        print(f"{'method':>22} {'rows':>10} {'rows/s':>12}")
+        print(f"{'create (row by row)':>22} {sample:>10} {create_rate:>12,.0f}")
+        print(f"{f'upsert_many ({batch_size})':>22} {sample:>10} {upsert_rate:>12,.0f}")
+        print(f"{'bulk_load (insert)':>22} {report.loaded:>10} {report.rows_per_second:>12,.0f}")
+        print(f"{'bulk_load (update)':>22} {merge.loaded:>10} {merge.rows_per_second:>12,.0f}")
+
+        await conn.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=2_000, help="Rows for the INSERT based methods")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.sample, args.batch_size))
@@ -0,0 +1,98 @@
+"""
+Latency of GET /hero powerstat filters: in-memory columnar read model
+vs `SuperheroesRepositoryImpl.filter_all`.
+
+Seeds the `superheroes` table inside a transaction that is rolled back,
+loads the same rows into `ColumnarSuperheroes` and runs a few filter
+shapes (first page) against both at every size.
+
+Usage (needs numpy and a migrated database from `.env`):
+    python -m benchmarks.bench_columnar [--sizes 10000 1000000 10000000] [--repeat 20]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.settings import settings
+from src.apps.superheroes.read_model.columnar import ColumnarSuperheroes
+from src.apps.superheroes.repositories.superheroes import SuperheroesRepositoryImpl
+from src.apps.superheroes.schemas.superheroes import SuperheroQueryFilterSchema
+from benchmarks.bench_pagination import SEED_SQL
+
+FILTERS = {
+    "no filters": SuperheroQueryFilterSchema(),
+    "eq": SuperheroQueryFilterSchema(strength=50),
+    "range, sorted": SuperheroQueryFilterSchema(speed_ge=40, speed_le=60, sort_by="speed"),
+    "3 ranges": SuperheroQueryFilterSchema(
+        intelligence_ge=90, strength_ge=90, combat_le=10, sort_by="power"
+    ),
+    "selective": SuperheroQueryFilterSchema(intelligence=99, power=1, durability_ge=95),
+}
+
+
+async def median_ms(func: Callable[[], Awaitable[object]], repeat: int) -> float:
+    await func()
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - started)
+    return sorted(timings)[len(timings) // 2] * 1000
+
+
+async def main(sizes: List[int], repeat: int) -> None:
+    engine = create_async_engine(settings.db.dsn)
+    async with engine.connect() as conn:
+        await conn.begin()
+        session = async_sessionmaker(bind=conn, expire_on_commit=False)()
+        repo = SuperheroesRepositoryImpl(session)
+        model = ColumnarSuperheroes()
+
+        async def from_db(filters: SuperheroQueryFilterSchema) -> None:
+            try:
+                await repo.filter_all(filters)
+            except Exception:
+                pass  # nothing found
+
+        async def from_memory(filters: SuperheroQueryFilterSchema) -> None:
+            model.filter(filters)
+
+        print(f"{'rows':>10} {'filter':>14} {'db ms':>9} {'memory ms':>10} {'speedup':>8}")
+        seeded = 0
+        for size in sorted(sizes):
+            await conn.execute(SEED_SQL, {"start": seeded + 1, "stop": size})
+            await conn.execute(text("ANALYZE superheroes"))
+            seeded = size
+
+            started = time.perf_counter()
+            rows = (await conn.execute(repo._select_rows())).all()
+            model.load(rows, version=0)
+            print(
+                f"{len(rows):>10} loaded in {time.perf_counter() - started:.2f}s, "
+                f"{model.stats()['column_bytes'] / 2**20:.1f} MiB of columns"
+            )
+            del rows
+
+            for name, filters in FILTERS.items():
+                db_ms = await median_ms(lambda: from_db(filters), repeat)
+                memory_ms = await median_ms(lambda: from_memory(filters), repeat)
+                print(
+                    f"{size:>10} {name:>14} {db_ms:>9.2f} {memory_ms:>10.2f} "
+                    f"{db_ms / memory_ms:>7.1f}x"
+                )
+
+        await conn.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
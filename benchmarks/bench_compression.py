@@ -0,0 +1,84 @@
+"""
+Response compression: ratio, CPU throughput and delivery time per encoding
+and level on hero listing JSON of realistic sizes.
+
+Delivery time = compression CPU + transfer of the compressed body over
+the given links, so slow links favour strong levels and fast ones cheap
+levels. Encodings whose library is missing are skipped. No database needed.
+
+Usage:
+    python -m benchmarks.bench_compression [--sizes 10000 100000 1000000 5000000] [--repeat 5]
+"""
+
+import argparse
+import time
+from typing import Dict, List, Tuple
+
+from src.core.compression import _ENCODINGS, available_encodings
+from src.core.responses import PydanticJSONResponse
+from benchmarks.bench_json_response import make_page
+
+LEVELS: Dict[str, Tuple[int, ...]] = {
+    "gzip": (1, 6, 9),
+    "zstd": (1, 3, 9),
+    "br": (1, 4, 11),
+}
+# Mbit/s
+LINKS = {"mobile 10M": 10, "office 100M": 100, "dc 1G": 1000}
+
+
+def listing_json(size: int) -> bytes:
+    """
+    Hero page JSON of about `size` bytes, as GET /hero/stream-sized listings.
+    """
+    per_item = len(PydanticJSONResponse(make_page(1)).body)
+    return PydanticJSONResponse(make_page(max(1, size // per_item))).body
+
+
+def compress(encoding: str, level: int, body: bytes) -> bytes:
+    factory, _ = _ENCODINGS[encoding]
+    compressor = factory(level)
+    return compressor.compress(body) + compressor.finish()
+
+
+def best_seconds(encoding: str, level: int, body: bytes, repeat: int) -> Tuple[float, int]:
+    compressed = b""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        compressed = compress(encoding, level, body)
+        best = min(best, time.perf_counter() - started)
+    return best, len(compressed)
+
+
+def main(sizes: List[int], repeat: int) -> None:
+    encodings = available_encodings()
+    links = "".join(f" {name + ' ms':>15}" for name in LINKS)
+    for size in sizes:
+        body = listing_json(size)
+        print(f"\n{len(body) / 2**10:,.0f} KiB of JSON")
+        print(f"{'encoding':>10} {'ratio':>6} {'MiB/s':>7}{links}")
+
+        identity = "".join(
+            f" {len(body) * 8 / (mbit * 1e6) * 1000:>15.1f}" for mbit in LINKS.values()
+        )
+        print(f"{'identity':>10} {1:>6.1f} {'-':>7}{identity}")
+        for encoding in encodings:
+            for level in LEVELS[encoding]:
+                seconds, compressed = best_seconds(encoding, level, body, repeat)
+                delivery = "".join(
+                    f" {(seconds + compressed * 8 / (mbit * 1e6)) * 1000:>15.1f}"
+                    for mbit in LINKS.values()
+                )
+                print(
+                    f"{f'{encoding}-{level}':>10} {len(body) / compressed:>6.1f} "
+                    f"{len(body) / seconds / 2**20:>7.0f}{delivery}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat)
@@ -0,0 +1,94 @@
+"""
+CPU cost of large list responses: FastAPI response model path vs
+PydanticJSONResponse.
+
+Runs in-process over ASGI, no database needed:
+  * response_model - route returns schemas with a return annotation: FastAPI
+                     dumps, re-validates and encodes them (stdlib json)
+  * pydantic_json  - route returns PydanticJSONResponse: one pydantic-core
+                     serialization straight to bytes
+
+Usage:
+    python -m benchmarks.bench_json_response [--sizes 100 1000 10000 100000] [--repeat 10]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+import httpx
+from fastapi import FastAPI, Response
+
+from src.core.responses import PydanticJSONResponse
+from src.apps.superheroes.schemas.superheroes import SuperheroReadSchema, SuperheroPageSchema
+
+
+def make_page(size: int) -> SuperheroPageSchema:
+    return SuperheroPageSchema(
+        items=[
+            SuperheroReadSchema(
+                id=i,
+                name=f"bench-{i}",
+                intelligence=i % 100,
+                strength=(i * 7) % 100,
+                speed=(i * 13) % 100,
+                durability=(i * 17) % 100,
+                power=(i * 19) % 100,
+                combat=(i * 23) % 100,
+            )
+            for i in range(size)
+        ],
+        next_cursor="bench",
+    )
+
+
+def make_app(page: SuperheroPageSchema) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/response_model")
+    async def response_model() -> SuperheroPageSchema:
+        return page
+
+    @app.get("/pydantic_json", response_model=SuperheroPageSchema)
+    async def pydantic_json() -> Response:
+        return PydanticJSONResponse(page)
+
+    return app
+
+
+async def cpu_ms(client: httpx.AsyncClient, path: str, repeat: int) -> float:
+    """
+    Median process CPU time of one request, one warm-up request first.
+    """
+    await client.get(path)
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.process_time()
+        response = await client.get(path)
+        timings.append(time.process_time() - started)
+        response.raise_for_status()
+    return sorted(timings)[len(timings) // 2] * 1000
+
+
+async def main(sizes: List[int], repeat: int) -> None:
+    print(f"{'items':>8} {'MiB':>7} {'response_model ms':>18} {'pydantic_json ms':>17} {'saved':>6}")
+    for size in sizes:
+        page = make_page(size)
+        transport = httpx.ASGITransport(app=make_app(page))
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            body = (await client.get("/pydantic_json")).content
+            slow = await cpu_ms(client, "/response_model", repeat)
+            fast = await cpu_ms(client, "/pydantic_json", repeat)
+        print(
+            f"{size:>8} {len(body) / 2**20:>7.2f} {slow:>18.2f} {fast:>17.2f} "
+            f"{1 - fast / slow:>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
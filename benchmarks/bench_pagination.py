@@ -0,0 +1,96 @@
+"""
+Memory per request of `GET /superheroes/hero` filtering vs table size.
+
+Seeds the `superheroes` table inside a transaction that is rolled back,
+then measures peak Python memory (tracemalloc) of one page request
+and of loading the whole filtered set (the unpaginated behaviour).
+
+Usage (needs a migrated database from `.env`):
+    python -m benchmarks.bench_pagination [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.settings import settings
+from src.core.models.superheroes import Superhero
+from src.apps.superheroes.repositories.superheroes import SuperheroesRepositoryImpl
+from src.apps.superheroes.schemas.superheroes import (
+    SuperheroQueryFilterSchema,
+    SuperheroReadSchema,
+)
+
+SEED_SQL = text(
+    """
+    INSERT INTO superheroes (name, intelligence, strength, speed, durability, power, combat)
+    SELECT 'bench-' || g, (random() * 100)::int, (random() * 100)::int,
+           (random() * 100)::int, (random() * 100)::int, (random() * 100)::int,
+           (random() * 100)::int
+    FROM generate_series(:start, :stop) AS g
+    """
+)
+
+
+async def measure(func: Callable[[], Awaitable[object]]) -> Tuple[float, float]:
+    """
+    Returns (seconds, peak MiB) of one call.
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    await func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+async def load_all(session: AsyncSession) -> None:
+    async with session as s:
+        models = (await s.execute(select(Superhero))).scalars().all()
+        [SuperheroReadSchema.model_validate(m, from_attributes=True) for m in models]
+
+
+async def main(sizes: list[int], full_scan_limit: int) -> None:
+    engine = create_async_engine(settings.db.dsn)
+    async with engine.connect() as conn:
+        await conn.begin()
+        session = async_sessionmaker(bind=conn, expire_on_commit=False)()
+        repo = SuperheroesRepositoryImpl(session)
+        filters = SuperheroQueryFilterSchema(strength_ge=10, sort_by="strength")
+
+        seeded = 0
+        print(f"{'rows':>10} {'page s':>8} {'page MiB':>9} {'all s':>8} {'all MiB':>8}")
+        for size in sorted(sizes):
+            await conn.execute(SEED_SQL, {"start": seeded + 1, "stop": size})
+            await conn.execute(text("ANALYZE superheroes"))
+            seeded = size
+
+            page_time, page_mem = await measure(lambda: repo.filter_all(filters))
+            if size <= full_scan_limit:
+                all_time, all_mem = await measure(lambda: load_all(session))
+                full = f"{all_time:>8.3f} {all_mem:>8.1f}"
+            else:
+                full = f"{'-':>8} {'-':>8}"
+            print(f"{size:>10} {page_time:>8.3f} {page_mem:>9.2f} {full}")
+
+        await conn.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument(
+        "--full-scan-limit",
+        type=int,
+        default=100_000,
+        help="Largest table size to also measure the unpaginated load for",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.full_scan_limit))
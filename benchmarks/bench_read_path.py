@@ -0,0 +1,92 @@
+"""
+Rows/sec of the superheroes read path: ORM instances vs Core row tuples.
+
+Seeds the `superheroes` table inside a transaction that is rolled back,
+then reads the same rows into `SuperheroReadSchema` with:
+  * orm     - select(Superhero) + model_validate(from_attributes=True) per row
+  * core    - repository `_select_rows` + `_rows_to_schemas` (current path)
+  * asyncpg - raw driver fetch + `_rows_to_schemas`, no SQLAlchemy result layer
+
+Usage (needs a migrated database from `.env`):
+    python -m benchmarks.bench_read_path [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.settings import settings
+from src.core.models.superheroes import Superhero
+from src.apps.superheroes.repositories.superheroes import SuperheroesRepositoryImpl
+from src.apps.superheroes.schemas.superheroes import SuperheroReadSchema
+from benchmarks.bench_pagination import SEED_SQL
+
+
+async def read_orm(session: AsyncSession) -> List[SuperheroReadSchema]:
+    async with session as s:
+        models = (await s.execute(select(Superhero))).scalars().all()
+        return [SuperheroReadSchema.model_validate(m, from_attributes=True) for m in models]
+
+
+async def read_core(session: AsyncSession, repo: SuperheroesRepositoryImpl) -> List[SuperheroReadSchema]:
+    async with session as s:
+        rows = (await s.execute(repo._select_rows())).all()
+        return repo._rows_to_schemas(rows)
+
+
+async def read_asyncpg(conn: AsyncConnection, repo: SuperheroesRepositoryImpl) -> List[SuperheroReadSchema]:
+    raw = await conn.get_raw_connection()
+    sql = str(repo._select_rows().compile(dialect=postgresql.dialect()))
+    rows = await raw.driver_connection.fetch(sql)
+    return repo._rows_to_schemas(rows)
+
+
+async def rows_per_second(func: Callable[[], Awaitable[list]], repeat: int) -> float:
+    """
+    Best of `repeat` runs, one warm-up run first.
+    """
+    await func()
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(await func())
+        best = min(best, time.perf_counter() - started)
+    return rows / best
+
+
+async def main(rows: int, repeat: int) -> None:
+    engine = create_async_engine(settings.db.dsn)
+    async with engine.connect() as conn:
+        await conn.begin()
+        session = async_sessionmaker(bind=conn, expire_on_commit=False)()
+        repo = SuperheroesRepositoryImpl(session)
+
+        await conn.execute(SEED_SQL, {"start": 1, "stop": rows})
+        total = (await conn.execute(text("SELECT count(*) FROM superheroes"))).scalar_one()
+
+        results = {
+            "orm": await rows_per_second(lambda: read_orm(session), repeat),
+            "core": await rows_per_second(lambda: read_core(session, repo), repeat),
+            "asyncpg": await rows_per_second(lambda: read_asyncpg(conn, repo), repeat),
+        }
+        print(f"{total} rows, best of {repeat}")
+        print(f"{'path':>8} {'rows/s':>12} {'vs orm':>7}")
+        for name, rate in results.items():
+            print(f"{name:>8} {rate:>12,.0f} {rate / results['orm']:>6.2f}x")
+
+        await conn.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
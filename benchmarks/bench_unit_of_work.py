@@ -0,0 +1,120 @@
+"""
+Pool churn and round trips of a `POST /superheroes/hero` miss:
+per-call repository sessions vs the import's unit of work, as wired
+by the app (lookup and upsert share it, with a checkpoint in between
+that gives the connection back over the API call).
+
+Runs the create use case against the database with a stubbed SuperHero API,
+counting pool checkouts, statements and transactions per request.
+Created rows are deleted afterwards.
+
+Usage (needs a migrated database from `.env`):
+    python -m benchmarks.bench_unit_of_work [--requests 500]
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.core.database.db_provider import DatabaseProvider
+from src.core.database.unit_of_work import UnitOfWork
+from src.settings import settings
+from src.apps.superheroes.repositories.superheroes import SuperheroesRepositoryImpl
+from src.apps.superheroes.schemas.superheroes import SuperheroCreateSchema
+from src.apps.superheroes.services.superheroes import SuperheroesServiceImpl
+from src.apps.superheroes.use_cases.create import CreateSuperheroUseCaseImpl
+
+NAME_PREFIX = "bench-uow"
+
+
+class StubSuperHeroApiService:
+    async def search_heroes(self, name: str) -> List[SuperheroCreateSchema]:
+        return [
+            SuperheroCreateSchema(
+                name=name,
+                intelligence=50,
+                strength=50,
+                speed=50,
+                durability=50,
+                power=50,
+                combat=50,
+            )
+        ]
+
+    async def get_hero_by_name(self, name: str) -> Optional[SuperheroCreateSchema]:
+        return (await self.search_heroes(name))[0]
+
+
+def count_events(engine: AsyncEngine) -> Counter:
+    counter = Counter()
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "checkout", lambda *args: counter.update(["checkouts"]))
+    event.listen(sync_engine, "before_cursor_execute", lambda *args: counter.update(["statements"]))
+    event.listen(sync_engine, "begin", lambda *args: counter.update(["begins"]))
+    event.listen(sync_engine, "commit", lambda *args: counter.update(["commits"]))
+    event.listen(sync_engine, "rollback", lambda *args: counter.update(["rollbacks"]))
+    return counter
+
+
+def build_use_case(
+    session: AsyncSession,
+    unit_of_work: Optional[UnitOfWork] = None,
+) -> CreateSuperheroUseCaseImpl:
+    return CreateSuperheroUseCaseImpl(
+        superheroes_service=SuperheroesServiceImpl(SuperheroesRepositoryImpl(session=session)),
+        superhero_api_service=StubSuperHeroApiService(),
+        unit_of_work=unit_of_work,
+    )
+
+
+async def import_hero(provider: DatabaseProvider, name: str, unit_of_work: bool) -> None:
+    session = provider.session_factory()
+    if unit_of_work:
+        # Same wiring as `get_superheroes_create_use_case`
+        await build_use_case(session, UnitOfWork(session)).execute(name)
+    else:
+        try:
+            await build_use_case(session).execute(name)
+        finally:
+            await session.close()
+
+
+async def run(provider: DatabaseProvider, requests: int, unit_of_work: bool) -> None:
+    counter = count_events(provider.engine)
+    mode = "unit of work" if unit_of_work else "per-call"
+    started = time.perf_counter()
+    for i in range(requests):
+        await import_hero(provider, f"{NAME_PREFIX}-{mode}-{i}", unit_of_work)
+    elapsed = time.perf_counter() - started
+    event_names = ("checkouts", "statements", "begins", "commits", "rollbacks")
+    per_request = " ".join(f"{counter[name] / requests:>10.2f}" for name in event_names)
+    print(f"{mode:>13} {per_request} {elapsed / requests * 1000:>10.2f}")
+
+
+async def main(requests: int) -> None:
+    print(f"{'per request':>13} {'checkouts':>10} {'statements':>10} {'begins':>10} "
+          f"{'commits':>10} {'rollbacks':>10} {'ms':>10}")
+    for unit_of_work in (False, True):
+        # Own provider per mode, so event counters don't mix
+        provider = DatabaseProvider(url=settings.db.dsn, pool_size=5, max_overflow=0)
+        try:
+            await run(provider, requests, unit_of_work)
+        finally:
+            async with provider.engine.begin() as conn:
+                await conn.execute(
+                    text("DELETE FROM superheroes WHERE name LIKE :prefix"),
+                    {"prefix": f"{NAME_PREFIX}-%"},
+                )
+            await provider.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,45 @@
+import secrets
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from src.settings import settings
+from src.core.metrics import metrics_registry
+
+__all__ = ("router",)
+
+
+def verify_monitoring_token(authorization: Optional[str] = Header(None)) -> None:
+    """
+    Require `Authorization: Bearer <MONITORING__TOKEN>` when the token is set.
+    """
+    token = settings.monitoring.token
+    if token is None:
+        return
+    scheme, _, credentials = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(
+        credentials.encode(),
+        token.encode(),
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid monitoring token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(
+    prefix="/monitoring",
+    tags=["Monitoring"],
+    include_in_schema=False,
+    dependencies=[Depends(verify_monitoring_token)],
+)
+
+
+@router.get("/metrics")
+async def get_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Internal in-process metrics (caches, pools, upstream clients).
+    """
+
+    return metrics_registry.collect()
@@ -1,53 +1,249 @@
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Optional
 from fastapi import Depends
 
-from src.core.database.db_provider import SessionDep
+from src.core.cache.response_cache import SQLiteResponseCache, ResponseCacheMode
+from src.core.cache.result_cache import VersionedLRUCache
+from src.core.cache.ttl_cache import TTLCache
+from src.core.concurrency.single_flight import SingleFlight
+from src.core.database.db_provider import db_provider
+from src.core.database.table_versions import table_versions
+from src.core.database.unit_of_work import ReadUnitOfWorkDep, UnitOfWork
+from src.core.http.client_provider import SuperHeroApiSessionDep
+from src.core.http.hedging import Hedger
+from src.core.http.rate_limit import TokenBucket, FileTokenBucket
+from src.core.http.resilience import CircuitBreaker, RetryBudget
+from src.core.metrics import metrics_registry
+from src.settings import settings
 
 from .repositories.superheroes import (
     SuperheroesRepositoryProtocol,
     SuperheroesRepositoryImpl,
 )
 
-from .services.superheroes import SuperheroesServiceProtocol, SuperheroesServiceImpl
+from .services.superheroes import (
+    SuperheroesServiceProtocol,
+    SuperheroesServiceImpl,
+    CachedSuperheroesServiceImpl,
+)
+from .read_model.service import ColumnarSuperheroesServiceImpl
 from .services.superhero_api import SuperHeroApiServiceProtocol, SuperHeroApiServiceImpl
 from .use_cases.create import CreateSuperheroUseCaseProtocol, CreateSuperheroUseCaseImpl
+from .use_cases.bulk_create import (
+    BulkCreateSuperheroesUseCaseProtocol,
+    BulkCreateSuperheroesUseCaseImpl,
+)
 from .use_cases.list import ListSuperheroesUseCaseProtocol, ListSuperheroesUseCaseImpl
+from .schemas.superheroes import SuperheroReadSchema
+
+if TYPE_CHECKING:
+    from .read_model.synchronizer import ReadModelSynchronizer
 
 
 __all__ = (
+    "BulkCreateSuperheroesUseCase",
     "CreateSuperheroUseCase",
     "ListSuperheroesUseCase",
+    "StreamSuperheroesUseCase",
 )
 
 
+# ======= SHARED STATE =======
+# Process-wide: concurrent imports of the same hero share one execution
+hero_imports_flight: SingleFlight[SuperheroReadSchema] = SingleFlight()
+# Names the SuperHero API reported as unknown
+unknown_hero_names_cache: TTLCache[str, bool] = TTLCache(
+    max_size=settings.sh_api.negative_cache_size,
+    ttl=settings.sh_api.negative_cache_ttl,
+)
+metrics_registry.register(
+    "superheroes.unknown_names_cache",
+    unknown_hero_names_cache.stats,
+)
+metrics_registry.register(
+    "superheroes.filter_statements",
+    SuperheroesRepositoryImpl.filter_statements.stats,
+)
+# Filter and name lookup results, dropped when the table version changes
+superheroes_result_cache: Optional[VersionedLRUCache] = (
+    VersionedLRUCache(
+        max_bytes=settings.db.result_cache_max_bytes,
+        ttl=settings.db.result_cache_ttl,
+    )
+    if settings.db.result_cache_max_bytes > 0
+    else None
+)
+if superheroes_result_cache is not None:
+    metrics_registry.register("superheroes.result_cache", superheroes_result_cache.stats)
+metrics_registry.register("db.table_versions", table_versions.stats)
+# SuperHero API resilience
+sh_api_circuit_breaker = CircuitBreaker(
+    name=SuperHeroApiServiceImpl.service_name,
+    failure_rate_threshold=settings.sh_api.breaker_failure_rate,
+    minimum_calls=settings.sh_api.breaker_minimum_calls,
+    window_size=settings.sh_api.breaker_window_size,
+    open_seconds=settings.sh_api.breaker_open_seconds,
+    half_open_calls=settings.sh_api.breaker_half_open_calls,
+)
+sh_api_retry_budget = RetryBudget(
+    ratio=settings.sh_api.retry_budget_ratio,
+    capacity=settings.sh_api.retry_budget_capacity,
+)
+metrics_registry.register("sh_api.circuit_breaker", sh_api_circuit_breaker.stats)
+metrics_registry.register("sh_api.retry_budget", sh_api_retry_budget.stats)
+
+
+def _build_sh_api_rate_limiter() -> Optional[TokenBucket]:
+    config = settings.sh_api
+    if config.rate_limit_per_second <= 0:
+        return None
+    if config.rate_limit_backend == "file":
+        return FileTokenBucket(
+            name=SuperHeroApiServiceImpl.service_name,
+            path=config.rate_limit_file,
+            rate=config.rate_limit_per_second,
+            capacity=config.rate_limit_burst,
+            max_wait=config.rate_limit_max_wait,
+        )
+    return TokenBucket(
+        name=SuperHeroApiServiceImpl.service_name,
+        rate=config.rate_limit_per_second,
+        capacity=config.rate_limit_burst,
+        max_wait=config.rate_limit_max_wait,
+    )
+
+
+sh_api_rate_limiter = _build_sh_api_rate_limiter()
+if sh_api_rate_limiter is not None:
+    metrics_registry.register("sh_api.rate_limiter", sh_api_rate_limiter.stats)
+
+sh_api_hedger = (
+    Hedger(
+        percentile=settings.sh_api.hedge_percentile,
+        min_delay=settings.sh_api.hedge_min_delay,
+        initial_delay=settings.sh_api.hedge_initial_delay,
+        window_size=settings.sh_api.hedge_window_size,
+        min_samples=settings.sh_api.hedge_min_samples,
+    )
+    if settings.sh_api.hedge_enabled
+    else None
+)
+if sh_api_hedger is not None:
+    metrics_registry.register("sh_api.hedging", sh_api_hedger.stats)
+
+sh_api_response_cache = SQLiteResponseCache(
+    service_name=SuperHeroApiServiceImpl.service_name,
+    path=settings.sh_api.response_cache_path,
+    ttl=settings.sh_api.response_cache_ttl,
+    stale_ttl=settings.sh_api.response_cache_stale_ttl,
+    mode=ResponseCacheMode(settings.sh_api.response_cache_mode),
+)
+metrics_registry.register("sh_api.response_cache", sh_api_response_cache.stats)
+
+
+def _build_read_model_synchronizer() -> Optional["ReadModelSynchronizer"]:
+    config = settings.read_model
+    if not config.enabled:
+        return None
+    try:
+        from .read_model.columnar import ColumnarSuperheroes
+        from .read_model.synchronizer import ReadModelSynchronizer
+    except ImportError as e:
+        raise RuntimeError(
+            "READ_MODEL__ENABLED needs numpy: `poetry install --extras read-model`."
+        ) from e
+    return ReadModelSynchronizer(
+        model=ColumnarSuperheroes(),
+        engine=db_provider.engine,
+        channel=config.notify_channel,
+        check_interval=config.consistency_check_interval,
+    )
+
+
+# In-memory columnar copy of `superheroes`, loaded on application startup
+superheroes_read_model_sync = _build_read_model_synchronizer()
+if superheroes_read_model_sync is not None:
+    metrics_registry.register("superheroes.read_model", superheroes_read_model_sync.stats)
+
+
 # ======= REPOSITORIES =======
-def get_superheroes_repository(
-    session: SessionDep,
+def get_superheroes_read_repository(
+    uow: ReadUnitOfWorkDep,
 ) -> SuperheroesRepositoryProtocol:
-    return SuperheroesRepositoryImpl(session=session)
+    # Listing and its ETag version share one checkout and transaction
+    return SuperheroesRepositoryImpl(session=uow.session)
 
 
-SuperheroesRepository = Annotated[
+SuperheroesReadRepository = Annotated[
     SuperheroesRepositoryProtocol,
-    Depends(get_superheroes_repository),
+    Depends(get_superheroes_read_repository),
 ]
 
 
 # ======= SERVICES =======
-def get_superheroes_service(
-    repository: SuperheroesRepository,
+def _with_result_cache(service: SuperheroesServiceProtocol) -> SuperheroesServiceProtocol:
+    if superheroes_result_cache is None:
+        return service
+    table = SuperheroesRepositoryImpl.model_type.__tablename__
+    return CachedSuperheroesServiceImpl(
+        service=service,
+        cache=superheroes_result_cache,
+        version=lambda: table_versions.get(table),
+    )
+
+
+def get_superheroes_unit_of_work() -> UnitOfWork:
+    # Not a yield dependency: the import use case enters it itself, so the
+    # import commits and closes it even if the request is gone by then
+    return UnitOfWork(db_provider.session_factory())
+
+
+SuperheroesUnitOfWork = Annotated[UnitOfWork, Depends(get_superheroes_unit_of_work)]
+
+
+def get_superheroes_service(uow: SuperheroesUnitOfWork) -> SuperheroesServiceProtocol:
+    repository = SuperheroesRepositoryImpl(session=uow.session)
+    service = _with_result_cache(SuperheroesServiceImpl(repository=repository))
+    if superheroes_read_model_sync is None:
+        return service
+    return ColumnarSuperheroesServiceImpl(
+        service=service,
+        read_model=superheroes_read_model_sync.model,
+    )
+
+
+def get_superheroes_read_service(
+    repository: SuperheroesReadRepository,
 ) -> SuperheroesServiceProtocol:
-    return SuperheroesServiceImpl(repository=repository)
+    service = _with_result_cache(SuperheroesServiceImpl(repository=repository))
+    if superheroes_read_model_sync is None:
+        return service
+    return ColumnarSuperheroesServiceImpl(
+        service=service,
+        read_model=superheroes_read_model_sync.model,
+    )
 
 
-def get_sh_api_service() -> SuperHeroApiServiceProtocol:
-    return SuperHeroApiServiceImpl()
+def get_sh_api_service(
+    session: SuperHeroApiSessionDep,
+) -> SuperHeroApiServiceProtocol:
+    return SuperHeroApiServiceImpl(
+        session=session,
+        circuit_breaker=sh_api_circuit_breaker,
+        retry_budget=sh_api_retry_budget,
+        rate_limiter=sh_api_rate_limiter,
+        hedger=sh_api_hedger,
+        response_cache=sh_api_response_cache,
+    )
 
 
 SuperheroesService = Annotated[
     SuperheroesServiceProtocol,
     Depends(get_superheroes_service),
 ]
+SuperheroesReadService = Annotated[
+    SuperheroesServiceProtocol,
+    Depends(get_superheroes_read_service),
+]
 SuperHeroAPIService = Annotated[
     SuperHeroApiServiceProtocol,
     Depends(get_sh_api_service),
@@ -58,25 +254,65 @@ SuperHeroAPIService = Annotated[
 def get_superheroes_create_use_case(
     superheroes_service: SuperheroesService,
     superhero_api_service: SuperHeroAPIService,
+    uow: SuperheroesUnitOfWork,
 ) -> CreateSuperheroUseCaseProtocol:
     return CreateSuperheroUseCaseImpl(
         superheroes_service=superheroes_service,
         superhero_api_service=superhero_api_service,
+        single_flight=hero_imports_flight,
+        unknown_names_cache=unknown_hero_names_cache,
+        unit_of_work=uow,
     )
 
 
-def get_list_superheroes_use_case(
+def get_bulk_create_superheroes_use_case(
     superheroes_service: SuperheroesService,
+    superhero_api_service: SuperHeroAPIService,
+    uow: SuperheroesUnitOfWork,
+) -> BulkCreateSuperheroesUseCaseProtocol:
+    return BulkCreateSuperheroesUseCaseImpl(
+        superheroes_service=superheroes_service,
+        superhero_api_service=superhero_api_service,
+        max_concurrency=settings.sh_api.bulk_concurrency,
+        unknown_names_cache=unknown_hero_names_cache,
+        unit_of_work=uow,
+    )
+
+
+def get_list_superheroes_use_case(
+    superheroes_service: SuperheroesReadService,
 ) -> ListSuperheroesUseCaseProtocol:
     return ListSuperheroesUseCaseImpl(superheroes_service=superheroes_service)
 
 
+def get_stream_superheroes_use_case() -> ListSuperheroesUseCaseProtocol:
+    # Not a yield dependency, those exit before a streamed body is sent:
+    # the stream holds the unit of work (one connection and snapshot for
+    # the version and rows) until it ends
+    uow = UnitOfWork(db_provider.read_session(), isolation_level="REPEATABLE READ")
+    repository = SuperheroesRepositoryImpl(session=uow.session)
+    return ListSuperheroesUseCaseImpl(
+        superheroes_service=get_superheroes_read_service(repository),
+        unit_of_work=uow,
+    )
+
+
 CreateSuperheroUseCase = Annotated[
     CreateSuperheroUseCaseProtocol,
     Depends(get_superheroes_create_use_case),
 ]
 
+BulkCreateSuperheroesUseCase = Annotated[
+    BulkCreateSuperheroesUseCaseProtocol,
+    Depends(get_bulk_create_superheroes_use_case),
+]
+
 ListSuperheroesUseCase = Annotated[
     ListSuperheroesUseCaseProtocol,
     Depends(get_list_superheroes_use_case),
+]
+
+StreamSuperheroesUseCase = Annotated[
+    ListSuperheroesUseCaseProtocol,
+    Depends(get_stream_superheroes_use_case),
 ]
\ No newline at end of file
@@ -0,0 +1,327 @@
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.pagination import KeysetCursor, encode_cursor, decode_cursor
+from src.core.repositories.db_repository import rows_adapter
+
+from ..repositories.superheroes import POWERSTAT_FIELDS
+from ..schemas.superheroes import (
+    SuperheroReadSchema,
+    SuperheroQueryFilterSchema,
+    SuperheroPageSchema,
+    SuperheroSortKey,
+)
+
+__all__ = (
+    "COLUMNS",
+    "ColumnarSnapshot",
+    "ColumnarSnapshotBuilder",
+    "ColumnarSuperheroes",
+)
+
+# Row layout accepted by `load`, same as the repository read rows
+COLUMNS = tuple(SuperheroReadSchema.model_fields)
+
+_STAT_DTYPE = np.int16
+_STAT_INFO = np.iinfo(_STAT_DTYPE)
+# Sort key of (stat, id) packed in one int64, ids are 32 bit in DB
+_ID_SPAN = 1 << 32
+
+
+class ColumnarSuperheroes:
+    """
+    In-memory copy of `superheroes`: int64 ids, int16 powerstat columns
+    and a name index. Powerstat filters are vectorized boolean masks with
+    the same semantics and cursors as `SuperheroesRepositoryImpl.filter_all`.
+
+    Sorting by name is left to DB: its collation order is not reproducible here.
+    """
+
+    def __init__(self) -> None:
+        # DB version of the loaded snapshot, None until the first load
+        self.version: Optional[int] = None
+        self._ids = np.empty(0, dtype=np.int64)
+        self._stats = {field: np.empty(0, dtype=_STAT_DTYPE) for field in POWERSTAT_FIELDS}
+        self._names: List[str] = []
+        self._positions: Dict[int, int] = {}
+        self._name_positions: Dict[str, int] = {}
+        # Sort key -> packed (key, id) per row; (row positions in key order, sorted keys)
+        self._sort_keys: Dict[str, np.ndarray] = {}
+        self._orders: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self.queries = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self.version is not None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def load(self, rows: Sequence[Sequence[Any]], version: int) -> None:
+        """
+        Replace contents with `rows` laid out as `COLUMNS`.
+        """
+        builder = ColumnarSnapshotBuilder()
+        builder.add(rows)
+        self.swap(builder.build(), version)
+
+    def swap(self, snapshot: "ColumnarSnapshot", version: int) -> None:
+        """
+        Replace contents with a snapshot from `ColumnarSnapshotBuilder`, at once.
+        """
+        self._ids = snapshot.ids
+        self._stats = snapshot.stats
+        self._names = snapshot.names
+        self._positions = snapshot.positions
+        self._name_positions = snapshot.name_positions
+        self._invalidate()
+        self.version = version
+
+    def upsert(
+        self,
+        heroes: Iterable[SuperheroReadSchema],
+        version: Optional[int] = None,
+    ) -> None:
+        """
+        Insert new heroes and overwrite existing ones (matched by id).
+        """
+        new: Dict[int, SuperheroReadSchema] = {}
+        for hero in heroes:
+            position = self._positions.get(hero.id)
+            if position is None:
+                new[hero.id] = hero
+                continue
+            old_name = self._names[position]
+            if old_name != hero.name:
+                self._name_positions.pop(old_name, None)
+                self._name_positions[hero.name] = position
+                self._names[position] = hero.name
+            for field in POWERSTAT_FIELDS:
+                self._stats[field][position] = self._stat_value(getattr(hero, field))
+
+        if new:
+            added = list(new.values())
+            start = len(self._ids)
+            self._ids = np.concatenate(
+                [self._ids, np.array([hero.id for hero in added], dtype=np.int64)]
+            )
+            for field in POWERSTAT_FIELDS:
+                self._stats[field] = np.concatenate(
+                    [self._stats[field], _stat_column([getattr(hero, field) for hero in added])]
+                )
+            for offset, hero in enumerate(added):
+                self._names.append(hero.name)
+                self._positions[hero.id] = start + offset
+                self._name_positions[hero.name] = start + offset
+
+        self._invalidate()
+        if version is not None:
+            self.version = version
+
+    def delete(self, ids: Iterable[int], version: Optional[int] = None) -> None:
+        positions = [self._positions[i] for i in ids if i in self._positions]
+        if positions:
+            keep = np.ones(len(self._ids), dtype=bool)
+            keep[positions] = False
+            self._ids = self._ids[keep]
+            self._stats = {field: column[keep] for field, column in self._stats.items()}
+            self._names = [name for name, kept in zip(self._names, keep.tolist()) if kept]
+            self._reindex()
+        if version is not None:
+            self.version = version
+
+    def get_by_name(self, name: str) -> Optional[SuperheroReadSchema]:
+        position = self._name_positions.get(name)
+        if position is None:
+            return None
+        return self._to_schemas(np.array([position]))[0]
+
+    def supports(self, filters: SuperheroQueryFilterSchema) -> bool:
+        return self.loaded and filters.sort_by != SuperheroSortKey.NAME
+
+    def filter(self, filters: SuperheroQueryFilterSchema) -> Optional[SuperheroPageSchema]:
+        """
+        One page of filtered heroes ordered by (sort_by, id). None if nothing found.
+        """
+        self.queries += 1
+        mask: Optional[np.ndarray] = None
+        for field in POWERSTAT_FIELDS:
+            column = self._stats[field]
+            conditions = []
+            if getattr(filters, field) is not None:
+                conditions.append(column == getattr(filters, field))
+            else:
+                if getattr(filters, f"{field}_ge") is not None:
+                    conditions.append(column >= getattr(filters, f"{field}_ge"))
+                if getattr(filters, f"{field}_le") is not None:
+                    conditions.append(column <= getattr(filters, f"{field}_le"))
+            for condition in conditions:
+                if mask is None:
+                    mask = condition
+                else:
+                    mask &= condition
+
+        cursor_key = None
+        if filters.cursor is not None:
+            # Only id and powerstat sorts get here: integer values
+            cursor = decode_cursor(filters.cursor, filters.sort_by, int)
+            cursor_key = self._cursor_key(cursor)
+        # One extra row tells whether the next page exists
+        size = filters.limit + 1
+
+        if mask is None:
+            # Page is a slice of the presorted order
+            order, sorted_keys = self._order(filters.sort_by)
+            start = 0
+            if cursor_key is not None:
+                start = int(np.searchsorted(sorted_keys, cursor_key, side="right"))
+            hits = order[start : start + size]
+        else:
+            # Sort only the matches, and only the ones that make the page
+            hits = np.flatnonzero(mask)
+            keys = self._keys(filters.sort_by)[hits]
+            if cursor_key is not None:
+                after = keys > cursor_key
+                hits, keys = hits[after], keys[after]
+            if len(hits) > size:
+                top = np.argpartition(keys, size - 1)[:size]
+                hits, keys = hits[top], keys[top]
+            hits = hits[np.argsort(keys, kind="stable")]
+
+        if not len(hits):
+            return None
+
+        items = self._to_schemas(hits[: filters.limit])
+        next_cursor = None
+        if len(hits) > filters.limit:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                KeysetCursor(filters.sort_by, getattr(last, filters.sort_by), last.id)
+            )
+        return SuperheroPageSchema(items=items, next_cursor=next_cursor)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "version": self.version,
+            "rows": len(self._ids),
+            "column_bytes": self._ids.nbytes + sum(c.nbytes for c in self._stats.values()),
+            "sort_orders": sorted(self._orders),
+            "queries": self.queries,
+        }
+
+    def _reindex(self) -> None:
+        self._positions = {hero_id: i for i, hero_id in enumerate(self._ids.tolist())}
+        self._name_positions = {name: i for i, name in enumerate(self._names)}
+        self._invalidate()
+
+    def _keys(self, sort_key: str) -> np.ndarray:
+        """
+        (sort_key, id) of every row packed in one int64, built on first use after a change.
+        """
+        keys = self._sort_keys.get(sort_key)
+        if keys is None:
+            if sort_key == SuperheroSortKey.ID:
+                keys = self._ids
+            else:
+                keys = self._stats[sort_key].astype(np.int64) * _ID_SPAN + self._ids
+            self._sort_keys[sort_key] = keys
+        return keys
+
+    def _order(self, sort_key: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Row positions in (sort_key, id) order and their sorted keys.
+        """
+        cached = self._orders.get(sort_key)
+        if cached is None:
+            keys = self._keys(sort_key)
+            order = np.argsort(keys, kind="stable")
+            cached = self._orders[sort_key] = (order, keys[order])
+        return cached
+
+    def _invalidate(self) -> None:
+        self._sort_keys.clear()
+        self._orders.clear()
+
+    @staticmethod
+    def _cursor_key(cursor: KeysetCursor) -> int:
+        cursor_id = min(max(cursor.id, 0), _ID_SPAN - 1)
+        if cursor.sort_key == SuperheroSortKey.ID:
+            return cursor_id
+        # Values outside the column range sort the same as its bounds
+        value = min(max(cursor.value, _STAT_INFO.min - 1), _STAT_INFO.max + 1)
+        return value * _ID_SPAN + cursor_id
+
+    def _to_schemas(self, positions: np.ndarray) -> List[SuperheroReadSchema]:
+        columns = {
+            "id": self._ids[positions].tolist(),
+            "name": [self._names[i] for i in positions.tolist()],
+            **{field: self._stats[field][positions].tolist() for field in POWERSTAT_FIELDS},
+        }
+        rows = [dict(zip(COLUMNS, row)) for row in zip(*(columns[c] for c in COLUMNS))]
+        return rows_adapter(SuperheroReadSchema).validate_python(rows)
+
+    @staticmethod
+    def _stat_value(value: int) -> int:
+        if not _STAT_INFO.min <= value <= _STAT_INFO.max:
+            raise ValueError(f"Powerstat value {value} does not fit {_STAT_DTYPE.__name__}.")
+        return value
+
+
+def _stat_column(values: Sequence[int]) -> np.ndarray:
+    column = np.array(values, dtype=np.int64)
+    if len(column) and (column.min() < _STAT_INFO.min or column.max() > _STAT_INFO.max):
+        raise ValueError(f"Powerstat values do not fit {_STAT_DTYPE.__name__}.")
+    return column.astype(_STAT_DTYPE)
+
+
+class ColumnarSnapshot(NamedTuple):
+    ids: np.ndarray
+    stats: Dict[str, np.ndarray]
+    names: List[str]
+    positions: Dict[int, int]
+    name_positions: Dict[str, int]
+
+
+class ColumnarSnapshotBuilder:
+    """
+    Builds a `ColumnarSuperheroes` snapshot chunk by chunk: every chunk of
+    rows is turned into arrays as it comes, the whole table is never held
+    as rows. Touches no model state, so it can run in a worker thread
+    while the model keeps serving the previous snapshot.
+    """
+
+    def __init__(self) -> None:
+        self._ids: List[np.ndarray] = []
+        self._stats: Dict[str, List[np.ndarray]] = {field: [] for field in POWERSTAT_FIELDS}
+        self._names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Append `rows` laid out as `COLUMNS`.
+        """
+        if not rows:
+            return
+        data = dict(zip(COLUMNS, zip(*rows)))
+        self._ids.append(np.array(data["id"], dtype=np.int64))
+        for field in POWERSTAT_FIELDS:
+            self._stats[field].append(_stat_column(data[field]))
+        self._names.extend(data["name"])
+
+    def build(self) -> ColumnarSnapshot:
+        ids = np.concatenate(self._ids) if self._ids else np.empty(0, dtype=np.int64)
+        stats = {
+            field: np.concatenate(chunks) if chunks else np.empty(0, dtype=_STAT_DTYPE)
+            for field, chunks in self._stats.items()
+        }
+        return ColumnarSnapshot(
+            ids=ids,
+            stats=stats,
+            names=self._names,
+            positions={hero_id: i for i, hero_id in enumerate(ids.tolist())},
+            name_positions={name: i for i, name in enumerate(self._names)},
+        )
@@ -0,0 +1,107 @@
+import logging
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ..services.superheroes import SuperheroesServiceProtocol
+from ..schemas.superheroes import (
+    SuperheroReadSchema,
+    SuperheroCreateSchema,
+    SuperheroQueryFilterSchema,
+    SuperheroPageSchema,
+)
+
+if TYPE_CHECKING:
+    # numpy is optional, the model is only imported when enabled
+    from .columnar import ColumnarSuperheroes
+
+__all__ = ("ColumnarSuperheroesServiceImpl",)
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnarSuperheroesServiceImpl:
+    """
+    Superheroes service answering powerstat filters and name lookups from
+    the in-memory read model once it is loaded. Everything else, and name
+    misses, go to the wrapped service.
+
+    Writes go to the wrapped service only: the model takes them from the
+    change notifications, together with their version.
+    """
+
+    def __init__(
+        self,
+        service: SuperheroesServiceProtocol,
+        read_model: "ColumnarSuperheroes",
+    ) -> None:
+        self.service = service
+        self.read_model = read_model
+
+    async def create_hero(
+        self,
+        new_hero: SuperheroCreateSchema,
+    ) -> SuperheroReadSchema:
+        return await self.service.create_hero(new_hero)
+
+    async def upsert_heroes(
+        self,
+        new_heroes: Sequence[SuperheroCreateSchema],
+    ) -> List[SuperheroReadSchema]:
+        return await self.service.upsert_heroes(new_heroes)
+
+    async def get_or_create_heroes(
+        self,
+        new_heroes: Sequence[SuperheroCreateSchema],
+    ) -> List[Tuple[SuperheroReadSchema, bool]]:
+        return await self.service.get_or_create_heroes(new_heroes)
+
+    async def find_hero_by_name(
+        self,
+        name: str,
+    ) -> Optional[SuperheroReadSchema]:
+        if self.read_model.loaded:
+            superhero = self.read_model.get_by_name(name)
+            if superhero is not None:
+                return superhero
+        # Not synced yet or really missing, DB knows
+        return await self.service.find_hero_by_name(name)
+
+    async def find_heroes_by_names(
+        self,
+        names: Sequence[str],
+    ) -> List[SuperheroReadSchema]:
+        return await self.service.find_heroes_by_names(names)
+
+    async def filter_heroes(
+        self,
+        filters: SuperheroQueryFilterSchema,
+    ) -> SuperheroPageSchema | None:
+        if not self.read_model.supports(filters):
+            return await self.service.filter_heroes(filters)
+        page = self.read_model.filter(filters)
+        logger.debug(
+            "Filtered (%r) Superheroes in memory: %r",
+            filters.model_dump(exclude_none=True),
+            page,
+        )
+        return page
+
+    def stream_heroes(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> AsyncIterator[SuperheroReadSchema]:
+        return self.service.stream_heroes(filters, chunk_size)
+
+    async def get_version(self) -> int:
+        # Loaded model is a snapshot of exactly this DB version
+        if self.read_model.loaded:
+            return self.read_model.version
+        return await self.service.get_version()
+
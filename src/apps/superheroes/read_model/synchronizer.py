@@ -0,0 +1,194 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Integer, Select, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.expression import any_
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.core.models.superheroes import Superhero
+from src.core.models.table_versions import TableVersion
+
+from ..schemas.superheroes import SuperheroReadSchema
+from .columnar import COLUMNS, ColumnarSnapshotBuilder, ColumnarSuperheroes
+
+__all__ = ("ReadModelSynchronizer",)
+
+logger = logging.getLogger(__name__)
+
+
+class ReadModelSynchronizer:
+    """
+    Keeps a `ColumnarSuperheroes` in step with the `superheroes` table.
+
+    Loads a REPEATABLE READ snapshot at start, then applies the changes the
+    table triggers publish with NOTIFY, one transaction (and version) at a time.
+    A version gap, a change without ids or a version check (every
+    `check_interval` seconds without notifications) that finds the model
+    behind triggers a full reload.
+    """
+
+    def __init__(
+        self,
+        model: ColumnarSuperheroes,
+        engine: AsyncEngine,
+        channel: str = "superheroes_changes",
+        check_interval: float = 30.0,
+        chunk_size: int = 10_000,
+    ) -> None:
+        self.model = model
+        self.engine = engine
+        self.channel = channel
+        self.check_interval = check_interval
+        self.chunk_size = chunk_size
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        # Changed ids per statement of the transaction being received
+        self._pending: List[Optional[List[int]]] = []
+        self._listen_connection: Optional[AsyncConnection] = None
+        self._task: Optional[asyncio.Task] = None
+        self.reloads = 0
+        self.applied = 0
+        self.last_reload_seconds = 0.0
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        # Listen first, so changes committed during the load are not lost
+        self._listen_connection = await self.engine.connect()
+        raw = await self._listen_connection.get_raw_connection()
+        await raw.driver_connection.add_listener(self.channel, self._on_notification)
+        await self.reload()
+        self._task = asyncio.create_task(self._consume())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._listen_connection is not None:
+            raw = await self._listen_connection.get_raw_connection()
+            await raw.driver_connection.remove_listener(self.channel, self._on_notification)
+            await self._listen_connection.close()
+            self._listen_connection = None
+
+    async def reload(self) -> None:
+        """
+        Load the whole table and its version from one snapshot.
+
+        Arrays are built chunk by chunk in a worker thread, so the event loop
+        keeps serving (from the previous snapshot) during the load.
+        """
+        started = time.perf_counter()
+        builder = ColumnarSnapshotBuilder()
+        async with self.engine.connect() as conn:
+            await conn.execution_options(isolation_level="REPEATABLE READ")
+            async with conn.begin():
+                version = await self._fetch_version(conn)
+                result = await conn.stream(
+                    self._select_rows(),
+                    execution_options={"yield_per": self.chunk_size},
+                )
+                async for partition in result.partitions():
+                    await asyncio.to_thread(builder.add, partition)
+        snapshot = await asyncio.to_thread(builder.build)
+        self.model.swap(snapshot, version)
+        self.reloads += 1
+        self.last_reload_seconds = time.perf_counter() - started
+        logger.info(
+            "Superheroes read model loaded: %d rows, version %d (%.2fs)",
+            len(builder),
+            version,
+            self.last_reload_seconds,
+        )
+
+    async def apply(self, change: Dict[str, Any]) -> None:
+        """
+        Apply one trigger notification. A transaction publishes {"ids"} per
+        write statement, then {"version"} once, at its commit.
+        """
+        if "version" not in change:
+            # Applied with the version of its transaction
+            self._pending.append(change["ids"])
+            return
+        pending, self._pending = self._pending, []
+        version = change["version"]
+        if version <= self.model.version:
+            # Already in the loaded snapshot
+            return
+        if version != self.model.version + 1 or None in pending:
+            logger.info(
+                "Superheroes read model at version %d got version %d, reload",
+                self.model.version,
+                version,
+            )
+            await self.reload()
+            return
+
+        # Current rows, the missing ones were deleted. Later changes may
+        # already be there, their own notifications re-apply them
+        ids = {hero_id for statement_ids in pending for hero_id in statement_ids}
+        async with self.engine.connect() as conn:
+            ids_param = bindparam("ids", list(ids), type_=ARRAY(Integer))
+            query = self._select_rows().where(Superhero.id == any_(ids_param))
+            rows = (await conn.execute(query)).all()
+        heroes = [SuperheroReadSchema(**dict(zip(COLUMNS, row))) for row in rows]
+        self.model.delete(ids.difference(hero.id for hero in heroes))
+        self.model.upsert(heroes, version=version)
+        self.applied += 1
+
+    async def check_version(self) -> None:
+        async with self.engine.connect() as conn:
+            version = await self._fetch_version(conn)
+        if version != self.model.version:
+            logger.warning(
+                "Superheroes read model version %d, DB version %d, reload",
+                self.model.version,
+                version,
+            )
+            await self.reload()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.model.stats(),
+            "reloads": self.reloads,
+            "applied_changes": self.applied,
+            "pending_changes": self._queue.qsize(),
+            "last_reload_seconds": self.last_reload_seconds,
+        }
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self._queue.put_nowait(payload)
+
+    async def _consume(self) -> None:
+        while True:
+            try:
+                payload = await asyncio.wait_for(self._queue.get(), timeout=self.check_interval)
+            except asyncio.TimeoutError:
+                payload = None
+            try:
+                if payload is None:
+                    await self.check_version()
+                else:
+                    await self.apply(json.loads(payload))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep serving the last state, the next check retries
+                logger.exception("Failed to sync superheroes read model. Error:", exc_info=e)
+
+    @staticmethod
+    def _select_rows() -> Select:
+        return select(*(getattr(Superhero, column) for column in COLUMNS))
+
+    @staticmethod
+    async def _fetch_version(conn: AsyncConnection) -> int:
+        query = select(TableVersion.version).where(
+            TableVersion.table_name == Superhero.__tablename__
+        )
+        return (await conn.execute(query)).scalar_one()
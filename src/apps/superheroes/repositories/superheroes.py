@@ -1,9 +1,14 @@
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
 
-from sqlalchemy import select
-from sqlalchemy.sql.expression import and_
+from sqlalchemy import bindparam, select, tuple_, Integer, String, Select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.expression import and_, any_
 
+from src.settings import settings
+from src.core.cache.ttl_cache import TTLCache
 from src.core.models.superheroes import Superhero
+from src.core.models.table_versions import TableVersion
+from src.core.pagination import KeysetCursor, encode_cursor, decode_cursor
 from src.core.repositories.db_repository import (
     DatabaseRepositoryProtocol,
     DatabaseRepositoryImpl,
@@ -13,6 +18,8 @@ from ..schemas.superheroes import (
     SuperheroCreateSchema,
     SuperheroUpdateSchema,
     SuperheroQueryFilterSchema,
+    SuperheroPageSchema,
+    SuperheroSortKey,
 )
 from ..exceptions import (
     DBHeroNotFoundException,
@@ -20,6 +27,11 @@ from ..exceptions import (
 )
 
 
+POWERSTAT_FIELDS = ("intelligence", "strength", "speed", "durability", "power", "combat")
+
+# (condition ops per powerstat, sort key, has cursor, paged)
+FilterShape = Tuple[Tuple[Tuple[str, ...], ...], SuperheroSortKey, bool, bool]
+
 _ConcreteBaseRepositoryIml = DatabaseRepositoryImpl[
     Superhero,
     SuperheroReadSchema,
@@ -38,10 +50,23 @@ class SuperheroesRepositoryProtocol(
 ):
     async def get_by_name(self, name: str) -> SuperheroReadSchema: ...
 
+    async def get_many_by_names(
+        self,
+        names: Sequence[str],
+    ) -> List[SuperheroReadSchema]: ...
+
     async def filter_all(
         self,
         filters: SuperheroQueryFilterSchema,
-    ) -> List[SuperheroReadSchema]: ...
+    ) -> SuperheroPageSchema: ...
+
+    def stream_all(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[SuperheroReadSchema]: ...
+
+    async def get_version(self) -> int: ...
 
 
 class SuperheroesRepositoryImpl(_ConcreteBaseRepositoryIml):
@@ -49,54 +74,183 @@ class SuperheroesRepositoryImpl(_ConcreteBaseRepositoryIml):
     read_schema_type = SuperheroReadSchema
 
     async def get_by_name(self, name: str) -> SuperheroReadSchema:
-        async with self._session as s:
-            query = select(self.model_type).where(self.model_type.name == name)
-            model = (await s.execute(query)).scalar_one_or_none()
-            if model is None:
+        async with self._session_scope() as s:
+            query = self._select_rows().where(self.model_type.name == name)
+            row = (await s.execute(query)).one_or_none()
+            if row is None:
                 raise DBHeroNotFoundException(self.model_type, name)
-            return self.read_schema_type.model_validate(model, from_attributes=True)
+            return self._rows_to_schemas([row])[0]
 
-    async def filter_all(
+    async def get_many_by_names(
         self,
-        filters: SuperheroQueryFilterSchema,
+        names: Sequence[str],
     ) -> List[SuperheroReadSchema]:
-        async with self._session as s:
-            query = select(self.model_type)
-            conditions = []
-            numeric_fields = [
-                "intelligence",
-                "strength",
-                "speed",
-                "durability",
-                "power",
-                "combat",
-            ]
-
-            for field in numeric_fields:
-                eq_value = getattr(filters, field)
-                ge_value = getattr(filters, f"{field}_ge")
-                le_value = getattr(filters, f"{field}_le")
-
-                if eq_value is not None:
-                    conditions.append(getattr(self.model_type, field) == eq_value)
+        """
+        Get all existing heroes from names with one `name = ANY(:names)` query.
+        """
+        if not names:
+            return []
+        async with self._session_scope() as s:
+            names_param = bindparam("names", list(names), type_=ARRAY(String))
+            query = self._select_rows().where(
+                self.model_type.name == any_(names_param)
+            )
+            rows = (await s.execute(query)).all()
+            return self._rows_to_schemas(rows)
+
+    # Statements per filter shape, shared by all repository instances.
+    # Reusing a statement skips building it and its SQLAlchemy cache key.
+    filter_statements: TTLCache[FilterShape, Select] = TTLCache(
+        max_size=settings.db.filter_statement_cache_size,
+        ttl=float("inf"),
+    )
+
+    @staticmethod
+    def _filter_shape(filters: SuperheroQueryFilterSchema, paged: bool) -> FilterShape:
+        """
+        Which condition each powerstat has (eq, ge, le, ge+le or none),
+        sort key, cursor and limit presence. Values are not part of the shape.
+        """
+        ops = []
+        for field in POWERSTAT_FIELDS:
+            if getattr(filters, field) is not None:
+                ops.append(("eq",))
+            else:
+                ops.append(
+                    tuple(
+                        op
+                        for op in ("ge", "le")
+                        if getattr(filters, f"{field}_{op}") is not None
+                    )
+                )
+        return tuple(ops), filters.sort_by, filters.cursor is not None, paged
+
+    def _build_filter_statement(self, shape: FilterShape) -> Select:
+        """
+        Query of the filter shape, ordered by (sort_by, id), with bound parameters
+        named `<field>_<op>`, `cursor_value`, `cursor_id` and `limit`.
+        """
+        field_ops, sort_key, has_cursor, paged = shape
+        query = self._select_rows()
+        conditions = []
+
+        for field, ops in zip(POWERSTAT_FIELDS, field_ops):
+            column = getattr(self.model_type, field)
+            for op in ops:
+                param = bindparam(f"{field}_{op}", type_=column.type)
+                if op == "eq":
+                    conditions.append(column == param)
+                elif op == "ge":
+                    conditions.append(column >= param)
                 else:
-                    if ge_value is not None:
-                        conditions.append(getattr(self.model_type, field) >= ge_value)
-                    if le_value is not None:
-                        conditions.append(getattr(self.model_type, field) <= le_value)
+                    conditions.append(column <= param)
+
+        sort_column = getattr(self.model_type, sort_key)
+        if has_cursor:
+            cursor_id = bindparam("cursor_id", type_=self.model_type.id.type)
+            if sort_key == SuperheroSortKey.ID:
+                conditions.append(self.model_type.id > cursor_id)
+            else:
+                conditions.append(
+                    tuple_(sort_column, self.model_type.id)
+                    > tuple_(bindparam("cursor_value", type_=sort_column.type), cursor_id)
+                )
+
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        if sort_key == SuperheroSortKey.ID:
+            query = query.order_by(self.model_type.id)
+        else:
+            query = query.order_by(sort_column, self.model_type.id)
+        if paged:
+            query = query.limit(bindparam("limit", type_=Integer))
+        return query
+
+    def _filter_statement(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        paged: bool = True,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        """
+        Cached statement for the filters shape and its parameter values.
+        Paged statements fetch one row over `filters.limit`.
+        """
+        shape = self._filter_shape(filters, paged)
+        statement = self.filter_statements.get(shape)
+        if statement is None:
+            statement = self._build_filter_statement(shape)
+            self.filter_statements.set(shape, statement)
 
-            if conditions:
-                query = query.where(and_(*conditions))
+        field_ops, sort_key, has_cursor, _ = shape
+        params: Dict[str, Any] = {}
+        for field, ops in zip(POWERSTAT_FIELDS, field_ops):
+            for op in ops:
+                attr = field if op == "eq" else f"{field}_{op}"
+                params[f"{field}_{op}"] = getattr(filters, attr)
+        if has_cursor:
+            sort_column = getattr(self.model_type, sort_key)
+            cursor = decode_cursor(filters.cursor, sort_key, sort_column.type.python_type)
+            params["cursor_id"] = cursor.id
+            if sort_key != SuperheroSortKey.ID:
+                params["cursor_value"] = cursor.value
+        if paged:
+            # One extra row tells whether the next page exists
+            params["limit"] = filters.limit + 1
+        return statement, params
 
-            models = (await s.execute(query)).scalars().all()
+    async def filter_all(
+        self,
+        filters: SuperheroQueryFilterSchema,
+    ) -> SuperheroPageSchema:
+        """
+        One page of filtered heroes with keyset pagination on (sort_by, id).
+        """
+        async with self._session_scope() as s:
+            statement, params = self._filter_statement(filters)
+            rows = (await s.execute(statement, params)).all()
 
-            if not models:
+            if not rows:
                 raise DBFilteredHeroesNotFoundException(
                     self.model_type,
                     filters.model_dump(exclude_none=True),
                 )
 
-            return [
-                self.read_schema_type.model_validate(model, from_attributes=True)
-                for model in models
-            ]
\ No newline at end of file
+            items = self._rows_to_schemas(rows[: filters.limit])
+            next_cursor = None
+            if len(rows) > filters.limit:
+                last = items[-1]
+                next_cursor = encode_cursor(
+                    KeysetCursor(filters.sort_by, getattr(last, filters.sort_by), last.id)
+                )
+            return SuperheroPageSchema(items=items, next_cursor=next_cursor)
+
+    async def stream_all(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[SuperheroReadSchema]:
+        """
+        Every filtered hero (page limit is ignored), read through
+        a server-side cursor `chunk_size` rows at a time.
+        """
+        async with self._session_scope() as s:
+            statement, params = self._filter_statement(filters, paged=False)
+            result = await s.stream(
+                statement,
+                params,
+                execution_options={"yield_per": chunk_size},
+            )
+            async for rows in result.partitions():
+                for superhero in self._rows_to_schemas(rows):
+                    yield superhero
+
+    async def get_version(self) -> int:
+        """
+        Table version, bumped by its triggers with every committed write transaction.
+        """
+        async with self._session_scope() as s:
+            query = select(TableVersion.version).where(
+                TableVersion.table_name == self.model_type.__tablename__
+            )
+            return (await s.execute(query)).scalar_one()
@@ -1,11 +1,32 @@
 import logging
-from typing import List
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from fastapi import HTTPException, status
 
-from .schemas.superheroes import SuperheroReadSchema, SuperheroQueryFilterSchema
-from .depends import CreateSuperheroUseCase, ListSuperheroesUseCase
+from src.settings import settings
+from src.core.responses import (
+    NDJSONResponse,
+    PydanticJSONResponse,
+    iter_ndjson,
+    weak_etag,
+    etag_matches,
+)
+
+from .schemas.superheroes import (
+    SuperheroReadSchema,
+    SuperheroQueryFilterSchema,
+    SuperheroBulkCreateSchema,
+    SuperheroBulkItemSchema,
+    SuperheroPageSchema,
+)
+from .services.superheroes import filters_cache_key
+from .depends import (
+    CreateSuperheroUseCase,
+    BulkCreateSuperheroesUseCase,
+    ListSuperheroesUseCase,
+    StreamSuperheroesUseCase,
+)
 
 __all__ = ("router",)
 
@@ -17,16 +38,31 @@ router = APIRouter(
 )
 
 
-@router.post("/hero")
+# Routes return validated schemas as PydanticJSONResponse: serialized once,
+# `response_model` only documents them
+@router.post("/hero", response_model=SuperheroReadSchema)
 async def add_hero(
     superhero_name: str,
     uc: CreateSuperheroUseCase,
-) -> SuperheroReadSchema:
+) -> Response:
     """
     Add hero by name
     """
 
-    return await uc.execute(superhero_name=superhero_name)
+    return PydanticJSONResponse(await uc.execute(superhero_name=superhero_name))
+
+
+@router.post("/hero/bulk", response_model=List[SuperheroBulkItemSchema])
+async def add_heroes_bulk(
+    payload: SuperheroBulkCreateSchema,
+    uc: BulkCreateSuperheroesUseCase,
+) -> Response:
+    """
+    Add many heroes by names.
+    Returns import status for every requested name.
+    """
+
+    return PydanticJSONResponse(await uc.execute(superhero_names=payload.names))
 
 
 def validate_filters_ranges(filters: SuperheroQueryFilterSchema) -> None:
@@ -59,17 +95,64 @@ def validate_filters_ranges(filters: SuperheroQueryFilterSchema) -> None:
                 )
 
 
-@router.get("/hero")
+def cache_headers(
+    version: int,
+    filters: SuperheroQueryFilterSchema,
+    kind: str,
+) -> Dict[str, str]:
+    """
+    ETag of the listing from data version and canonical filters, known before
+    running the query. Version is read first: data changed during the query
+    only makes the tag older, never wrongly fresh.
+    """
+    etag = weak_etag(kind, version, filters_cache_key(filters))
+    return {"ETag": etag, "Cache-Control": settings.api.hero_cache_control}
+
+
+@router.get("/hero", response_model=SuperheroPageSchema)
 async def find_hero(
     uc: ListSuperheroesUseCase,
     filters: SuperheroQueryFilterSchema = Depends(),
-) -> List[SuperheroReadSchema]:
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """
     Get heroes by filters (name and powerstats).
     If exact value given, and it is in range ge < exact < le, heroes will be filtered only by exact value.
     In other cases, heroes will be filtered by range ge/le.
+    Results are paginated: pass `nextCursor` of a page as `cursor` to get the next one.
+    Send the `ETag` back as `If-None-Match` to get 304 while nothing changed.
     """
 
     logger.debug("Received filters: %r", filters)
     validate_filters_ranges(filters)
-    return await uc.execute(filters=filters)
+    headers = cache_headers(await uc.version(), filters, kind="page")
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    page = await uc.execute(filters=filters)
+    return PydanticJSONResponse(page, headers=headers)
+
+
+@router.get("/hero/stream", response_class=NDJSONResponse)
+async def stream_heroes(
+    uc: StreamSuperheroesUseCase,
+    filters: SuperheroQueryFilterSchema = Depends(),
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
+    """
+    Get all heroes by filters as newline-delimited JSON, one hero per line.
+    Filters and sorting work as in `GET /hero`, `limit` is ignored.
+    Nothing found gives an empty body. Supports `If-None-Match` as `GET /hero`.
+    """
+
+    logger.debug("Received stream filters: %r", filters)
+    validate_filters_ranges(filters)
+    chunk_size = settings.api.stream_chunk_size
+    # Version and rows come from one snapshot, read while the body is sent
+    version, heroes = await uc.open_stream(filters=filters, chunk_size=chunk_size)
+    headers = cache_headers(version, filters, kind="stream")
+    if etag_matches(if_none_match, headers["ETag"]):
+        await heroes.aclose()
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return NDJSONResponse(iter_ndjson(heroes, chunk_size=chunk_size), headers=headers)
@@ -1,7 +1,9 @@
-from typing import Optional
+from enum import StrEnum
+from typing import Optional, List
 from pydantic import BaseModel, Field
 
-from src.core.schemas.http_schemas import ResponseSchema
+from src.settings import settings
+from src.core.schemas.http_schemas import RequestSchema, ResponseSchema
 from src.core.schemas.db_schemas import CreateBaseModel, UpdateBaseModel
 
 
@@ -30,9 +32,35 @@ class SuperheroUpdateSchema(UpdateBaseModel):
     pass
 
 
+class SuperheroSortKey(StrEnum):
+    ID = "id"
+    NAME = "name"
+    INTELLIGENCE = "intelligence"
+    STRENGTH = "strength"
+    SPEED = "speed"
+    DURABILITY = "durability"
+    POWER = "power"
+    COMBAT = "combat"
+
+
 class SuperheroQueryFilterSchema(BaseModel):
     name: Optional[str] = Field(None, description="Exact match for name")
 
+    sort_by: SuperheroSortKey = Field(
+        SuperheroSortKey.ID,
+        description="Sort key, ties are ordered by id",
+    )
+    limit: int = Field(
+        settings.api.default_page_size,
+        ge=1,
+        le=settings.api.max_page_size,
+        description="Page size",
+    )
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor of the next page (`nextCursor` of previous page)",
+    )
+
     intelligence: Optional[int] = Field(
         None, ge=0, description="Exact match for intelligence"
     )
@@ -59,4 +87,31 @@ class SuperheroQueryFilterSchema(BaseModel):
 
     combat: Optional[int] = Field(None, ge=0, description="Exact match for combat")
     combat_ge: Optional[int] = Field(None, ge=0)
-    combat_le: Optional[int] = Field(None, ge=0)
\ No newline at end of file
+    combat_le: Optional[int] = Field(None, ge=0)
+
+
+class SuperheroPageSchema(ResponseSchema):
+    items: List[SuperheroReadSchema]
+    next_cursor: Optional[str] = None
+
+
+class SuperheroBulkCreateSchema(RequestSchema):
+    names: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.sh_api.bulk_max_names,
+        description="Hero names to import",
+    )
+
+
+class SuperheroImportStatus(StrEnum):
+    EXISTS = "exists"
+    CREATED = "created"
+    NOT_FOUND = "not_found"
+    FAILED = "failed"
+
+
+class SuperheroBulkItemSchema(ResponseSchema):
+    name: str
+    status: SuperheroImportStatus
+    hero: Optional[SuperheroReadSchema] = None
@@ -1,14 +1,23 @@
+import asyncio
 import logging
-from typing import Protocol, Optional, Dict, Any
+from typing import Protocol, Optional, Dict, Any, List, Sequence
 
-from aiohttp.client import ClientSession
+from aiohttp import ClientError, ClientSession
 
 from src.settings import settings
+from src.core.cache.response_cache import SQLiteResponseCache
+from src.core.exceptions.http_exceptions import UpstreamUnavailableException
+from src.core.http.hedging import Hedger
+from src.core.http.rate_limit import RateLimiterProtocol
+from src.core.http.resilience import CircuitBreaker, RetryBudget, jittered_backoff
 
 from ..schemas.superheroes import SuperheroCreateSchema
 
 logger = logging.getLogger(__name__)
 
+# Error payloads of lookups without results, any other error is an upstream failure
+NOT_FOUND_ERRORS = frozenset({"character with given name not found", "invalid id"})
+
 
 def parse_api_raw_data(raw_data: Dict[str, Any]) -> SuperheroCreateSchema:
     def _int(value: Any) -> int:
@@ -31,7 +40,30 @@ def parse_api_raw_data(raw_data: Dict[str, Any]) -> SuperheroCreateSchema:
     )
 
 
+def pick_requested_hero(
+    heroes: Sequence[SuperheroCreateSchema],
+    name: str,
+) -> SuperheroCreateSchema:
+    """
+    Pick hero matching requested name (case-insensitive) from search results.
+    Falls back to the first result's name. Of results with the same name
+    the last one wins, as when they are saved (`upsert_many`).
+    """
+    requested = name.strip().lower()
+    matches = [hero for hero in heroes if hero.name.lower() == requested]
+    if matches:
+        return matches[-1]
+    return [hero for hero in heroes if hero.name == heroes[0].name][-1]
+
+
 class SuperHeroApiServiceProtocol(Protocol):
+    async def search_heroes(self, name: str) -> List[SuperheroCreateSchema]:
+        """
+        Send request to SuperHero API to search heroes by name.
+        Returns every matching hero, empty list if nothing was found.
+        """
+        ...
+
     async def get_hero_by_name(self, name: str) -> Optional[SuperheroCreateSchema]:
         """
         Send request to SuperHero API to get hero by name.
@@ -39,28 +71,169 @@ class SuperHeroApiServiceProtocol(Protocol):
         """
         ...
 
+    async def get_hero_by_id(self, hero_id: int) -> Optional[SuperheroCreateSchema]:
+        """
+        Send request to SuperHero API to get hero by API id.
+        Returns None if hero was not found.
+        """
+        ...
+
 
 class SuperHeroApiServiceImpl:
-    def __init__(self) -> None:
+    service_name = "SuperHero API"
+    retryable_statuses = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        session: ClientSession,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        rate_limiter: Optional[RateLimiterProtocol] = None,
+        hedger: Optional[Hedger] = None,
+        response_cache: Optional[SQLiteResponseCache] = None,
+    ) -> None:
+        self._session = session
+        self._response_cache = response_cache
+        self._rate_limiter = rate_limiter
+        self._hedger = hedger
+        self._circuit_breaker = circuit_breaker
+        self._retry_budget = retry_budget
+        self._max_retries = settings.sh_api.max_retries
+        self._backoff_base = settings.sh_api.retry_backoff_base
+        self._backoff_max = settings.sh_api.retry_backoff_max
+        self._base_url = f"{settings.sh_api.url}/"
         self._search_url = f"{settings.sh_api.url}/search/"
 
-    async def get_hero_by_name(self, name: str) -> Optional[SuperheroCreateSchema]:
+    async def _request_json(self, url: str) -> Dict[str, Any]:
+        async with self._session.get(url=url) as response:
+            if response.status in self.retryable_statuses:
+                response.raise_for_status()
+            return await response.json()
+
+    async def _hedge_request_json(self, url: str) -> Dict[str, Any]:
+        # Hedge is one more upstream call, it needs its own token
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        return await self._request_json(url)
+
+    async def _attempt(self, url: str) -> Dict[str, Any]:
+        if self._hedger is None:
+            return await self._request_json(url)
+        return await self._hedger.run(
+            primary=lambda: self._request_json(url),
+            hedge=lambda: self._hedge_request_json(url),
+        )
+
+    async def _get_json(self, url: str) -> Dict[str, Any]:
         """
-        Send request to SuperHero API to get hero by name.
-        Returns None if hero was not found.
+        GET JSON with jittered retries limited by the retry budget.
+        Every attempt takes a rate limiter token first.
+        Raises UpstreamUnavailableException when all attempts failed
+        or the circuit breaker rejects the call,
+        RateLimitExceededException when the call was shed by the rate limiter.
+        """
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.before_call()
+            try:
+                result = await self._attempt(url)
+            except (ClientError, asyncio.TimeoutError) as e:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_failure()
+                if attempt >= self._max_retries or (
+                    self._retry_budget is not None
+                    and not self._retry_budget.try_withdraw()
+                ):
+                    raise UpstreamUnavailableException(self.service_name, repr(e)) from e
+                delay = jittered_backoff(attempt, self._backoff_base, self._backoff_max)
+                logger.warning(
+                    "SuperHero API request failed (%r), retry #%d in %.3fs.",
+                    e,
+                    attempt + 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+            except BaseException:
+                # No verdict on the upstream, but the trial slot must not leak
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.release_call()
+                raise
+            else:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_success()
+                return result
+
+    def _found(self, result: Dict[str, Any]) -> bool:
+        """
+        True for a "success" payload, False for a not found one.
+        Raises UpstreamUnavailableException for other error payloads.
+        """
+        if result.get("response") == "success":
+            return True
+        error = result.get("error")
+        if error in NOT_FOUND_ERRORS:
+            return False
+        raise UpstreamUnavailableException(self.service_name, f"error response {error!r}")
+
+    async def _get_found_json(self, url: str) -> Dict[str, Any]:
+        # Raises for error payloads, so only found / not found ones get cached
+        result = await self._get_json(url)
+        self._found(result)
+        return result
+
+    async def _get_cached_json(self, key: str, url: str) -> Dict[str, Any]:
+        if self._response_cache is None:
+            return await self._get_json(url)
+        return await self._response_cache.get_or_fetch(key, lambda: self._get_found_json(url))
+
+    async def search_heroes(self, name: str) -> List[SuperheroCreateSchema]:
+        """
+        Send request to SuperHero API to search heroes by name.
+        Returns every matching hero, empty list if nothing was found.
+        Raises UpstreamUnavailableException for other error responses.
         """
 
         req_url = self._search_url + name
-        async with ClientSession() as session:
-            async with session.get(url=req_url) as response:
-                result = await response.json()
+        result = await self._get_cached_json(f"search/{name.strip().lower()}", req_url)
 
-        if result["response"] == "error":
+        if not self._found(result):
             logger.warning("Unable to find superhero with name %r from API.", name)
+            return []
+
+        logger.debug("SuperHero API heroes were found: %r", result["results"])
+        return [parse_api_raw_data(raw_data) for raw_data in result["results"]]
+
+    async def get_hero_by_name(self, name: str) -> Optional[SuperheroCreateSchema]:
+        """
+        Send request to SuperHero API to get hero by name.
+        Returns None if hero was not found.
+        """
+
+        heroes = await self.search_heroes(name)
+        if not heroes:
             return None
+        return pick_requested_hero(heroes, name)
+
+    async def get_hero_by_id(self, hero_id: int) -> Optional[SuperheroCreateSchema]:
+        """
+        Send request to SuperHero API to get hero by API id.
+        Returns None if hero was not found.
+        """
+
+        result = await self._get_cached_json(
+            f"id/{hero_id}", self._base_url + str(hero_id)
+        )
+
+        if self._found(result):
+            logger.debug("SuperHero API hero %d was found: %r", hero_id, result)
+            return parse_api_raw_data(result)
 
-        if result["response"] == "success":
-            raw_data = result["results"][0]
-            logger.debug("SuperHero API was found: %r", raw_data)
-            superhero = parse_api_raw_data(raw_data)
-            return superhero
+        logger.warning("Unable to find superhero with id %d from API.", hero_id)
+        return None
@@ -1,6 +1,17 @@
 import logging
-from typing import Protocol, Optional, List
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Protocol,
+    Optional,
+    List,
+    Sequence,
+    Tuple,
+)
 
+from src.core.cache.result_cache import VersionedLRUCache
 from src.core.exceptions.db_exceptions import ModelAlreadyExistsException
 
 from ..repositories.superheroes import SuperheroesRepositoryProtocol
@@ -8,6 +19,7 @@ from ..schemas.superheroes import (
     SuperheroReadSchema,
     SuperheroCreateSchema,
     SuperheroQueryFilterSchema,
+    SuperheroPageSchema,
 )
 from ..exceptions import DBHeroNotFoundException, DBFilteredHeroesNotFoundException
 
@@ -24,6 +36,25 @@ class SuperheroesServiceProtocol(Protocol):
         """
         ...
 
+    async def upsert_heroes(
+        self,
+        new_heroes: Sequence[SuperheroCreateSchema],
+    ) -> List[SuperheroReadSchema]:
+        """
+        Create or update heroes (matched by name) in DB with one statement.
+        """
+        ...
+
+    async def get_or_create_heroes(
+        self,
+        new_heroes: Sequence[SuperheroCreateSchema],
+    ) -> List[Tuple[SuperheroReadSchema, bool]]:
+        """
+        Create missing heroes and get existing ones (matched by name).
+        Returns (hero, created) pairs.
+        """
+        ...
+
     async def find_hero_by_name(
         self,
         name: str,
@@ -33,12 +64,37 @@ class SuperheroesServiceProtocol(Protocol):
         """
         ...
 
+    async def find_heroes_by_names(
+        self,
+        names: Sequence[str],
+    ) -> List[SuperheroReadSchema]:
+        """
+        Find existing heroes in DB by names.
+        """
+        ...
+
     async def filter_heroes(
         self,
         filters: SuperheroQueryFilterSchema,
-    ) -> List[SuperheroReadSchema] | None:
+    ) -> SuperheroPageSchema | None:
         """
-        Filter heroes with passed filters.
+        Filter heroes with passed filters, one page at a time.
+        """
+        ...
+
+    def stream_heroes(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> AsyncIterator[SuperheroReadSchema]:
+        """
+        Stream every hero matching passed filters.
+        """
+        ...
+
+    async def get_version(self) -> int:
+        """
+        Version of heroes data, changes with every committed write.
         """
         ...
 
@@ -62,6 +118,38 @@ class SuperheroesServiceImpl:
             logger.exception("Failed to create new superhero. Error:", exc_info=e)
             raise
 
+    async def upsert_heroes(
+        self,
+        new_heroes: Sequence[SuperheroCreateSchema],
+    ) -> List[SuperheroReadSchema]:
+        """
+        Create or update heroes (matched by name) in DB with one statement.
+        """
+        superheroes = await self.repository.upsert_many(
+            new_heroes,
+            conflict_fields=("name",),
+        )
+        logger.debug("Superheroes have been saved: %r", superheroes)
+        return superheroes
+
+    async def get_or_create_heroes(
+        self,
+        new_heroes: Sequence[SuperheroCreateSchema],
+    ) -> List[Tuple[SuperheroReadSchema, bool]]:
+        """
+        Create missing heroes and get existing ones (matched by name).
+        Returns (hero, created) pairs.
+        """
+        superheroes = await self.repository.get_or_create_many(
+            new_heroes,
+            conflict_fields=("name",),
+        )
+        logger.debug(
+            "Superheroes have been created: %r",
+            [hero for hero, created in superheroes if created],
+        )
+        return superheroes
+
     async def find_hero_by_name(
         self,
         name: str,
@@ -80,24 +168,163 @@ class SuperheroesServiceImpl:
             )
             return None
 
+    async def find_heroes_by_names(
+        self,
+        names: Sequence[str],
+    ) -> List[SuperheroReadSchema]:
+        """
+        Find existing heroes in DB by names.
+        """
+        superheroes = await self.repository.get_many_by_names(names)
+        logger.debug("Superheroes have been found: %r", superheroes)
+        return superheroes
+
     async def filter_heroes(
         self,
         filters: SuperheroQueryFilterSchema,
-    ) -> List[SuperheroReadSchema] | None:
+    ) -> SuperheroPageSchema | None:
         """
-        Filter heroes with passed filters.
+        Filter heroes with passed filters, one page at a time.
         """
         try:
-            superheroes = await self.repository.filter_all(filters)
+            page = await self.repository.filter_all(filters)
             logger.debug(
                 "Filtered (%r) Superheroes: %r",
                 filters.model_dump(exclude_none=True),
-                superheroes,
+                page,
             )
-            return superheroes
+            return page
         except DBFilteredHeroesNotFoundException:
             logger.warning(
                 "Unable to find superheroes with filters %r in Database.",
                 filters.model_dump(exclude_none=True),
             )
             return None
+
+    async def stream_heroes(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> AsyncIterator[SuperheroReadSchema]:
+        """
+        Stream every hero matching passed filters.
+        """
+        count = 0
+        async for superhero in self.repository.stream_all(filters, chunk_size=chunk_size):
+            count += 1
+            yield superhero
+        logger.debug(
+            "Streamed %d Superheroes filtered by %r",
+            count,
+            filters.model_dump(exclude_none=True),
+        )
+
+    async def get_version(self) -> int:
+        """
+        Version of heroes data, changes with every committed write.
+        """
+        return await self.repository.get_version()
+
+
+# Cache miss, told apart from a cached "not found" (None)
+_MISS = object()
+
+
+def filters_cache_key(filters: SuperheroQueryFilterSchema) -> Hashable:
+    """
+    Canonical form of filters: unset and overridden (ge/le next to an exact
+    match) conditions are dropped, so equivalent queries share one entry.
+    """
+    values = filters.model_dump(mode="json", exclude_none=True)
+    for field in list(values):
+        if field.endswith(("_ge", "_le")) and field[:-3] in values:
+            del values[field]
+    return "filter", tuple(sorted(values.items()))
+
+
+class CachedSuperheroesServiceImpl:
+    """
+    Superheroes service caching `filter_heroes` and `find_hero_by_name`
+    results, not found included, until the table `version` changes.
+    Repeat queries skip the DB and the rows validation. Other calls go
+    to the wrapped service.
+
+    Once `get_version` was called, entries are also tied to the DB data
+    version it returned, so writes of other processes drop them as well.
+    """
+
+    def __init__(
+        self,
+        service: SuperheroesServiceProtocol,
+        cache: VersionedLRUCache[Hashable, Any],
+        version: Callable[[], int],
+    ) -> None:
+        self.service = service
+        self.cache = cache
+        self.version = version
+        self._data_version: Optional[int] = None
+
+    async def create_hero(
+        self,
+        new_hero: SuperheroCreateSchema,
+    ) -> SuperheroReadSchema:
+        return await self.service.create_hero(new_hero)
+
+    async def upsert_heroes(
+        self,
+        new_heroes: Sequence[SuperheroCreateSchema],
+    ) -> List[SuperheroReadSchema]:
+        return await self.service.upsert_heroes(new_heroes)
+
+    async def get_or_create_heroes(
+        self,
+        new_heroes: Sequence[SuperheroCreateSchema],
+    ) -> List[Tuple[SuperheroReadSchema, bool]]:
+        return await self.service.get_or_create_heroes(new_heroes)
+
+    async def find_hero_by_name(
+        self,
+        name: str,
+    ) -> Optional[SuperheroReadSchema]:
+        return await self._cached(
+            ("name", name),
+            lambda: self.service.find_hero_by_name(name),
+        )
+
+    async def find_heroes_by_names(
+        self,
+        names: Sequence[str],
+    ) -> List[SuperheroReadSchema]:
+        return await self.service.find_heroes_by_names(names)
+
+    async def filter_heroes(
+        self,
+        filters: SuperheroQueryFilterSchema,
+    ) -> SuperheroPageSchema | None:
+        return await self._cached(
+            filters_cache_key(filters),
+            lambda: self.service.filter_heroes(filters),
+        )
+
+    def stream_heroes(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> AsyncIterator[SuperheroReadSchema]:
+        return self.service.stream_heroes(filters, chunk_size)
+
+    async def get_version(self) -> int:
+        self._data_version = await self.service.get_version()
+        return self._data_version
+
+    async def _cached(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        # Version is read before the query: a write during it makes the entry stale
+        version = (self.version(), self._data_version)
+        cached = self.cache.get(key, version, default=_MISS)
+        if cached is not _MISS:
+            return cached
+
+        result = await load()
+        self.cache.set(key, version, result)
+        return result
+
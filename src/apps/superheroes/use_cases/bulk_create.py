@@ -0,0 +1,147 @@
+import asyncio
+import logging
+from contextlib import nullcontext
+from typing import Protocol, Optional, List, Dict, Sequence
+
+from src.core.cache.ttl_cache import TTLCache
+from src.core.database.unit_of_work import UnitOfWork
+
+from ..services.superheroes import SuperheroesServiceProtocol
+from ..services.superhero_api import SuperHeroApiServiceProtocol
+from ..schemas.superheroes import (
+    SuperheroCreateSchema,
+    SuperheroBulkItemSchema,
+    SuperheroImportStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BulkCreateSuperheroesUseCaseProtocol(Protocol):
+    async def execute(
+        self,
+        superhero_names: Sequence[str],
+    ) -> List[SuperheroBulkItemSchema]:
+        """
+        Import many heroes at once.
+        Existing heroes are read with one query, missing ones are fetched
+        from API with bounded concurrency and saved with one insert.
+        """
+        ...
+
+
+class BulkCreateSuperheroesUseCaseImpl:
+    def __init__(
+        self,
+        superheroes_service: SuperheroesServiceProtocol,
+        superhero_api_service: SuperHeroApiServiceProtocol,
+        max_concurrency: int = 10,
+        unknown_names_cache: Optional[TTLCache[str, bool]] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
+    ) -> None:
+        self.superheroes_service = superheroes_service
+        self.superhero_api_service = superhero_api_service
+        self.max_concurrency = max_concurrency
+        self.unknown_names_cache = unknown_names_cache
+        # The one `superheroes_service` runs on, entered by `execute`
+        self.unit_of_work = unit_of_work
+
+    async def execute(
+        self,
+        superhero_names: Sequence[str],
+    ) -> List[SuperheroBulkItemSchema]:
+        """
+        Import many heroes at once.
+        Existing heroes are read with one query, missing ones are fetched
+        from API with bounded concurrency and saved with one insert.
+        """
+        # Deduplicate names preserving order
+        names = list(dict.fromkeys(n.strip() for n in superhero_names if n.strip()))
+        async with self.unit_of_work or nullcontext():
+            return await self._import_heroes(names)
+
+    async def _import_heroes(self, names: List[str]) -> List[SuperheroBulkItemSchema]:
+        # Get all existing objects from DB
+        existing = {
+            hero.name: hero
+            for hero in await self.superheroes_service.find_heroes_by_names(names)
+        }
+        report: Dict[str, SuperheroBulkItemSchema] = {
+            name: SuperheroBulkItemSchema(
+                name=name,
+                status=SuperheroImportStatus.EXISTS,
+                hero=existing[name],
+            )
+            for name in names
+            if name in existing
+        }
+        missing = [name for name in names if name not in existing]
+        if not missing:
+            return [report[name] for name in names]
+
+        # No connection held over the API calls
+        if self.unit_of_work is not None:
+            await self.unit_of_work.checkpoint()
+
+        # Fetch missing heroes from API
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        responses = await asyncio.gather(
+            *(self._fetch(name, semaphore) for name in missing),
+            return_exceptions=True,
+        )
+
+        fetched: Dict[str, SuperheroCreateSchema] = {}
+        for name, response in zip(missing, responses):
+            if isinstance(response, BaseException):
+                logger.warning("Failed to import superhero %r: %r", name, response)
+                report[name] = SuperheroBulkItemSchema(
+                    name=name,
+                    status=SuperheroImportStatus.FAILED,
+                )
+            elif response is None:
+                report[name] = SuperheroBulkItemSchema(
+                    name=name,
+                    status=SuperheroImportStatus.NOT_FOUND,
+                )
+            else:
+                fetched[name] = response
+
+        # Save fetched heroes with one statement. Heroes created meanwhile
+        # by concurrent imports (or returned by API under an existing name)
+        # come back as existing rows instead of failing the insert.
+        saved = {
+            hero.name: (hero, created)
+            for hero, created in await self.superheroes_service.get_or_create_heroes(
+                list(fetched.values())
+            )
+        }
+
+        for name, response in fetched.items():
+            hero, created = saved[response.name]
+            report[name] = SuperheroBulkItemSchema(
+                name=name,
+                status=(
+                    SuperheroImportStatus.CREATED
+                    if created
+                    else SuperheroImportStatus.EXISTS
+                ),
+                hero=hero,
+            )
+
+        return [report[name] for name in names]
+
+    async def _fetch(
+        self,
+        name: str,
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[SuperheroCreateSchema]:
+        key = name.lower()
+        if self.unknown_names_cache is not None and self.unknown_names_cache.get(key):
+            return None
+
+        async with semaphore:
+            response = await self.superhero_api_service.get_hero_by_name(name=name)
+
+        if response is None and self.unknown_names_cache is not None:
+            self.unknown_names_cache.set(key, True)
+        return response
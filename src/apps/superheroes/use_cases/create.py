@@ -1,7 +1,12 @@
-from typing import Protocol
+from contextlib import nullcontext
+from typing import Protocol, Optional
+
+from src.core.cache.ttl_cache import TTLCache
+from src.core.concurrency.single_flight import SingleFlight
+from src.core.database.unit_of_work import UnitOfWork
 
 from ..services.superheroes import SuperheroesServiceProtocol
-from ..services.superhero_api import SuperHeroApiServiceProtocol
+from ..services.superhero_api import SuperHeroApiServiceProtocol, pick_requested_hero
 from ..schemas.superheroes import SuperheroReadSchema
 from ..exceptions import HeroNotFoundException
 
@@ -20,28 +25,66 @@ class CreateSuperheroUseCaseImpl:
         self,
         superheroes_service: SuperheroesServiceProtocol,
         superhero_api_service: SuperHeroApiServiceProtocol,
+        single_flight: Optional[SingleFlight[SuperheroReadSchema]] = None,
+        unknown_names_cache: Optional[TTLCache[str, bool]] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
     ) -> None:
         self.superheroes_service = superheroes_service
         self.superhero_api_service = superhero_api_service
+        self.single_flight = (
+            single_flight if single_flight is not None else SingleFlight()
+        )
+        self.unknown_names_cache = unknown_names_cache
+        # The one `superheroes_service` runs on, entered by the import itself:
+        # it commits before its result is shared, whichever request started it
+        self.unit_of_work = unit_of_work
 
     async def execute(self, superhero_name: str) -> SuperheroReadSchema:
         """
         Checks if superhero already exists in DB.
-        If not found tries to get it from API and saves in DB.
+        If not found searches it in API and saves all search results in DB.
+        Concurrent calls for the same (normalized) name share one execution.
         """
-        # Try to get object from DB
-        db_superhero = await self.superheroes_service.find_hero_by_name(
-            name=superhero_name
+        key = superhero_name.strip().lower()
+        return await self.single_flight.do(
+            key, lambda: self._import_hero(key, superhero_name)
         )
-        if db_superhero:
-            return db_superhero
 
-        # Send request to get superhero by name
-        response = await self.superhero_api_service.get_hero_by_name(name=superhero_name)
-        if not response:
-            raise HeroNotFoundException(hero_name=superhero_name)
+    async def _import_hero(
+        self,
+        key: str,
+        superhero_name: str,
+    ) -> SuperheroReadSchema:
+        async with self.unit_of_work or nullcontext():
+            # Try to get object from DB
+            db_superhero = await self.superheroes_service.find_hero_by_name(
+                name=superhero_name
+            )
+            if db_superhero:
+                return db_superhero
 
-        # Save new superhero in DB
-        new_superhero = await self.superheroes_service.create_hero(new_hero=response)
+            # Skip API for names it recently reported as unknown
+            if self.unknown_names_cache is not None and self.unknown_names_cache.get(key):
+                raise HeroNotFoundException(hero_name=superhero_name)
 
-        return new_superhero
\ No newline at end of file
+            # No connection held over the API call
+            if self.unit_of_work is not None:
+                await self.unit_of_work.checkpoint()
+
+            # Send request to search superheroes by name
+            found = await self.superhero_api_service.search_heroes(name=superhero_name)
+            if not found:
+                if self.unknown_names_cache is not None:
+                    self.unknown_names_cache.set(key, True)
+                raise HeroNotFoundException(hero_name=superhero_name)
+
+            # Save every search result in DB with one statement,
+            # so later requests for the siblings are served from DB
+            requested = pick_requested_hero(found, superhero_name)
+            saved = await self.superheroes_service.upsert_heroes(new_heroes=found)
+
+        superhero = next((hero for hero in saved if hero.name == requested.name), None)
+        if superhero is None:
+            # Saved under another name than searched for (e.g. normalized by DB)
+            raise HeroNotFoundException(hero_name=superhero_name)
+        return superhero
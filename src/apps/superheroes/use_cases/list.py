@@ -1,7 +1,14 @@
-from typing import Protocol, List
+from contextlib import nullcontext
+from typing import AsyncGenerator, AsyncIterator, Optional, Protocol, Tuple, cast
+
+from src.core.database.unit_of_work import UnitOfWork
 
 from ..services.superheroes import SuperheroesServiceProtocol
-from ..schemas.superheroes import SuperheroReadSchema, SuperheroQueryFilterSchema
+from ..schemas.superheroes import (
+    SuperheroPageSchema,
+    SuperheroQueryFilterSchema,
+    SuperheroReadSchema,
+)
 from ..exceptions import HeroNotFoundException, FilteredHeroesNotFoundException
 
 
@@ -9,25 +16,119 @@ class ListSuperheroesUseCaseProtocol(Protocol):
     async def execute(
         self,
         filters: SuperheroQueryFilterSchema,
-    ) -> List[SuperheroReadSchema]: ...
+    ) -> SuperheroPageSchema: ...
+
+    def stream(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> AsyncIterator[SuperheroReadSchema]: ...
+
+    async def open_stream(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> Tuple[int, AsyncGenerator[SuperheroReadSchema, None]]: ...
+
+    async def open_stream(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> Tuple[int, AsyncGenerator[SuperheroReadSchema, None]]:
+        """
+        Data version and `stream` of the heroes, read in the unit of work,
+        which stays open until the stream is exhausted or closed (`aclose`).
+        Close it if it is not consumed.
+        """
+        heroes = self._versioned_stream(filters, chunk_size)
+        version = cast(int, await anext(heroes))
+        return version, cast(AsyncGenerator[SuperheroReadSchema, None], heroes)
+
+    async def _versioned_stream(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> AsyncGenerator[int | SuperheroReadSchema, None]:
+        async with self.unit_of_work or nullcontext():
+            yield await self.version()
+            async for superhero in self.stream(filters=filters, chunk_size=chunk_size):
+                yield superhero
+
+    async def version(self) -> int: ...
 
 
 class ListSuperheroesUseCaseImpl:
-    def __init__(self, superheroes_service: SuperheroesServiceProtocol) -> None:
+    def __init__(
+        self,
+        superheroes_service: SuperheroesServiceProtocol,
+        unit_of_work: Optional[UnitOfWork] = None,
+    ) -> None:
         self.superheroes_service = superheroes_service
+        # The one `superheroes_service` runs on, entered by `open_stream`
+        self.unit_of_work = unit_of_work
 
     async def execute(
         self,
         filters: SuperheroQueryFilterSchema,
-    ) -> List[SuperheroReadSchema]:
+    ) -> SuperheroPageSchema:
         if filters.name:
             superhero = await self.superheroes_service.find_hero_by_name(name=filters.name)
             if superhero is None:
                 raise HeroNotFoundException(hero_name=filters.name)
-            return [superhero]
+            return SuperheroPageSchema(items=[superhero])
 
-        superheroes = await self.superheroes_service.filter_heroes(filters=filters)
-        if superheroes is None:
+        page = await self.superheroes_service.filter_heroes(filters=filters)
+        if page is None:
             raise FilteredHeroesNotFoundException(filters=filters.model_dump(exclude_none=True))
 
-        return superheroes
+        return page
+
+    async def stream(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> AsyncIterator[SuperheroReadSchema]:
+        """
+        All matching heroes, without pagination. Empty stream if nothing found.
+        """
+        if filters.name:
+            superhero = await self.superheroes_service.find_hero_by_name(name=filters.name)
+            if superhero is not None:
+                yield superhero
+            return
+
+        async for superhero in self.superheroes_service.stream_heroes(
+            filters=filters,
+            chunk_size=chunk_size,
+        ):
+            yield superhero
+
+    async def open_stream(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> Tuple[int, AsyncGenerator[SuperheroReadSchema, None]]:
+        """
+        Data version and `stream` of the heroes, read in the unit of work,
+        which stays open until the stream is exhausted or closed (`aclose`).
+        Close it if it is not consumed.
+        """
+        heroes = self._versioned_stream(filters, chunk_size)
+        version = cast(int, await anext(heroes))
+        return version, cast(AsyncGenerator[SuperheroReadSchema, None], heroes)
+
+    async def _versioned_stream(
+        self,
+        filters: SuperheroQueryFilterSchema,
+        chunk_size: int,
+    ) -> AsyncGenerator[int | SuperheroReadSchema, None]:
+        async with self.unit_of_work or nullcontext():
+            yield await self.version()
+            async for superhero in self.stream(filters=filters, chunk_size=chunk_size):
+                yield superhero
+
+    async def version(self) -> int:
+        """
+        Heroes data version: listings of the same filters are equal while it holds.
+        """
+        return await self.superheroes_service.get_version()
@@ -4,9 +4,15 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from src.core.database.db_provider import db_provider
+from src.core.http.client_provider import sh_api_client_provider
+from src.apps.superheroes.depends import (
+    sh_api_response_cache,
+    superheroes_read_model_sync,
+)
 
 from src.settings import settings
 from src.middleware import apply_middleware
+from src.exception_handlers import apply_exception_handlers
 from src.router import apply_routes
 from src.logs import setup_logging
 
@@ -18,8 +24,15 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Start application")
+    await sh_api_client_provider.startup()
+    if superheroes_read_model_sync is not None:
+        await superheroes_read_model_sync.start()
     yield
     logger.info("Dispose application")
+    if superheroes_read_model_sync is not None:
+        await superheroes_read_model_sync.stop()
+    await sh_api_response_cache.dispose()
+    await sh_api_client_provider.dispose()
     await db_provider.dispose()
 
 
@@ -29,8 +42,9 @@ def create_app() -> FastAPI:
 
     Applies:
     1. Middlewares.
-    2. Routes.
-    3. Addition modules (admin-panel, handlers, etc.)
+    2. Exception handlers.
+    3. Routes.
+    4. Addition modules (admin-panel, handlers, etc.)
     """
     docs_url = "/docs" if settings.debug else None
     redoc_url = "/redoc" if settings.debug else None
@@ -44,5 +58,6 @@ def create_app() -> FastAPI:
         openapi_url=openapi_url,
     )
     app = apply_middleware(app)
+    app = apply_exception_handlers(app)
     app = apply_routes(app)
     return app
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from src.core.exceptions.http_exceptions import UpstreamUnavailableException
+
+logger = logging.getLogger(__name__)
+
+JsonFetcher = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class ResponseCacheMode(StrEnum):
+    OFF = "off"
+    READ_WRITE = "read_write"
+    # Serve only cached responses, never call upstream
+    REPLAY = "replay"
+
+
+class SQLiteResponseCache:
+    """
+    Persistent upstream JSON response cache stored in SQLite.
+
+    Fresh entries (younger than `ttl`) are served as is. Stale entries
+    (younger than `ttl + stale_ttl`) are served immediately while a background
+    fetch revalidates them. In replay mode every cached entry is served
+    and misses fail without calling upstream.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        path: Path,
+        ttl: float,
+        stale_ttl: float,
+        mode: ResponseCacheMode = ResponseCacheMode.READ_WRITE,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        self.service_name = service_name
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.mode = mode
+        self._timer = timer
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._revalidating: Set[str] = set()
+        self._background: Set[asyncio.Task] = set()
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def _read(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT payload, stored_at FROM responses WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def _write(self, key: str, payload: Dict[str, Any], stored_at: float) -> None:
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO responses (key, payload, stored_at) VALUES (?, ?, ?)",
+                (key, json.dumps(payload), stored_at),
+            )
+
+    async def get(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Cached payload and its age in seconds.
+        """
+        item = await asyncio.to_thread(self._read, key)
+        if item is None:
+            return None
+        payload, stored_at = item
+        return payload, self._timer() - stored_at
+
+    async def set(self, key: str, payload: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write, key, payload, self._timer())
+
+    async def get_or_fetch(self, key: str, fetch: JsonFetcher) -> Dict[str, Any]:
+        if self.mode == ResponseCacheMode.OFF:
+            return await fetch()
+
+        cached = await self.get(key)
+        if cached is not None:
+            payload, age = cached
+            if age <= self.ttl or self.mode == ResponseCacheMode.REPLAY:
+                self.fresh_hits += 1
+                return payload
+            if age <= self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._revalidate(key, fetch)
+                return payload
+
+        self.misses += 1
+        if self.mode == ResponseCacheMode.REPLAY:
+            raise UpstreamUnavailableException(
+                self.service_name, f"no cached response for '{key}' in replay mode"
+            )
+        return await self._fetch_and_store(key, fetch)
+
+    async def _fetch_and_store(self, key: str, fetch: JsonFetcher) -> Dict[str, Any]:
+        payload = await fetch()
+        await self.set(key, payload)
+        return payload
+
+    def _revalidate(self, key: str, fetch: JsonFetcher) -> None:
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+        self.revalidations += 1
+        task = asyncio.create_task(self._fetch_and_store(key, fetch))
+        self._background.add(task)
+        task.add_done_callback(lambda t: self._revalidated(key, t))
+
+    def _revalidated(self, key: str, task: asyncio.Task) -> None:
+        self._revalidating.discard(key)
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Failed to revalidate %r: %r", key, task.exception())
+
+    async def dispose(self) -> None:
+        for task in list(self._background):
+            task.cancel()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": str(self.mode),
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+        }
@@ -0,0 +1,118 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, NamedTuple, Optional, TypeVar
+
+from pydantic_core import to_json
+
+from src.core.schemas.http_schemas import ResponseSchema
+
+__all__ = (
+    "VersionedLRUCache",
+    "json_size",
+)
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+def json_size(value: Any) -> int:
+    """
+    Size of a result as its JSON, a fair estimate of what caching it costs.
+    Response schemas keep the JSON they were measured by for their response.
+    """
+    if isinstance(value, ResponseSchema):
+        return len(value.json_bytes())
+    return len(to_json(value))
+
+
+class _Entry(NamedTuple):
+    version: Hashable
+    expires_at: float
+    value: Any
+    size: int
+
+
+class VersionedLRUCache(Generic[KeyType, ValueType]):
+    """
+    In-memory LRU cache bounded by the total size of values in bytes.
+
+    Entries are tagged with the data version they were computed at and miss
+    once the version moved on or after `ttl` seconds (bounds staleness from
+    writes this process doesn't see).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Callable[[ValueType], int] = json_size,
+        ttl: float = float("inf"),
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._timer = timer
+        self._data: OrderedDict[KeyType, _Entry] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(
+        self,
+        key: KeyType,
+        version: Hashable,
+        default: Optional[ValueType] = None,
+    ) -> Optional[ValueType]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        if entry.version != version or entry.expires_at <= self._timer():
+            self._remove(key)
+            self.stale += 1
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: KeyType, version: Hashable, value: ValueType) -> None:
+        size = self._sizeof(value)
+        self._remove(key)
+        if size > self.max_bytes:
+            return
+        self._data[key] = _Entry(version, self._timer() + self.ttl, value, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.bytes = 0
+
+    def _remove(self, key: KeyType) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,38 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    In-process single-flight: concurrent calls sharing the same key
+    wait for one in-flight execution instead of running it again.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, asyncio.Future[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `func` once per key at a time and share its result (or error)
+        with every caller that arrives while it is still running.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        # Shield the shared future: a cancelled caller must not cancel
+        # the execution other callers are waiting for.
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future[T]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved when every caller has gone away
+            future.exception()
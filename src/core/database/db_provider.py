@@ -1,6 +1,9 @@
-from typing import AsyncGenerator, Annotated
+from typing import Any, AsyncGenerator, Annotated, Dict, List, Sequence
 from fastapi import Depends
 
+from sqlalchemy import TextClause, event
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.orm import ORMExecuteState, Session
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -8,6 +11,9 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
 )
 
+from src.core.database.pool import InstrumentedAsyncPool
+from src.core.database.routing import ReplicaRouter, RoutingStrategy
+from src.core.metrics import metrics_registry
 from src.settings import settings
 
 
@@ -17,24 +23,118 @@ class DatabaseProvider:
         url: str,
         echo: bool = False,
         echo_pool: bool = False,
-        max_overflow: int = 10,
-        pool_size: int = 50,
+        max_overflow: int = 5,
+        pool_size: int = 10,
+        pool_timeout: float = 5.0,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        query_cache_size: int = 500,
+        prepared_statement_cache_size: int = 500,
+        replica_urls: Sequence[str] = (),
+        replica_routing: RoutingStrategy = RoutingStrategy.ROUND_ROBIN,
+        read_your_writes_seconds: float = 5.0,
     ) -> None:
-        self.engine: AsyncEngine = create_async_engine(
-            url=url,
+        self._engine_options: Dict[str, Any] = dict(
             echo=echo,
             echo_pool=echo_pool,
+            poolclass=InstrumentedAsyncPool,
             max_overflow=max_overflow,
             pool_size=pool_size,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            query_cache_size=query_cache_size,
+            # Server-side prepared statements reused per connection by asyncpg
+            connect_args={"prepared_statement_cache_size": prepared_statement_cache_size},
         )
+        self._query_cache_size = query_cache_size
+        self.compiled_cache_hits = 0
+        self.compiled_cache_misses = 0
+
+        self.engine: AsyncEngine = self._create_engine(url)
+        # Own Session subclass, so write tracking events don't leak to other providers
+        primary_session_class = type("PrimarySession", (Session,), {})
+        event.listen(primary_session_class, "do_orm_execute", self._mark_write)
+        event.listen(primary_session_class, "after_commit", self._record_write)
+        event.listen(primary_session_class, "after_rollback", self._forget_write)
         self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
+            sync_session_class=primary_session_class,
+        )
+
+        self.replica_engines: List[AsyncEngine] = [
+            self._create_engine(replica_url) for replica_url in replica_urls
+        ]
+        self.replica_router: ReplicaRouter[async_sessionmaker[AsyncSession]] = ReplicaRouter(
+            replicas=[
+                async_sessionmaker(
+                    bind=engine,
+                    autoflush=False,
+                    autocommit=False,
+                    expire_on_commit=False,
+                )
+                for engine in self.replica_engines
+            ],
+            strategy=replica_routing,
+            load=lambda factory: factory.kw["bind"].pool.checkedout(),
+            read_your_writes_seconds=read_your_writes_seconds,
         )
 
+    def _create_engine(self, url: str) -> AsyncEngine:
+        engine = create_async_engine(url=url, **self._engine_options)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._count_compiled_cache)
+        return engine
+
+    def _count_compiled_cache(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if context.cache_hit is CacheStats.CACHE_HIT:
+            self.compiled_cache_hits += 1
+        elif context.cache_hit is CacheStats.CACHE_MISS:
+            self.compiled_cache_misses += 1
+
+    @staticmethod
+    def _mark_write(orm_execute_state: ORMExecuteState) -> None:
+        statement = orm_execute_state.statement
+        if isinstance(statement, TextClause):
+            # Raw SQL is a write unless it is a plain SELECT
+            is_write = not statement.text.lstrip().lower().startswith("select")
+        else:
+            is_write = not orm_execute_state.is_select
+        if is_write:
+            orm_execute_state.session.info["has_writes"] = True
+
+    def _record_write(self, session: Session) -> None:
+        if session.info.pop("has_writes", False):
+            self.replica_router.record_write()
+
+    @staticmethod
+    def _forget_write(session: Session) -> None:
+        session.info.pop("has_writes", None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.compiled_cache_hits + self.compiled_cache_misses
+        return {
+            "compiled_cache_entries": sum(
+                len(engine.sync_engine._compiled_cache)
+                for engine in (self.engine, *self.replica_engines)
+            ),
+            "compiled_cache_size": self._query_cache_size,
+            "compiled_cache_hits": self.compiled_cache_hits,
+            "compiled_cache_misses": self.compiled_cache_misses,
+            "compiled_cache_hit_rate": self.compiled_cache_hits / lookups if lookups else 0.0,
+        }
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return {
+            "primary": self.engine.pool.stats(),
+            "replicas": [engine.pool.stats() for engine in self.replica_engines],
+        }
+
     async def dispose(self) -> None:
+        for engine in self.replica_engines:
+            await engine.dispose()
         await self.engine.dispose()
 
     async def session_getter(self) -> AsyncGenerator[AsyncSession, None]:
@@ -44,7 +144,39 @@ class DatabaseProvider:
             finally:
                 await session.close()
 
+    def read_session(self) -> AsyncSession:
+        """
+        Session for read-only use cases: a replica picked by the router,
+        or primary if there are no replicas or a write was just committed.
+        """
+        session_factory = self.replica_router.choose() or self.session_factory
+        return session_factory()
+
+    async def read_session_getter(self) -> AsyncGenerator[AsyncSession, None]:
+        async with self.read_session() as session:
+            try:
+                yield session
+            finally:
+                await session.close()
+
 
-db_provider = DatabaseProvider(url=settings.db.dsn)
+db_provider = DatabaseProvider(
+    url=settings.db.dsn,
+    max_overflow=settings.db.max_overflow,
+    pool_size=settings.db.pool_size,
+    pool_timeout=settings.db.pool_timeout,
+    pool_recycle=settings.db.pool_recycle,
+    pool_pre_ping=settings.db.pool_pre_ping,
+    query_cache_size=settings.db.query_cache_size,
+    prepared_statement_cache_size=settings.db.prepared_statement_cache_size,
+    replica_urls=settings.db.replica_dsns,
+    replica_routing=RoutingStrategy(settings.db.replica_routing),
+    read_your_writes_seconds=settings.db.read_your_writes_seconds,
+)
+metrics_registry.register("db.statements", db_provider.stats)
+metrics_registry.register("db.replicas", db_provider.replica_router.stats)
+metrics_registry.register("db.pool", db_provider.pool_stats)
 
 SessionDep = Annotated[AsyncSession, Depends(db_provider.session_getter)]
+# Read-only use cases; may be served by a replica with some replication lag
+ReadSessionDep = Annotated[AsyncSession, Depends(db_provider.read_session_getter)]
@@ -0,0 +1,76 @@
+import time
+from typing import Any, Dict, Optional, TypeVar
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection
+from sqlalchemy.util.queue import AsyncAdaptedQueue
+
+from src.core.metrics import Histogram
+
+__all__ = (
+    "InstrumentedAsyncPool",
+    "POOL_WAIT_BUCKETS",
+)
+
+# Seconds
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+T = TypeVar("T")
+
+
+class _TimedQueue(AsyncAdaptedQueue[T]):
+    """
+    Idle connections queue that records how long each take waits for one.
+    """
+
+    histogram: Histogram
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        started = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            self.histogram.observe(time.perf_counter() - started)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long checkouts wait for an idle
+    connection (pool exhaustion) and, separately, how long opening new
+    connections takes. Pre-ping of a checked out connection is in neither.
+    """
+
+    _queue_class = _TimedQueue
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.queue_wait_histogram = Histogram(POOL_WAIT_BUCKETS)
+        self.connect_histogram = Histogram(POOL_WAIT_BUCKETS)
+        self._pool.histogram = self.queue_wait_histogram
+        self.timeouts = 0
+
+    def connect(self) -> PoolProxiedConnection:
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            self.connect_histogram.observe(time.perf_counter() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            # Negative until all pool_size connections are opened
+            "overflow": max(self.overflow(), 0),
+            "timeouts": self.timeouts,
+            "queue_wait_seconds": self.queue_wait_histogram.snapshot(),
+            "connect_seconds": self.connect_histogram.snapshot(),
+        }
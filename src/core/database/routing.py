@@ -0,0 +1,121 @@
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, Sequence, TypeVar
+
+__all__ = (
+    "ClientWrites",
+    "ReplicaRouter",
+    "RoutingStrategy",
+    "client_writes_scope",
+)
+
+TargetType = TypeVar("TargetType")
+
+
+class ClientWrites:
+    """
+    Last committed write of the client being served, seconds since epoch.
+    `written` tells whether the current request committed one.
+    """
+
+    def __init__(self, last_write_at: Optional[float] = None) -> None:
+        self.last_write_at = last_write_at
+        self.written = False
+
+
+_client_writes: ContextVar[Optional[ClientWrites]] = ContextVar("client_writes", default=None)
+
+
+@contextmanager
+def client_writes_scope(last_write_at: Optional[float] = None) -> Iterator[ClientWrites]:
+    """
+    Track writes of one client (request) for `ReplicaRouter`,
+    starting from its previous write (e.g. sent back in a cookie).
+    """
+    writes = ClientWrites(last_write_at)
+    token = _client_writes.set(writes)
+    try:
+        yield writes
+    finally:
+        _client_writes.reset(token)
+
+
+class RoutingStrategy(StrEnum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_LOADED = "least_loaded"
+
+
+class ReplicaRouter(Generic[TargetType]):
+    """
+    Picks a read replica for the next read-only session.
+
+    Returns None when reads must go to the primary: there are no replicas,
+    or the client being served (see `client_writes_scope`) committed a write
+    less than `read_your_writes_seconds` ago (replicas may not have replayed
+    it yet). Reads outside of a client scope are never pinned.
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[TargetType],
+        strategy: RoutingStrategy = RoutingStrategy.ROUND_ROBIN,
+        load: Optional[Callable[[TargetType], int]] = None,
+        read_your_writes_seconds: float = 5.0,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        if strategy == RoutingStrategy.LEAST_LOADED and load is None:
+            raise ValueError("least_loaded routing needs a load function.")
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._load = load
+        self._timer = timer
+        self._cycle = itertools.cycle(range(len(self.replicas)))
+        self._routed = [0] * len(self.replicas)
+        self.primary_reads = 0
+        self.read_your_writes_reads = 0
+
+    def record_write(self) -> None:
+        writes = _client_writes.get()
+        if writes is not None:
+            writes.last_write_at = self._timer()
+            writes.written = True
+
+    def choose(self) -> Optional[TargetType]:
+        if not self.replicas:
+            self.primary_reads += 1
+            return None
+        if self._recently_written():
+            self.primary_reads += 1
+            self.read_your_writes_reads += 1
+            return None
+
+        if self.strategy == RoutingStrategy.LEAST_LOADED:
+            # Ties go round-robin, so idle replicas share the traffic
+            start = next(self._cycle)
+            order = [(start + i) % len(self.replicas) for i in range(len(self.replicas))]
+            index = min(order, key=lambda i: self._load(self.replicas[i]))
+        else:
+            index = next(self._cycle)
+
+        self._routed[index] += 1
+        return self.replicas[index]
+
+    def _recently_written(self) -> bool:
+        writes = _client_writes.get()
+        if writes is None or writes.last_write_at is None:
+            return False
+        # Clock skew between processes may put it a bit in the future
+        return abs(self._timer() - writes.last_write_at) < self.read_your_writes_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "strategy": str(self.strategy),
+            "replicas": len(self.replicas),
+            "replica_reads": list(self._routed),
+            "primary_reads": self.primary_reads,
+            "read_your_writes_reads": self.read_your_writes_reads,
+        }
@@ -0,0 +1,29 @@
+from collections import defaultdict
+from typing import Any, Dict
+
+__all__ = (
+    "TableVersions",
+    "table_versions",
+)
+
+
+class TableVersions:
+    """
+    Process-local change counters per table, bumped by repository writes.
+    Result caches compare them to tell whether a stored result may be stale.
+    """
+
+    def __init__(self) -> None:
+        self._versions: Dict[str, int] = defaultdict(int)
+
+    def get(self, table: str) -> int:
+        return self._versions[table]
+
+    def bump(self, table: str) -> None:
+        self._versions[table] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self._versions)
+
+
+table_versions = TableVersions()
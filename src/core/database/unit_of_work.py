@@ -0,0 +1,118 @@
+import logging
+from types import TracebackType
+from typing import Annotated, AsyncGenerator, Callable, List, Optional
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+
+from src.core.database.db_provider import ReadSessionDep
+
+__all__ = (
+    "UNIT_OF_WORK_KEY",
+    "ReadUnitOfWorkDep",
+    "UnitOfWork",
+)
+
+logger = logging.getLogger(__name__)
+
+# Session.info entry: the unit of work whose transaction repositories join
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+class UnitOfWork:
+    """
+    One session, connection and transaction for a whole use case.
+
+    Repositories built on `session` join the transaction instead of opening
+    their own session scope per call. Commits on exit, rolls back on error.
+    The connection is checked out lazily, on the first statement, and can be
+    given back early with `checkpoint`. With `isolation_level` it is checked
+    out on entry, e.g. REPEATABLE READ gives all queries one snapshot.
+    """
+
+    def __init__(self, session: AsyncSession, isolation_level: Optional[str] = None) -> None:
+        self.session = session
+        self.isolation_level = isolation_level
+        self._transaction: Optional[AsyncSessionTransaction] = None
+        self._commit_callbacks: List[Callable[[], None]] = []
+
+    @property
+    def active(self) -> bool:
+        return self._transaction is not None
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run `callback` after a successful commit, or right away outside a unit of work.
+        Callbacks are dropped on rollback.
+        """
+        if self.active:
+            self._commit_callbacks.append(callback)
+        else:
+            callback()
+
+    async def checkpoint(self) -> None:
+        """
+        Commit the work so far and give the connection back to the pool.
+        The unit of work stays open: the next statement checks a connection
+        out again and starts a new transaction. Call it before waiting on
+        anything slow (e.g. an upstream API), so no connection idles meanwhile.
+        """
+        if not self.active:
+            raise RuntimeError("Unit of work is not started.")
+        callbacks, self._commit_callbacks = self._commit_callbacks, []
+        await self._transaction.commit()
+        self._transaction = await self._begin()
+        self._run_callbacks(callbacks)
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if self.active:
+            raise RuntimeError("Unit of work is already started.")
+        self._transaction = await self._begin()
+        self.session.info[UNIT_OF_WORK_KEY] = self
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        transaction, self._transaction = self._transaction, None
+        callbacks, self._commit_callbacks = self._commit_callbacks, []
+        self.session.info.pop(UNIT_OF_WORK_KEY, None)
+        try:
+            if exc_type is None and transaction.is_active:
+                await transaction.commit()
+            else:
+                await transaction.rollback()
+                callbacks = []
+        finally:
+            await self.session.close()
+
+        self._run_callbacks(callbacks)
+
+    async def _begin(self) -> AsyncSessionTransaction:
+        transaction = await self.session.begin()
+        if self.isolation_level is not None:
+            await self.session.connection(
+                execution_options={"isolation_level": self.isolation_level}
+            )
+        return transaction
+
+    @staticmethod
+    def _run_callbacks(callbacks: List[Callable[[], None]]) -> None:
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                # Transaction is committed, a callback must not fail the request
+                logger.exception("Unit of work commit callback failed. Error:", exc_info=e)
+
+
+async def read_unit_of_work_getter(session: ReadSessionDep) -> AsyncGenerator[UnitOfWork, None]:
+    async with UnitOfWork(session) as uow:
+        yield uow
+
+
+# Read-only use cases: every query of the request on one connection, checked out once
+ReadUnitOfWorkDep = Annotated[UnitOfWork, Depends(read_unit_of_work_getter)]
@@ -0,0 +1,44 @@
+class UpstreamUnavailableException(Exception):
+    """
+    Upstream HTTP service is unavailable (errors, timeouts, open circuit).
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        reason: str,
+        *args: object,
+    ) -> None:
+        message = f"Upstream service '{service_name}' is unavailable: {reason}."
+        super().__init__(message, *args)
+        self.service_name = service_name
+        self.reason = reason
+
+
+class CircuitOpenException(UpstreamUnavailableException):
+    """
+    Call rejected without reaching upstream because the circuit is open.
+    """
+
+    def __init__(self, service_name: str, *args: object) -> None:
+        super().__init__(service_name, "circuit breaker is open", *args)
+
+
+class RateLimitExceededException(Exception):
+    """
+    Call shed by the client-side rate limiter: the wait for a token
+    would be longer than allowed.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        retry_after: float,
+        *args: object,
+    ) -> None:
+        message = (
+            f"Rate limit for '{service_name}' exceeded, retry after {retry_after:.2f}s."
+        )
+        super().__init__(message, *args)
+        self.service_name = service_name
+        self.retry_after = retry_after
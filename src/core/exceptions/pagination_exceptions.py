@@ -0,0 +1,9 @@
+class InvalidCursorException(Exception):
+    """
+    Pagination cursor is malformed or does not match the query.
+    """
+
+    def __init__(self, cursor: str, *args: object) -> None:
+        message = f"Invalid pagination cursor '{cursor}'."
+        super().__init__(message, *args)
+        self.cursor = cursor
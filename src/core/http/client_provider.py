@@ -0,0 +1,78 @@
+from typing import Annotated, Optional
+from fastapi import Depends
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from src.settings import settings
+
+
+class HttpClientProvider:
+    """
+    Application-scoped pooled HTTP client.
+
+    The session is created on application startup and shared by all requests,
+    so upstream calls reuse warm keep-alive connections and cached DNS lookups.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
+        total_timeout: float = 15.0,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: int = 300,
+    ) -> None:
+        self._timeout = ClientTimeout(
+            total=total_timeout,
+            sock_connect=connect_timeout,
+            sock_read=read_timeout,
+        )
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ttl_dns_cache = ttl_dns_cache
+        self._session: Optional[ClientSession] = None
+
+    @property
+    def session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            raise RuntimeError("HTTP client is not started.")
+        return self._session
+
+    async def startup(self) -> None:
+        if self._session is not None and not self._session.closed:
+            return
+        connector = TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self._ttl_dns_cache,
+        )
+        self._session = ClientSession(connector=connector, timeout=self._timeout)
+
+    async def dispose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def session_getter(self) -> ClientSession:
+        return self.session
+
+
+sh_api_client_provider = HttpClientProvider(
+    connect_timeout=settings.sh_api.connect_timeout,
+    read_timeout=settings.sh_api.read_timeout,
+    total_timeout=settings.sh_api.total_timeout,
+    limit=settings.sh_api.connection_limit,
+    limit_per_host=settings.sh_api.limit_per_host,
+    keepalive_timeout=settings.sh_api.keepalive_timeout,
+    ttl_dns_cache=settings.sh_api.dns_cache_ttl,
+)
+
+SuperHeroApiSessionDep = Annotated[
+    ClientSession,
+    Depends(sh_api_client_provider.session_getter),
+]
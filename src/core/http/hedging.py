@@ -0,0 +1,118 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent request latencies (seconds).
+    """
+
+    def __init__(self, window_size: int = 200) -> None:
+        self._samples: Deque[float] = deque(maxlen=window_size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = math.ceil(percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(index, 0), len(ordered) - 1)]
+
+
+class Hedger:
+    """
+    Hedged requests: if the primary call has not finished within
+    the `percentile` latency of recent calls, one duplicate is sent,
+    the first successful result wins and the other call is cancelled.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.05,
+        initial_delay: float = 0.5,
+        window_size: int = 200,
+        min_samples: int = 20,
+    ) -> None:
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self._latencies = LatencyTracker(window_size)
+        self.calls = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+
+    @property
+    def delay(self) -> float:
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, self._latencies.percentile(self.percentile))
+
+    async def _timed(self, func: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        try:
+            return await func()
+        finally:
+            # Cancelled (lost) and failed calls too: their time so far is a lower
+            # bound, but leaving them out would hide exactly the slow tail
+            self._latencies.record(time.perf_counter() - started)
+
+    async def run(
+        self,
+        primary: Callable[[], Awaitable[T]],
+        hedge: Optional[Callable[[], Awaitable[T]]] = None,
+    ) -> T:
+        """
+        Run `primary`, hedged with `hedge` (defaults to `primary`).
+        Raises the last error if both calls failed.
+        """
+        self.calls += 1
+        primary_task = asyncio.ensure_future(self._timed(primary))
+        pending = {primary_task}
+        error: Optional[BaseException] = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.delay)
+            if done:
+                return primary_task.result()
+
+            self.hedges_fired += 1
+            hedge_task = asyncio.ensure_future(self._timed(hedge or primary))
+            pending.add(hedge_task)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winners = [task for task in done if task.exception() is None]
+                if winners:
+                    if winners[0] is hedge_task:
+                        self.hedges_won += 1
+                    return winners[0].result()
+                error = next(iter(done)).exception()
+            raise error
+        finally:
+            # Also on caller cancellation: no call outlives the request
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "delay": round(self.delay, 4),
+            "hedges_fired": self.hedges_fired,
+            "hedges_won": self.hedges_won,
+            "fired_rate": self.hedges_fired / self.calls if self.calls else 0.0,
+            "win_rate": (
+                self.hedges_won / self.hedges_fired if self.hedges_fired else 0.0
+            ),
+        }
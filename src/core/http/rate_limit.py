@@ -0,0 +1,140 @@
+import asyncio
+import fcntl
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Protocol, Tuple
+
+from src.core.exceptions.http_exceptions import RateLimitExceededException
+
+
+class RateLimiterProtocol(Protocol):
+    async def acquire(self) -> None:
+        """
+        Wait for permission to send one request.
+        Raises RateLimitExceededException if the wait would be too long.
+        """
+        ...
+
+
+def reserve_token(
+    tokens: float,
+    updated_at: float,
+    now: float,
+    rate: float,
+    capacity: float,
+) -> Tuple[float, float]:
+    """
+    Refill the bucket up to `now` and take one token.
+    Returns new tokens count (negative when callers are queued)
+    and the time to wait for the taken token.
+    """
+    tokens = min(capacity, tokens + (now - updated_at) * rate) - 1
+    wait = -tokens / rate if tokens < 0 else 0.0
+    return tokens, wait
+
+
+class TokenBucket:
+    """
+    In-process token bucket: `rate` tokens per second, bursts up to `capacity`.
+
+    Callers queue for a token up to `max_wait` seconds,
+    when the queue is longer they are shed with RateLimitExceededException.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: float,
+        max_wait: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self._timer = timer
+        self._tokens = capacity
+        self._updated_at = timer()
+        self.acquired = 0
+        self.delayed = 0
+        self.shed = 0
+
+    async def _reserve(self) -> Tuple[float, bool]:
+        now = self._timer()
+        tokens, wait = reserve_token(
+            self._tokens, self._updated_at, now, self.rate, self.capacity
+        )
+        if wait > self.max_wait:
+            return wait, False
+        self._tokens, self._updated_at = tokens, now
+        return wait, True
+
+    async def acquire(self) -> None:
+        wait, reserved = await self._reserve()
+        if not reserved:
+            self.shed += 1
+            raise RateLimitExceededException(self.name, retry_after=wait)
+        if wait > 0:
+            self.delayed += 1
+            await asyncio.sleep(wait)
+        self.acquired += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "shed": self.shed,
+        }
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket shared by all processes on the host (e.g. uvicorn workers).
+
+    Bucket state is kept in a small file guarded by an exclusive `flock`,
+    timestamps come from the wall clock shared by the processes.
+    """
+
+    _state = struct.Struct("dd")
+
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        rate: float,
+        capacity: float,
+        max_wait: float,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(name, rate, capacity, max_wait, timer)
+        self.path = path
+
+    def _reserve_shared(self) -> Tuple[float, bool]:
+        # File is opened per call: a descriptor inherited by forked workers
+        # would share the lock instead of excluding each other
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            now = self._timer()
+            raw = os.pread(fd, self._state.size, 0)
+            if len(raw) == self._state.size:
+                tokens, updated_at = self._state.unpack(raw)
+            else:
+                tokens, updated_at = self.capacity, now
+            tokens, wait = reserve_token(
+                tokens, updated_at, now, self.rate, self.capacity
+            )
+            if wait > self.max_wait:
+                return wait, False
+            os.pwrite(fd, self._state.pack(tokens, now), 0)
+            return wait, True
+        finally:
+            os.close(fd)
+
+    async def _reserve(self) -> Tuple[float, bool]:
+        return await asyncio.to_thread(self._reserve_shared)
@@ -0,0 +1,168 @@
+import random
+import time
+from collections import deque
+from enum import StrEnum
+from typing import Any, Callable, Deque, Dict
+
+from src.core.exceptions.http_exceptions import CircuitOpenException
+
+
+class RetryBudget:
+    """
+    Limits retries to a share of recent requests.
+
+    Every request deposits `ratio` tokens (up to `capacity`),
+    every retry withdraws one token. Without tokens retries are not allowed,
+    so a failing upstream is not hit with a retry storm.
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10.0) -> None:
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = capacity
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self.retries += 1
+            return True
+        self.exhausted += 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tokens": round(self._tokens, 3),
+            "retries": self.retries,
+            "exhausted": self.exhausted,
+        }
+
+
+def jittered_backoff(attempt: int, base: float, cap: float) -> float:
+    """
+    "Full jitter" exponential backoff delay for retry `attempt` (from 0).
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker over a sliding window of recent calls.
+
+    CLOSED: calls pass, outcomes are recorded. The circuit opens when
+    the window holds at least `minimum_calls` and the failure rate
+    reaches `failure_rate_threshold`.
+    OPEN: calls fail fast for `open_seconds`.
+    HALF_OPEN: up to `half_open_calls` trial calls pass, one failure opens
+    the circuit again, all of them succeeding closes it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 20,
+        window_size: int = 50,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 3,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self._timer = timer
+        self._window: Deque[bool] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._trial_successes = 0
+        self.opened_count = 0
+        self.rejected_count = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self._timer() - self._opened_at >= self.open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_calls = 0
+            self._trial_successes = 0
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return self._window.count(False) / len(self._window)
+
+    def before_call(self) -> None:
+        """
+        Raise CircuitOpenException if call is not allowed now.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return
+        if state == CircuitState.HALF_OPEN and self._trial_calls < self.half_open_calls:
+            self._trial_calls += 1
+            return
+        self.rejected_count += 1
+        raise CircuitOpenException(self.name)
+
+    def record_success(self) -> None:
+        if self._state == CircuitState.HALF_OPEN:
+            self._trial_successes += 1
+            if self._trial_successes >= self.half_open_calls:
+                self._close()
+            return
+        self._window.append(True)
+
+    def record_failure(self) -> None:
+        if self._state == CircuitState.HALF_OPEN:
+            self._open()
+            return
+        self._window.append(False)
+        if (
+            self._state == CircuitState.CLOSED
+            and len(self._window) >= self.minimum_calls
+            and self.failure_rate >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def release_call(self) -> None:
+        """
+        Give back the trial slot of a call that ended without an outcome
+        (cancelled, shed, failed locally), so half-open trials go on.
+        """
+        if self._state == CircuitState.HALF_OPEN and self._trial_calls > 0:
+            self._trial_calls -= 1
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._timer()
+        self.opened_count += 1
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._window.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": str(self.state),
+            "failure_rate": round(self.failure_rate, 3),
+            "window_calls": len(self._window),
+            "opened_count": self.opened_count,
+            "rejected_count": self.rejected_count,
+        }
@@ -0,0 +1,58 @@
+import bisect
+from typing import Any, Callable, Dict, Sequence
+
+__all__ = (
+    "Histogram",
+    "MetricsRegistry",
+    "metrics_registry",
+)
+
+MetricsCollector = Callable[[], Dict[str, Any]]
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed upper bounds, Prometheus style.
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = sorted(buckets)
+        # Last counter is for values over the largest bound
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = {}
+        total = 0
+        for bound, count in zip(self.buckets, self._counts):
+            total += count
+            cumulative[str(bound)] = total
+        cumulative["+Inf"] = self.count
+        return {"buckets": cumulative, "count": self.count, "sum": self.sum}
+
+
+class MetricsRegistry:
+    """
+    Registry of in-process metrics collectors exposed for monitoring.
+    """
+
+    def __init__(self) -> None:
+        self._collectors: Dict[str, MetricsCollector] = {}
+
+    def register(self, name: str, collector: MetricsCollector) -> None:
+        self._collectors[name] = collector
+
+    def unregister(self, name: str) -> None:
+        self._collectors.pop(name, None)
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+        return {name: collector() for name, collector in self._collectors.items()}
+
+
+metrics_registry = MetricsRegistry()
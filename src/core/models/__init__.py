@@ -1,7 +1,9 @@
 __all__ = (
     "Base",
     "Superhero",
+    "TableVersion",
 )
 
 from .base import Base
-from .superheroes import Superhero
\ No newline at end of file
+from .superheroes import Superhero
+from .table_versions import TableVersion
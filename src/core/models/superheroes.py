@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.models.base import Base
@@ -6,10 +6,14 @@ from src.core.models.base import Base
 
 class Superhero(Base):
     __tablename__ = "superheroes"
+    # (stat, id) composites cover powerstat range filters and keyset pages sorted by a stat
+    __table_args__ = tuple(
+        Index(f"ix_superheroes_{stat}_id", stat, "id")
+        for stat in ("intelligence", "strength", "speed", "durability", "power", "combat")
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
-        index=True,
         primary_key=True,
         autoincrement=True,
     )
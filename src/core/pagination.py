@@ -0,0 +1,52 @@
+import base64
+import binascii
+import json
+from typing import Any, NamedTuple
+
+from src.core.exceptions.pagination_exceptions import InvalidCursorException
+
+__all__ = (
+    "KeysetCursor",
+    "encode_cursor",
+    "decode_cursor",
+)
+
+
+class KeysetCursor(NamedTuple):
+    """
+    Position after the last row of a page ordered by (sort_key, id).
+    """
+
+    sort_key: str
+    value: Any
+    id: int
+
+
+def encode_cursor(cursor: KeysetCursor) -> str:
+    raw = json.dumps([cursor.sort_key, cursor.value, cursor.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _is_instance(value: Any, value_type: type) -> bool:
+    # JSON true/false decode to bool, a subclass of int
+    return isinstance(value, value_type) and (value_type is bool or not isinstance(value, bool))
+
+
+def decode_cursor(cursor: str, sort_key: str, value_type: type = object) -> KeysetCursor:
+    """
+    Decode opaque cursor. Raises InvalidCursorException if it is malformed,
+    was issued for another sort key or its value is not a `value_type`
+    (the sort column type).
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort_key, value, last_id = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursorException(cursor)
+    if (
+        cursor_sort_key != sort_key
+        or not _is_instance(last_id, int)
+        or not _is_instance(value, value_type)
+    ):
+        raise InvalidCursorException(cursor)
+    return KeysetCursor(cursor_sort_key, value, last_id)
@@ -1,14 +1,33 @@
+import time
 import uuid
 import logging
-from typing import Protocol, TypeVar
+from contextlib import asynccontextmanager
+from functools import cache, partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Protocol,
+    Tuple,
+    TypeVar,
+    List,
+    Sequence,
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from sqlalchemy import insert, update, delete
+from sqlalchemy import Select, insert, update, delete, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 
+from src.core.database.table_versions import table_versions
+from src.core.database.unit_of_work import UNIT_OF_WORK_KEY
 from src.core.models.base import Base
 from src.core.exceptions.db_exceptions import (
     ModelNotFoundException,
@@ -25,6 +44,30 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=CreateBaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=UpdateBaseModel)
 
 
+@cache
+def rows_adapter(read_schema_type: type[ReadSchemaType]) -> TypeAdapter[List[ReadSchemaType]]:
+    """
+    Shared validator of read schema lists, built once per schema.
+    """
+    return TypeAdapter(List[read_schema_type])
+
+
+class BulkLoadReport(NamedTuple):
+    """
+    Outcome of `bulk_load`. Loaded rows collapsed by conflict key or skipped
+    on conflict are neither inserted nor updated.
+    """
+
+    loaded: int
+    inserted: int
+    updated: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.loaded / self.seconds if self.seconds else 0.0
+
+
 class DatabaseRepositoryProtocol(
     Protocol[
         ModelType,
@@ -39,6 +82,25 @@ class DatabaseRepositoryProtocol(
 
     async def create(self, create_object: CreateSchemaType) -> ReadSchemaType: ...
 
+    async def upsert_many(
+        self,
+        create_objects: Sequence[CreateSchemaType],
+        conflict_fields: Sequence[str],
+    ) -> List[ReadSchemaType]: ...
+
+    async def get_or_create_many(
+        self,
+        create_objects: Sequence[CreateSchemaType],
+        conflict_fields: Sequence[str],
+    ) -> List[Tuple[ReadSchemaType, bool]]: ...
+
+    async def bulk_load(
+        self,
+        create_objects: Iterable[CreateSchemaType] | AsyncIterable[CreateSchemaType],
+        conflict_fields: Sequence[str],
+        on_conflict: Literal["update", "nothing"] = "update",
+    ) -> BulkLoadReport: ...
+
     async def update(self, update_object: UpdateSchemaType) -> ReadSchemaType: ...
 
     async def delete(self, object_id: uuid.UUID | int) -> bool: ...
@@ -62,8 +124,50 @@ class DatabaseRepositoryImpl(
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @asynccontextmanager
+    async def _session_scope(self, begin: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Session for one repository call. Inside a unit of work the call joins
+        its transaction; otherwise it gets own session scope, closed afterwards,
+        and own transaction if `begin` is set.
+
+        Calls with `begin` are writes: they bump the table version once done
+        and again after commit, dropping results cached by reads in between.
+        """
+        table = self.model_type.__tablename__
+        uow = self._session.info.get(UNIT_OF_WORK_KEY)
+        if uow is not None:
+            yield self._session
+            if begin:
+                table_versions.bump(table)
+                uow.on_commit(partial(table_versions.bump, table))
+            return
+        async with self._session as s:
+            if begin:
+                async with s.begin():
+                    yield s
+                table_versions.bump(table)
+            else:
+                yield s
+
+    def _select_rows(self) -> Select:
+        """
+        SELECT of read schema columns: plain row tuples, no ORM instances.
+        """
+        columns = self.model_type.__table__.c
+        return select(*(columns[field] for field in self.read_schema_type.model_fields))
+
+    def _rows_to_schemas(self, rows: Sequence[Sequence[Any]]) -> List[ReadSchemaType]:
+        """
+        Validate `_select_rows` tuples in one call, without attribute lookups.
+        """
+        fields = tuple(self.read_schema_type.model_fields)
+        return rows_adapter(self.read_schema_type).validate_python(
+            [dict(zip(fields, row)) for row in rows]
+        )
+
     async def create(self, create_object: CreateSchemaType) -> ReadSchemaType:
-        async with self._session as s, s.begin():
+        async with self._session_scope(begin=True) as s:
             statement = (
                 insert(self.model_type)
                 .values(**create_object.model_dump(exclude={"id"}))
@@ -76,8 +180,173 @@ class DatabaseRepositoryImpl(
                 raise ModelAlreadyExistsException(self.model_type, "some field")
             return self.read_schema_type.model_validate(model, from_attributes=True)
 
+    async def upsert_many(
+        self,
+        create_objects: Sequence[CreateSchemaType],
+        conflict_fields: Sequence[str],
+    ) -> List[ReadSchemaType]:
+        """
+        Insert or update all objects with one
+        INSERT ... ON CONFLICT (conflict_fields) DO UPDATE ... RETURNING statement.
+        Objects with the same conflict key are collapsed, the last one wins.
+        """
+        rows = {
+            tuple(row[field] for field in conflict_fields): row
+            for row in (obj.model_dump(exclude={"id"}) for obj in create_objects)
+        }
+        if not rows:
+            return []
+        async with self._session_scope(begin=True) as s:
+            statement = pg_insert(self.model_type).values(list(rows.values()))
+            statement = statement.on_conflict_do_update(
+                index_elements=list(conflict_fields),
+                set_={
+                    field: statement.excluded[field]
+                    for field in next(iter(rows.values()))
+                    if field not in conflict_fields
+                },
+            ).returning(self.model_type)
+            models = (await s.execute(statement)).scalars().all()
+            return [
+                self.read_schema_type.model_validate(model, from_attributes=True)
+                for model in models
+            ]
+
+    async def get_or_create_many(
+        self,
+        create_objects: Sequence[CreateSchemaType],
+        conflict_fields: Sequence[str],
+    ) -> List[Tuple[ReadSchemaType, bool]]:
+        """
+        Insert missing objects and return existing ones, as (row, created) pairs
+        in the order of `create_objects`. Objects with the same conflict key
+        are collapsed, the first one wins.
+
+        INSERT ... ON CONFLICT DO NOTHING RETURNING gives the created rows
+        (concurrent inserts of the same key wait for each other instead of
+        failing), one SELECT the existing ones. Existing rows are not written.
+        """
+        rows: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        for row in (obj.model_dump(exclude={"id"}) for obj in create_objects):
+            rows.setdefault(tuple(row[field] for field in conflict_fields), row)
+        if not rows:
+            return []
+        columns = self.model_type.__table__.c
+        async with self._session_scope(begin=True) as s:
+            statement = (
+                pg_insert(self.model_type)
+                .values(list(rows.values()))
+                .on_conflict_do_nothing(index_elements=list(conflict_fields))
+                .returning(*self._select_rows().selected_columns)
+            )
+            found = {
+                tuple(getattr(schema, field) for field in conflict_fields): (schema, True)
+                for schema in self._rows_to_schemas((await s.execute(statement)).all())
+            }
+            missing = [key for key in rows if key not in found]
+            if missing:
+                # Conflicting rows are committed, so this new statement sees them
+                query = self._select_rows().where(
+                    tuple_(*(columns[field] for field in conflict_fields)).in_(missing)
+                )
+                for schema in self._rows_to_schemas((await s.execute(query)).all()):
+                    key = tuple(getattr(schema, field) for field in conflict_fields)
+                    found[key] = (schema, False)
+        # Rows deleted in between are left out
+        return [found[key] for key in rows if key in found]
+
+    async def bulk_load(
+        self,
+        create_objects: Iterable[CreateSchemaType] | AsyncIterable[CreateSchemaType],
+        conflict_fields: Sequence[str],
+        on_conflict: Literal["update", "nothing"] = "update",
+    ) -> BulkLoadReport:
+        """
+        Load any number of objects in one transaction: COPY them into a temporary
+        staging table, then merge it with one INSERT ... SELECT ... ON CONFLICT.
+        Objects are streamed to COPY, so memory use doesn't depend on their count.
+        Objects with the same conflict key are collapsed, the last one wins.
+        """
+        table = self.model_type.__table__
+        # Everything but autoincrement primary key
+        columns = [
+            column.name
+            for column in table.columns
+            if column is not table.autoincrement_column
+        ]
+        staging = f"_bulk_load_{table.name}"
+        column_list = ", ".join(columns)
+        conflict_list = ", ".join(conflict_fields)
+        if on_conflict == "update":
+            conflict_action = "DO UPDATE SET " + ", ".join(
+                f"{column} = EXCLUDED.{column}"
+                for column in columns
+                if column not in conflict_fields
+            )
+        else:
+            conflict_action = "DO NOTHING"
+
+        started = time.perf_counter()
+        loaded = 0
+
+        async def records() -> AsyncIterator[Tuple[Any, ...]]:
+            nonlocal loaded
+            if isinstance(create_objects, AsyncIterable):
+                async for obj in create_objects:
+                    loaded += 1
+                    yield (loaded, *(getattr(obj, column) for column in columns))
+            else:
+                for obj in create_objects:
+                    loaded += 1
+                    yield (loaded, *(getattr(obj, column) for column in columns))
+
+        async with self._session_scope(begin=True) as s:
+            # Staging table has target column types but no constraints or indexes
+            await s.execute(text(f"DROP TABLE IF EXISTS {staging}"))
+            await s.execute(
+                text(
+                    f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS "
+                    f"SELECT 0::bigint AS _row, {column_list} FROM {table.name} WITH NO DATA"
+                )
+            )
+            connection = await (await s.connection()).get_raw_connection()
+            await connection.driver_connection.copy_records_to_table(
+                staging,
+                records=records(),
+                columns=["_row", *columns],
+            )
+            merged = await s.execute(
+                text(
+                    f"WITH merged AS ("
+                    f"INSERT INTO {table.name} ({column_list}) "
+                    f"SELECT DISTINCT ON ({conflict_list}) {column_list} FROM {staging} "
+                    f"ORDER BY {conflict_list}, _row DESC "
+                    f"ON CONFLICT ({conflict_list}) {conflict_action} "
+                    f"RETURNING xmax = 0 AS inserted"
+                    f") SELECT count(*) FILTER (WHERE inserted), count(*) FROM merged"
+                )
+            )
+            inserted, total = merged.one()
+            await s.execute(text(f"DROP TABLE {staging}"))
+
+        report = BulkLoadReport(
+            loaded=loaded,
+            inserted=inserted,
+            updated=total - inserted,
+            seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            "Bulk loaded %d rows into %s (%d inserted, %d updated) at %.0f rows/s",
+            report.loaded,
+            table.name,
+            report.inserted,
+            report.updated,
+            report.rows_per_second,
+        )
+        return report
+
     async def update(self, update_object: UpdateSchemaType) -> ReadSchemaType:
-        async with self._session as s, s.begin():
+        async with self._session_scope(begin=True) as s:
             pk = update_object.id
             statement = (
                 update(self.model_type)
@@ -91,7 +360,7 @@ class DatabaseRepositoryImpl(
             return self.read_schema_type.model_validate(model, from_attributes=True)
 
     async def delete(self, object_id: uuid.UUID | int) -> bool:
-        async with self._session as s, s.begin():
+        async with self._session_scope(begin=True) as s:
             statement = delete(self.model_type).where(self.model_type.id == object_id)
             await s.execute(statement)
             return True
@@ -0,0 +1,74 @@
+import hashlib
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Optional
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from src.core.schemas.http_schemas import ResponseSchema
+
+
+class NDJSONResponse(StreamingResponse):
+    media_type = "application/x-ndjson"
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response of already validated models (or lists of them), serialized
+    once, straight to bytes by pydantic-core, with serialization aliases.
+
+    Returned from a route it skips FastAPI's response model validation
+    and `jsonable_encoder` pass; keep `response_model` on the route for docs.
+    Response schemas reuse the JSON they already rendered (e.g. cached results).
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, ResponseSchema):
+            return content.json_bytes()
+        return to_json(content, by_alias=True)
+
+
+async def iter_ndjson(
+    items: AsyncIterator[BaseModel],
+    chunk_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """
+    Serialize models to newline-delimited JSON, `chunk_size` lines per chunk.
+
+    Only one chunk is held in memory, and the source iterator is closed
+    even if the client disconnects mid-stream.
+    """
+    lines = []
+    async with aclosing(items):
+        async for item in items:
+            lines.append(item.model_dump_json(by_alias=True).encode())
+            if len(lines) >= chunk_size:
+                yield b"\n".join(lines) + b"\n"
+                lines.clear()
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Weak validator of a response built from `parts` (data version, query...).
+    Weak, because equal content may be encoded differently (e.g. compressed).
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    `If-None-Match` check with weak comparison, as HTTP requires for it.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque_tag
+        for tag in if_none_match.split(",")
+    )
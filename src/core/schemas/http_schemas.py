@@ -1,5 +1,6 @@
 from pydantic import AliasGenerator, BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
+from pydantic_core import to_json
 
 
 class RequestSchema(BaseModel):
@@ -25,6 +26,23 @@ class ResponseSchema(BaseModel):
         )
     )
 
+    # Rendered body: a plain slot, not a field or private attribute, so it
+    # takes no part in validation, comparison or copies
+    __slots__ = ("_json_body",)
+
+    def json_bytes(self) -> bytes:
+        """
+        Response body: JSON with serialization aliases, serialized on the first
+        call only. Shared (e.g. cached) instances are serialized once for all
+        requests, so don't mutate an instance after it was rendered.
+        """
+        try:
+            return self._json_body
+        except AttributeError:
+            body = to_json(self, by_alias=True)
+            object.__setattr__(self, "_json_body", body)
+            return body
+
 
 class OKResponseSchema(BaseModel):
     """
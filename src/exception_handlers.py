@@ -0,0 +1,80 @@
+import logging
+import math
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.core.exceptions.http_exceptions import (
+    UpstreamUnavailableException,
+    CircuitOpenException,
+    RateLimitExceededException,
+)
+from src.core.exceptions.pagination_exceptions import InvalidCursorException
+
+logger = logging.getLogger(__name__)
+
+
+async def upstream_unavailable_handler(
+    request: Request,
+    exc: UpstreamUnavailableException,
+) -> JSONResponse:
+    """
+    Upstream service failures are answered with 503 Service Unavailable.
+    """
+    if not isinstance(exc, CircuitOpenException):
+        logger.warning("Upstream call failed: %s", exc)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+    )
+
+
+async def rate_limit_exceeded_handler(
+    request: Request,
+    exc: RateLimitExceededException,
+) -> JSONResponse:
+    """
+    Calls shed by client-side rate limiters are answered with 429 Too Many Requests.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
+
+async def pool_timeout_handler(
+    request: Request,
+    exc: PoolTimeoutError,
+) -> JSONResponse:
+    """
+    No free database connection within pool timeout: 503 instead of queueing further.
+    """
+    logger.warning("Database pool exhausted: %s", exc)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database is overloaded, try again later."},
+        headers={"Retry-After": "1"},
+    )
+
+
+async def invalid_cursor_handler(
+    request: Request,
+    exc: InvalidCursorException,
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)},
+    )
+
+
+def apply_exception_handlers(app: FastAPI) -> FastAPI:
+    """
+    Applies exception handlers to FastAPI application.
+    """
+    app.add_exception_handler(UpstreamUnavailableException, upstream_unavailable_handler)
+    app.add_exception_handler(RateLimitExceededException, rate_limit_exceeded_handler)
+    app.add_exception_handler(InvalidCursorException, invalid_cursor_handler)
+    app.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+    return app
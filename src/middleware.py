@@ -1,12 +1,18 @@
+import math
 import time
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Optional
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.core.compression import CompressionMiddleware
+from src.core.database.routing import client_writes_scope
 from src.settings import settings
 
+# Time of the client's last committed write, keeps its reads on the primary
+LAST_WRITE_COOKIE = "last_write_at"
+
 
 async def calc_process_time(
     request: Request,
@@ -22,11 +28,52 @@ async def calc_process_time(
     return response
 
 
+async def read_your_writes(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """
+    Read-your-writes per client: the time of its last committed write travels
+    in a cookie, so its reads (on any app process) stay on the primary for
+    `DB__READ_YOUR_WRITES_SECONDS`, while other clients keep using replicas.
+    """
+    with client_writes_scope(_parse_time(request.cookies.get(LAST_WRITE_COOKIE))) as writes:
+        response = await call_next(request)
+    if writes.written:
+        response.set_cookie(
+            LAST_WRITE_COOKIE,
+            f"{writes.last_write_at:.3f}",
+            max_age=math.ceil(settings.db.read_your_writes_seconds),
+            httponly=True,
+            samesite="lax",
+        )
+    return response
+
+
+def _parse_time(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
 def apply_middleware(app: FastAPI) -> FastAPI:
     """
     Applies middlewares to FastAPI application.
     Notice: Last added middleware will be called first.
     """
+    if settings.compression.enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression.minimum_size,
+            levels={
+                "zstd": settings.compression.zstd_level,
+                "br": settings.compression.brotli_level,
+                "gzip": settings.compression.gzip_level,
+            },
+        )
+    if settings.db.replica_dsns:
+        app.add_middleware(BaseHTTPMiddleware, dispatch=read_your_writes)
     app.add_middleware(BaseHTTPMiddleware, dispatch=calc_process_time)
     app.add_middleware(
         CORSMiddleware,
@@ -2,6 +2,7 @@ from fastapi import FastAPI, APIRouter
 from src.settings import settings
 
 from src.apps.superheroes.router import router as superheroes_router
+from src.apps.monitoring.router import router as monitoring_router
 
 
 def apply_routes(app: FastAPI) -> FastAPI:
@@ -9,6 +10,8 @@ def apply_routes(app: FastAPI) -> FastAPI:
     router = APIRouter(prefix=settings.api.prefix)
     # Include API routers
     router.include_router(superheroes_router)
+    if settings.monitoring.enabled:
+        router.include_router(monitoring_router)
     # Include main router
     app.include_router(router)
     return app
@@ -1,4 +1,6 @@
+import tempfile
 from pathlib import Path
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,6 +16,13 @@ class RunConfig(BaseModel):
 
 class APIConfig(BaseModel):
     prefix: str = "/api"
+    default_page_size: int = 50
+    max_page_size: int = 500
+    # Rows per server-side cursor fetch and per NDJSON chunk of streamed listings
+    stream_chunk_size: int = 1000
+    # Cache-Control of hero listings. They carry an ETag, so "no-cache" lets
+    # clients and CDNs store them and revalidate with a cheap 304
+    hero_cache_control: str = "public, no-cache"
 
 
 class DatabaseConfig(BaseModel):
@@ -23,6 +32,29 @@ class DatabaseConfig(BaseModel):
     password: str
     name: str
     provider: str = "postgresql+asyncpg"
+    # Connection pool, per engine and per worker process:
+    # workers * (pool_size + max_overflow) must fit into Postgres max_connections
+    pool_size: int = 10
+    max_overflow: int = 5
+    # Seconds to wait for a free connection before answering 503
+    pool_timeout: float = 5.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    # SQLAlchemy compiled statements cache (per engine)
+    query_cache_size: int = 500
+    # asyncpg prepared statements cache (per connection)
+    prepared_statement_cache_size: int = 500
+    # Filter query shapes kept by the superheroes repository
+    filter_statement_cache_size: int = 256
+    # Superheroes query results cache, 0 disables it. Dropped on writes of this
+    # process; the TTL bounds staleness from writes of other processes
+    result_cache_max_bytes: int = 16 * 1024 * 1024
+    result_cache_ttl: float = 5.0
+    # Read replicas, full DSNs. Read-only sessions go to the primary if empty
+    replica_dsns: List[str] = []
+    replica_routing: Literal["round_robin", "least_loaded"] = "round_robin"
+    # Reads of a client go to the primary for this long after its committed write
+    read_your_writes_seconds: float = 5.0
 
     @property
     def dsn(self) -> str:
@@ -32,12 +64,83 @@ class DatabaseConfig(BaseModel):
 class SuperHeroApiConfig(BaseModel):
     api_url: str = "https://superheroapi.com/api"
     access_token: str
+    # HTTP client (connection pool & timeouts, seconds)
+    connect_timeout: float = 3.0
+    read_timeout: float = 10.0
+    total_timeout: float = 15.0
+    connection_limit: int = 100
+    limit_per_host: int = 20
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    # Cache of names unknown to the API (seconds)
+    negative_cache_size: int = 10_000
+    negative_cache_ttl: float = 3600.0
+    # Retries & circuit breaker
+    max_retries: int = 2
+    retry_backoff_base: float = 0.1
+    retry_backoff_max: float = 1.0
+    retry_budget_ratio: float = 0.2
+    retry_budget_capacity: float = 10.0
+    breaker_failure_rate: float = 0.5
+    breaker_minimum_calls: int = 20
+    breaker_window_size: int = 50
+    breaker_open_seconds: float = 30.0
+    breaker_half_open_calls: int = 3
+    # Client-side rate limit (token bucket, 0 rate disables it)
+    rate_limit_per_second: float = 10.0
+    rate_limit_burst: float = 20.0
+    rate_limit_max_wait: float = 2.0
+    rate_limit_backend: Literal["memory", "file"] = "memory"
+    rate_limit_file: Path = Path(tempfile.gettempdir()) / "superhero_api.bucket"
+    # Hedged requests (opt-in)
+    hedge_enabled: bool = False
+    hedge_percentile: float = 95.0
+    hedge_min_delay: float = 0.05
+    hedge_initial_delay: float = 0.5
+    hedge_window_size: int = 200
+    hedge_min_samples: int = 20
+    # Persistent response cache: "off", "read_write" or "replay" (offline)
+    response_cache_mode: Literal["off", "read_write", "replay"] = "off"
+    response_cache_path: Path = BASE_DIR / ".cache" / "superhero_api.sqlite3"
+    response_cache_ttl: float = 86_400.0
+    response_cache_stale_ttl: float = 7 * 86_400.0
+    # Bulk import
+    bulk_concurrency: int = 10
+    bulk_max_names: int = 500
 
     @property
     def url(self) -> str:
         return f"{self.api_url}/{self.access_token}"
 
 
+class CompressionConfig(BaseModel):
+    enabled: bool = True
+    # Smaller bodies are sent as is: compressing them costs more than it saves
+    minimum_size: int = 1024
+    # Low/medium levels: most of the ratio on repetitive JSON at a fraction of CPU
+    zstd_level: int = 3
+    brotli_level: int = 4
+    gzip_level: int = 6
+
+
+class ReadModelConfig(BaseModel):
+    # In-memory columnar copy of `superheroes` for GET /hero (needs numpy)
+    enabled: bool = False
+    # Postgres NOTIFY channel fed by the table triggers
+    notify_channel: str = "superheroes_changes"
+    # Seconds between version checks against the DB
+    consistency_check_interval: float = 30.0
+
+
+class MonitoringConfig(BaseModel):
+    # GET /monitoring/metrics shows internals (pools, caches, upstream state):
+    # not routed unless enabled
+    enabled: bool = False
+    # When set, the endpoint requires "Authorization: Bearer <token>". Leave
+    # unset only if the API is reachable from the internal network alone
+    token: Optional[str] = None
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         case_sensitive=False,
@@ -53,6 +156,9 @@ class Settings(BaseSettings):
     api: APIConfig = APIConfig()
     db: DatabaseConfig
     sh_api: SuperHeroApiConfig
+    compression: CompressionConfig = CompressionConfig()
+    read_model: ReadModelConfig = ReadModelConfig()
+    monitoring: MonitoringConfig = MonitoringConfig()
 
 
 settings = Settings()
\ No newline at end of file
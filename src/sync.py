@@ -0,0 +1,210 @@
+"""
+Mirror the SuperHero API catalog into the `superheroes` table.
+
+Crawls the API by hero id with bounded parallelism and rate limiting,
+bulk-upserts every batch and stores a resume checkpoint after it.
+
+Usage:
+    python -m src.sync [--start-id 1] [--end-id 731] [--concurrency 8] [--rate 10]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.settings import settings
+from src.logs import setup_logging
+from src.core.database.db_provider import db_provider
+from src.core.http.client_provider import sh_api_client_provider
+from src.core.http.rate_limit import TokenBucket
+from src.apps.superheroes.repositories.superheroes import (
+    SuperheroesRepositoryProtocol,
+    SuperheroesRepositoryImpl,
+)
+from src.apps.superheroes.services.superhero_api import (
+    SuperHeroApiServiceProtocol,
+    SuperHeroApiServiceImpl,
+)
+from src.apps.superheroes.schemas.superheroes import SuperheroCreateSchema
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT = settings.base_dir / ".sync_checkpoint.json"
+
+
+class SyncCheckpoint:
+    """
+    JSON resume checkpoint: next hero id to crawl and rows synced so far.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.next_id: Optional[int] = None
+        self.synced = 0
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        data = json.loads(self.path.read_text())
+        self.next_id = data.get("next_id")
+        self.synced = data.get("synced", 0)
+
+    def save(self, next_id: int) -> None:
+        self.next_id = next_id
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"next_id": next_id, "synced": self.synced}))
+        tmp_path.replace(self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+        self.next_id = None
+        self.synced = 0
+
+
+class CatalogSync:
+    def __init__(
+        self,
+        api_service: SuperHeroApiServiceProtocol,
+        repository: SuperheroesRepositoryProtocol,
+        checkpoint: SyncCheckpoint,
+        concurrency: int = 8,
+        batch_size: int = 50,
+    ) -> None:
+        self.api_service = api_service
+        self.repository = repository
+        self.checkpoint = checkpoint
+        self.batch_size = batch_size
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(
+        self,
+        start_id: int = 1,
+        end_id: Optional[int] = None,
+        max_misses: int = 20,
+    ) -> int:
+        """
+        Crawl ids from checkpoint (or `start_id`) until `end_id`
+        or `max_misses` consecutive unknown ids. Returns synced rows count.
+        """
+        hero_id = self.checkpoint.next_id or start_id
+        misses = 0
+        # Checkpoint counts previous runs too, the rate is of this one
+        run_synced = 0
+        started = time.perf_counter()
+        logger.info("Start catalog sync from id %d", hero_id)
+
+        while end_id is None or hero_id <= end_id:
+            last_id = hero_id + self.batch_size - 1
+            if end_id is not None:
+                last_id = min(last_id, end_id)
+            ids = list(range(hero_id, last_id + 1))
+
+            # Errors abort the batch, so a rerun resumes from it
+            heroes = await asyncio.gather(*(self._fetch(i) for i in ids))
+
+            batch: Dict[str, SuperheroCreateSchema] = {}
+            for hero in heroes:
+                if hero is None:
+                    misses += 1
+                    continue
+                misses = 0
+                # API catalog has duplicate names, keep the latest id
+                batch[hero.name] = hero
+
+            if batch:
+                await self.repository.upsert_many(
+                    list(batch.values()), conflict_fields=("name",)
+                )
+            run_synced += len(batch)
+            self.checkpoint.synced += len(batch)
+            self.checkpoint.save(next_id=last_id + 1)
+            logger.info(
+                "Synced ids %d-%d: %d heroes (%.1f heroes/s)",
+                hero_id,
+                last_id,
+                len(batch),
+                run_synced / (time.perf_counter() - started),
+            )
+
+            hero_id = last_id + 1
+            if misses >= max_misses:
+                logger.info("%d consecutive unknown ids, stop crawling", misses)
+                break
+
+        return self.checkpoint.synced
+
+    async def _fetch(self, hero_id: int) -> Optional[SuperheroCreateSchema]:
+        async with self._semaphore:
+            return await self.api_service.get_hero_by_id(hero_id)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--start-id", type=int, default=1)
+    parser.add_argument("--end-id", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=10.0, help="Requests/second, 0 disables the limit")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument(
+        "--max-misses",
+        type=int,
+        default=20,
+        help="Stop after this many consecutive unknown ids",
+    )
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT)
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore existing checkpoint and crawl from --start-id",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> None:
+    checkpoint = SyncCheckpoint(args.checkpoint)
+    if args.restart:
+        checkpoint.clear()
+    else:
+        checkpoint.load()
+
+    await sh_api_client_provider.startup()
+    try:
+        # Crawler never sheds calls, it waits for the rate limiter instead
+        rate_limiter = (
+            TokenBucket(
+                name=SuperHeroApiServiceImpl.service_name,
+                rate=args.rate,
+                capacity=1,
+                max_wait=float("inf"),
+            )
+            if args.rate > 0
+            else None
+        )
+        sync = CatalogSync(
+            api_service=SuperHeroApiServiceImpl(
+                session=sh_api_client_provider.session,
+                rate_limiter=rate_limiter,
+            ),
+            repository=SuperheroesRepositoryImpl(session=db_provider.session_factory()),
+            checkpoint=checkpoint,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+        )
+        synced = await sync.run(
+            start_id=args.start_id,
+            end_id=args.end_id,
+            max_misses=args.max_misses,
+        )
+        logger.info("Catalog sync finished: %d heroes", synced)
+    finally:
+        await sh_api_client_provider.dispose()
+        await db_provider.dispose()
+
+
+if __name__ == "__main__":
+    setup_logging(settings.base_dir)
+    asyncio.run(main(parse_args()))
@@ -1,9 +1,26 @@
 import pytest
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
 
+from src.apps.superheroes.repositories.superheroes import POWERSTAT_FIELDS
+from src.apps.superheroes.schemas.superheroes import SuperheroCreateSchema, SuperheroReadSchema
 from src.settings import settings
 
 
+def make_hero(
+    name: str,
+    hero_id: Optional[int] = None,
+    **powerstats: int,
+) -> Union[SuperheroCreateSchema, SuperheroReadSchema]:
+    """
+    Hero schema with powerstats of 50 unless given,
+    a read schema when `hero_id` is given, a create schema otherwise.
+    """
+    fields = {"name": name, **dict.fromkeys(POWERSTAT_FIELDS, 50), **powerstats}
+    if hero_id is None:
+        return SuperheroCreateSchema(**fields)
+    return SuperheroReadSchema(id=hero_id, **fields)
+
+
 @pytest.fixture
 def mock_superhero_response() -> Dict[str, Any]:
     """
@@ -32,7 +49,7 @@ def mock_not_found_response() -> Dict[str, Any]:
     """
     Mock API hero not found response.
     """
-    return {"response": "error", "error": "superhero not found"}
+    return {"response": "error", "error": "character with given name not found"}
 
 
 @pytest.fixture
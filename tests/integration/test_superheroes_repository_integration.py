@@ -104,7 +104,7 @@ async def test_filter_eq_single(session):
         combat_ge=None,
         combat_le=None,
     )
-    heroes = await repo.filter_all(filters)
+    heroes = (await repo.filter_all(filters)).items
     assert len(heroes) == 1
     assert heroes[0].name == "Flash"
 
@@ -167,7 +167,7 @@ async def test_filter_ge_le_range(session):
         combat_ge=None,
         combat_le=None,
     )
-    heroes = await repo.filter_all(filters)
+    heroes = (await repo.filter_all(filters)).items
     assert {h.name for h in heroes} == {"B"}
 
 
@@ -218,6 +218,226 @@ async def test_filter_multiple_fields(session):
         combat_ge=None,
         combat_le=None,
     )
-    heroes = await repo.filter_all(filters)
+    heroes = (await repo.filter_all(filters)).items
     assert len(heroes) == 1
-    assert heroes[0].name == "WonderWoman"
\ No newline at end of file
+    assert heroes[0].name == "WonderWoman"
+
+@pytest.mark.asyncio
+async def test_get_many_by_names(session):
+    repo = SuperheroesRepositoryImpl(session)
+    heroes = await repo.upsert_many(
+        [
+            SuperheroCreateSchema(
+                name=name,
+                intelligence=50,
+                strength=50,
+                speed=50,
+                durability=50,
+                power=50,
+                combat=50,
+            )
+            for name in ("Cyclops", "Storm", "Rogue")
+        ],
+        conflict_fields=("name",),
+    )
+    assert {h.name for h in heroes} == {"Cyclops", "Storm", "Rogue"}
+
+    found = await repo.get_many_by_names(["Storm", "Rogue", "Missing"])
+    assert {h.name for h in found} == {"Storm", "Rogue"}
+
+
+@pytest.mark.asyncio
+async def test_upsert_many(session):
+    repo = SuperheroesRepositoryImpl(session)
+    await repo.create(
+        SuperheroCreateSchema(
+            name="Hulk",
+            intelligence=10,
+            strength=10,
+            speed=10,
+            durability=10,
+            power=10,
+            combat=10,
+        )
+    )
+
+    saved = await repo.upsert_many(
+        [
+            SuperheroCreateSchema(
+                name=name,
+                intelligence=88,
+                strength=100,
+                speed=63,
+                durability=100,
+                power=98,
+                combat=85,
+            )
+            for name in ("Hulk", "She-Hulk", "Hulk")
+        ],
+        conflict_fields=("name",),
+    )
+    assert sorted(h.name for h in saved) == ["Hulk", "She-Hulk"]
+
+    hulk = await repo.get_by_name("Hulk")
+    assert hulk.strength == 100
+
+
+@pytest.mark.asyncio
+async def test_filter_keyset_pagination(session):
+    repo = SuperheroesRepositoryImpl(session)
+    await repo.upsert_many(
+        [
+            SuperheroCreateSchema(
+                name=f"Hero {i}",
+                intelligence=i % 3,
+                strength=50,
+                speed=50,
+                durability=50,
+                power=50,
+                combat=50,
+            )
+            for i in range(7)
+        ],
+        conflict_fields=("name",),
+    )
+
+    names = []
+    cursor = None
+    while True:
+        page = await repo.filter_all(
+            SuperheroQueryFilterSchema(
+                sort_by="intelligence",
+                limit=3,
+                cursor=cursor,
+                strength=50,
+            )
+        )
+        names.extend(h.name for h in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert names == [
+        "Hero 0", "Hero 3", "Hero 6", "Hero 1", "Hero 4", "Hero 2", "Hero 5"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_all(session):
+    repo = SuperheroesRepositoryImpl(session)
+    await repo.upsert_many(
+        [
+            SuperheroCreateSchema(
+                name=f"Streamed {i}",
+                intelligence=i,
+                strength=77,
+                speed=50,
+                durability=50,
+                power=50,
+                combat=50,
+            )
+            for i in range(10)
+        ],
+        conflict_fields=("name",),
+    )
+
+    filters = SuperheroQueryFilterSchema(
+        sort_by="intelligence",
+        limit=1,
+        strength=77,
+        intelligence_ge=2,
+    )
+    heroes = [hero async for hero in repo.stream_all(filters, chunk_size=3)]
+
+    # Page limit is ignored, rows are fetched in several chunks
+    assert [h.intelligence for h in heroes] == list(range(2, 10))
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_many_and_upsert_many(session):
+    repo = SuperheroesRepositoryImpl(session)
+    hero = SuperheroCreateSchema(
+        name="Cyborg",
+        intelligence=80,
+        strength=70,
+        speed=60,
+        durability=70,
+        power=75,
+        combat=65,
+    )
+
+    [(created, is_created)] = await repo.get_or_create_many([hero], conflict_fields=("name",))
+    [(existing, is_created_again)] = await repo.get_or_create_many(
+        [hero.model_copy(update={"strength": 1})],
+        conflict_fields=("name",),
+    )
+
+    assert is_created is True
+    assert is_created_again is False
+    # get_or_create_many keeps the stored row as is
+    assert existing == created
+
+    [updated] = await repo.upsert_many(
+        [hero.model_copy(update={"strength": 99})],
+        conflict_fields=("name",),
+    )
+    assert updated.id == created.id
+    assert updated.strength == 99
+
+    pairs = await repo.get_or_create_many(
+        [hero.model_copy(update={"name": "Raven"}), hero, hero],
+        conflict_fields=("name",),
+    )
+    # Input order, duplicates collapsed
+    assert [(h.name, c) for h, c in pairs] == [("Raven", True), ("Cyborg", False)]
+
+
+@pytest.mark.asyncio
+async def test_bulk_load(session):
+    repo = SuperheroesRepositoryImpl(session)
+    await repo.create(
+        SuperheroCreateSchema(
+            name="Loaded 0",
+            intelligence=1,
+            strength=1,
+            speed=1,
+            durability=1,
+            power=1,
+            combat=1,
+        )
+    )
+
+    def heroes():
+        for i in range(1000):
+            yield SuperheroCreateSchema(
+                name=f"Loaded {i}",
+                intelligence=i % 100,
+                strength=50,
+                speed=50,
+                durability=50,
+                power=50,
+                combat=50,
+            )
+        # Duplicate key, the last one wins
+        yield SuperheroCreateSchema(
+            name="Loaded 1",
+            intelligence=7,
+            strength=7,
+            speed=7,
+            durability=7,
+            power=7,
+            combat=7,
+        )
+
+    report = await repo.bulk_load(heroes(), conflict_fields=("name",))
+
+    assert report.loaded == 1001
+    assert report.inserted == 999
+    assert report.updated == 1
+    assert report.rows_per_second > 0
+    assert (await repo.get_by_name("Loaded 0")).strength == 50
+    assert (await repo.get_by_name("Loaded 1")).strength == 7
+
+    skipped = await repo.bulk_load(heroes(), conflict_fields=("name",), on_conflict="nothing")
+    assert skipped.inserted == 0
+    assert skipped.updated == 0
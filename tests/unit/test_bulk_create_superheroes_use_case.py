@@ -0,0 +1,111 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from src.apps.superheroes.use_cases.bulk_create import BulkCreateSuperheroesUseCaseImpl
+from src.apps.superheroes.schemas.superheroes import SuperheroImportStatus
+from tests.conftest import make_hero
+
+
+class TestBulkCreateSuperheroesUseCaseImpl:
+    @pytest.fixture
+    def superheroes_service(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def superhero_api_service(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def use_case(
+        self,
+        superheroes_service: AsyncMock,
+        superhero_api_service: AsyncMock,
+    ) -> BulkCreateSuperheroesUseCaseImpl:
+        return BulkCreateSuperheroesUseCaseImpl(
+            superheroes_service=superheroes_service,
+            superhero_api_service=superhero_api_service,
+            max_concurrency=2,
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_all_exist(
+        self,
+        use_case: BulkCreateSuperheroesUseCaseImpl,
+        superheroes_service: AsyncMock,
+        superhero_api_service: AsyncMock,
+    ):
+        superheroes_service.find_heroes_by_names.return_value = [
+            make_hero("Batman", 1),
+            make_hero("Superman", 2),
+        ]
+
+        result = await use_case.execute(["Batman", "Superman", "Batman"])
+
+        assert [(r.name, r.status) for r in result] == [
+            ("Batman", SuperheroImportStatus.EXISTS),
+            ("Superman", SuperheroImportStatus.EXISTS),
+        ]
+        superheroes_service.find_heroes_by_names.assert_awaited_once_with(
+            ["Batman", "Superman"]
+        )
+        superhero_api_service.get_hero_by_name.assert_not_awaited()
+        superheroes_service.get_or_create_heroes.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_execute_mixed(
+        self,
+        use_case: BulkCreateSuperheroesUseCaseImpl,
+        superheroes_service: AsyncMock,
+        superhero_api_service: AsyncMock,
+    ):
+        superheroes_service.find_heroes_by_names.return_value = [
+            make_hero("Batman", 1),
+        ]
+
+        async def get_hero_by_name(name: str):
+            if name == "Flash":
+                return make_hero("Flash")
+            if name == "Broken":
+                raise RuntimeError("upstream error")
+            return None
+
+        superhero_api_service.get_hero_by_name.side_effect = get_hero_by_name
+        superheroes_service.get_or_create_heroes.return_value = [
+            (make_hero("Flash", 3), True)
+        ]
+
+        result = await use_case.execute(["Batman", "Flash", "Unknown", "Broken"])
+
+        assert [(r.name, r.status) for r in result] == [
+            ("Batman", SuperheroImportStatus.EXISTS),
+            ("Flash", SuperheroImportStatus.CREATED),
+            ("Unknown", SuperheroImportStatus.NOT_FOUND),
+            ("Broken", SuperheroImportStatus.FAILED),
+        ]
+        assert result[1].hero.id == 3
+        assert superhero_api_service.get_hero_by_name.await_count == 3
+        superheroes_service.get_or_create_heroes.assert_awaited_once_with(
+            [make_hero("Flash")]
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_created_concurrently(
+        self,
+        use_case: BulkCreateSuperheroesUseCaseImpl,
+        superheroes_service: AsyncMock,
+        superhero_api_service: AsyncMock,
+    ):
+        superheroes_service.find_heroes_by_names.return_value = []
+        superhero_api_service.get_hero_by_name.side_effect = make_hero
+        # Robin was saved by another request between the lookup and the insert
+        superheroes_service.get_or_create_heroes.return_value = [
+            (make_hero("Robin", 4), False),
+            (make_hero("Flash", 5), True),
+        ]
+
+        result = await use_case.execute(["Robin", "Flash"])
+
+        assert [(r.name, r.status, r.hero.id) for r in result] == [
+            ("Robin", SuperheroImportStatus.EXISTS, 4),
+            ("Flash", SuperheroImportStatus.CREATED, 5),
+        ]
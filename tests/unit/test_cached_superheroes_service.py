@@ -0,0 +1,135 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.cache.result_cache import VersionedLRUCache
+from src.apps.superheroes.services.superheroes import (
+    CachedSuperheroesServiceImpl,
+    filters_cache_key,
+)
+from src.apps.superheroes.schemas.superheroes import (
+    SuperheroReadSchema,
+    SuperheroQueryFilterSchema,
+    SuperheroPageSchema,
+)
+
+
+class TestCachedSuperheroesServiceImpl:
+    @pytest.fixture
+    def delegate(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def version(self) -> list:
+        return [1]
+
+    @pytest.fixture
+    def service(self, delegate: AsyncMock, version: list) -> CachedSuperheroesServiceImpl:
+        return CachedSuperheroesServiceImpl(
+            service=delegate,
+            cache=VersionedLRUCache(max_bytes=10_000),
+            version=lambda: version[0],
+        )
+
+    @pytest.fixture
+    def hero(self) -> SuperheroReadSchema:
+        return SuperheroReadSchema(
+            id=1,
+            name="Batman",
+            intelligence=100,
+            strength=85,
+            speed=65,
+            durability=85,
+            power=80,
+            combat=90,
+        )
+
+    def test_filters_cache_key_is_canonical(self):
+        assert filters_cache_key(
+            SuperheroQueryFilterSchema(strength=5, strength_ge=1, speed_le=9)
+        ) == filters_cache_key(SuperheroQueryFilterSchema(speed_le=9, strength=5))
+        assert filters_cache_key(SuperheroQueryFilterSchema(limit=10)) != filters_cache_key(
+            SuperheroQueryFilterSchema(limit=20)
+        )
+
+    @pytest.mark.asyncio
+    async def test_filter_heroes_cached_until_version_changes(
+        self,
+        service: CachedSuperheroesServiceImpl,
+        delegate: AsyncMock,
+        version: list,
+        hero: SuperheroReadSchema,
+    ):
+        page = SuperheroPageSchema(items=[hero])
+        delegate.filter_heroes.return_value = page
+
+        assert await service.filter_heroes(SuperheroQueryFilterSchema(power=80)) is page
+        assert await service.filter_heroes(SuperheroQueryFilterSchema(power=80)) is page
+        delegate.filter_heroes.assert_awaited_once()
+
+        version[0] += 1
+        await service.filter_heroes(SuperheroQueryFilterSchema(power=80))
+        assert delegate.filter_heroes.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_result_serialized_once(
+        self,
+        service: CachedSuperheroesServiceImpl,
+        delegate: AsyncMock,
+        hero: SuperheroReadSchema,
+    ):
+        page = SuperheroPageSchema(items=[hero])
+        delegate.filter_heroes.return_value = page
+
+        await service.filter_heroes(SuperheroQueryFilterSchema(power=80))
+        body = page.json_bytes()
+        cached = await service.filter_heroes(SuperheroQueryFilterSchema(power=80))
+
+        # Measured by its response body, which hits reuse
+        assert cached.json_bytes() is body
+        assert service.cache.stats()["bytes"] == len(body)
+
+    @pytest.mark.asyncio
+    async def test_not_found_cached(
+        self,
+        service: CachedSuperheroesServiceImpl,
+        delegate: AsyncMock,
+    ):
+        delegate.find_hero_by_name.return_value = None
+
+        assert await service.find_hero_by_name("Nobody") is None
+        assert await service.find_hero_by_name("Nobody") is None
+        delegate.find_hero_by_name.assert_awaited_once_with("Nobody")
+
+    @pytest.mark.asyncio
+    async def test_writes_not_cached(
+        self,
+        service: CachedSuperheroesServiceImpl,
+        delegate: AsyncMock,
+        hero: SuperheroReadSchema,
+    ):
+        delegate.upsert_heroes.return_value = [hero]
+        await service.upsert_heroes([])
+        await service.upsert_heroes([])
+        assert delegate.upsert_heroes.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_tied_to_data_version(
+        self,
+        service: CachedSuperheroesServiceImpl,
+        delegate: AsyncMock,
+        hero: SuperheroReadSchema,
+    ):
+        delegate.find_hero_by_name.return_value = hero
+        delegate.get_version.return_value = 10
+
+        assert await service.get_version() == 10
+        await service.find_hero_by_name("Batman")
+        await service.find_hero_by_name("Batman")
+        delegate.find_hero_by_name.assert_awaited_once()
+
+        # Written by another process: local counter is unchanged, DB version is not
+        delegate.get_version.return_value = 11
+        await service.get_version()
+        await service.find_hero_by_name("Batman")
+        assert delegate.find_hero_by_name.await_count == 2
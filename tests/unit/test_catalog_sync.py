@@ -0,0 +1,99 @@
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from src.sync import CatalogSync, SyncCheckpoint
+from tests.conftest import make_hero
+
+
+class TestCatalogSync:
+    @pytest.fixture
+    def api_service(self) -> AsyncMock:
+        catalog = {1: "A-Bomb", 2: "Abe Sapien", 3: "Batman", 4: "Batman", 5: "Flash"}
+        service = AsyncMock()
+        service.get_hero_by_id.side_effect = lambda hero_id: (
+            make_hero(catalog[hero_id]) if hero_id in catalog else None
+        )
+        return service
+
+    @pytest.fixture
+    def repository(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def checkpoint(self, tmp_path: Path) -> SyncCheckpoint:
+        return SyncCheckpoint(tmp_path / "checkpoint.json")
+
+    @pytest.mark.asyncio
+    async def test_run_upserts_batches_and_saves_checkpoint(
+        self,
+        api_service: AsyncMock,
+        repository: AsyncMock,
+        checkpoint: SyncCheckpoint,
+    ):
+        sync = CatalogSync(
+            api_service=api_service,
+            repository=repository,
+            checkpoint=checkpoint,
+            batch_size=5,
+        )
+
+        synced = await sync.run(start_id=1, max_misses=3)
+
+        # Duplicate "Batman" is collapsed inside a batch
+        assert synced == 4
+        repository.upsert_many.assert_awaited_once()
+        batch = repository.upsert_many.await_args.args[0]
+        assert [h.name for h in batch] == ["A-Bomb", "Abe Sapien", "Batman", "Flash"]
+
+        restored = SyncCheckpoint(checkpoint.path)
+        restored.load()
+        assert restored.next_id == 11
+        assert restored.synced == 4
+
+    @pytest.mark.asyncio
+    async def test_run_resumes_from_checkpoint(
+        self,
+        api_service: AsyncMock,
+        repository: AsyncMock,
+        checkpoint: SyncCheckpoint,
+    ):
+        checkpoint.save(next_id=5)
+        sync = CatalogSync(
+            api_service=api_service,
+            repository=repository,
+            checkpoint=checkpoint,
+            batch_size=10,
+        )
+
+        await sync.run(start_id=1, end_id=5)
+
+        api_service.get_hero_by_id.assert_awaited_once_with(5)
+        assert checkpoint.next_id == 6
+
+    @pytest.mark.asyncio
+    async def test_rate_counts_only_this_run(
+        self,
+        api_service: AsyncMock,
+        repository: AsyncMock,
+        checkpoint: SyncCheckpoint,
+        monkeypatch,
+        caplog,
+    ):
+        checkpoint.synced = 1000
+        checkpoint.save(next_id=5)
+        clock = iter([0.0, 2.0])
+        monkeypatch.setattr("src.sync.time.perf_counter", lambda: next(clock))
+        sync = CatalogSync(
+            api_service=api_service,
+            repository=repository,
+            checkpoint=checkpoint,
+            batch_size=10,
+        )
+
+        with caplog.at_level("INFO", logger="src.sync"):
+            await sync.run(start_id=1, end_id=5)
+
+        assert checkpoint.synced == 1001
+        # One hero in 2 seconds, not 1001
+        assert "(0.5 heroes/s)" in caplog.text
@@ -0,0 +1,164 @@
+import random
+from typing import List
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.apps.superheroes.read_model.columnar import (
+    ColumnarSnapshotBuilder,
+    ColumnarSuperheroes,
+)
+from src.apps.superheroes.repositories.superheroes import POWERSTAT_FIELDS
+from src.apps.superheroes.schemas.superheroes import (
+    SuperheroReadSchema,
+    SuperheroQueryFilterSchema,
+)
+from src.core.exceptions.pagination_exceptions import InvalidCursorException
+from tests.conftest import make_hero
+
+
+def make_random_hero(hero_id: int, rng: random.Random) -> SuperheroReadSchema:
+    return make_hero(
+        f"hero-{hero_id}",
+        hero_id,
+        **{field: rng.randint(0, 10) for field in POWERSTAT_FIELDS},
+    )
+
+
+def reference_filter(
+    heroes: List[SuperheroReadSchema],
+    filters: SuperheroQueryFilterSchema,
+) -> List[SuperheroReadSchema]:
+    """
+    Every match in (sort_by, id) order, as the DB query returns it.
+    """
+    matches = []
+    for hero in heroes:
+        ok = True
+        for field in POWERSTAT_FIELDS:
+            value = getattr(hero, field)
+            eq = getattr(filters, field)
+            ge = getattr(filters, f"{field}_ge")
+            le = getattr(filters, f"{field}_le")
+            if eq is not None:
+                ok &= value == eq
+            else:
+                ok &= (ge is None or value >= ge) and (le is None or value <= le)
+        if ok:
+            matches.append(hero)
+    return sorted(matches, key=lambda h: (getattr(h, filters.sort_by), h.id))
+
+
+class TestColumnarSuperheroes:
+    @pytest.fixture
+    def heroes(self) -> List[SuperheroReadSchema]:
+        rng = random.Random(42)
+        # Ids with gaps and out of order, like after deletes and upserts
+        ids = rng.sample(range(1, 5000), 500)
+        return [make_random_hero(hero_id, rng) for hero_id in ids]
+
+    @pytest.fixture
+    def model(self, heroes: List[SuperheroReadSchema]) -> ColumnarSuperheroes:
+        model = ColumnarSuperheroes()
+        model.load([tuple(hero.model_dump().values()) for hero in heroes], version=7)
+        return model
+
+    def read_all(
+        self,
+        model: ColumnarSuperheroes,
+        filters: SuperheroQueryFilterSchema,
+    ) -> List[SuperheroReadSchema]:
+        items = []
+        page = model.filter(filters)
+        while page is not None:
+            items.extend(page.items)
+            if page.next_cursor is None:
+                break
+            filters = filters.model_copy(update={"cursor": page.next_cursor})
+            page = model.filter(filters)
+        return items
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {},
+            {"sort_by": "strength"},
+            {"strength_ge": 3, "speed_le": 6, "sort_by": "speed"},
+            {"combat": 5, "combat_ge": 9, "sort_by": "combat"},
+            {"intelligence_ge": 8, "intelligence_le": 2},
+            {"power": 100000},
+        ],
+    )
+    def test_filter_matches_db_semantics(
+        self,
+        model: ColumnarSuperheroes,
+        heroes: List[SuperheroReadSchema],
+        params: dict,
+    ):
+        filters = SuperheroQueryFilterSchema(limit=7, **params)
+        assert self.read_all(model, filters) == reference_filter(heroes, filters)
+
+    def test_empty_result(self, model: ColumnarSuperheroes):
+        assert model.filter(SuperheroQueryFilterSchema(strength=99)) is None
+
+    def test_not_loaded(self):
+        model = ColumnarSuperheroes()
+        assert not model.loaded
+        assert not model.supports(SuperheroQueryFilterSchema())
+
+    def test_name_sort_left_to_db(self, model: ColumnarSuperheroes):
+        assert model.supports(SuperheroQueryFilterSchema(sort_by="power"))
+        assert not model.supports(SuperheroQueryFilterSchema(sort_by="name"))
+
+    def test_foreign_cursor(self, model: ColumnarSuperheroes):
+        page = model.filter(SuperheroQueryFilterSchema(limit=2, sort_by="speed"))
+        with pytest.raises(InvalidCursorException):
+            model.filter(SuperheroQueryFilterSchema(sort_by="power", cursor=page.next_cursor))
+
+    def test_get_by_name(self, model: ColumnarSuperheroes, heroes: List[SuperheroReadSchema]):
+        assert model.get_by_name(heroes[10].name) == heroes[10]
+        assert model.get_by_name("nobody") is None
+
+    def test_upsert_and_delete(self, model: ColumnarSuperheroes, heroes: List[SuperheroReadSchema]):
+        changed = heroes[0].model_copy(update={"name": "renamed", "strength": 10_000})
+        added = make_random_hero(6000, random.Random(1))
+        model.upsert([changed, added], version=8)
+
+        assert model.version == 8
+        assert len(model) == len(heroes) + 1
+        assert model.get_by_name(heroes[0].name) is None
+        assert model.get_by_name("renamed") == changed
+        assert model.get_by_name(added.name) == added
+        top = model.filter(SuperheroQueryFilterSchema(strength_ge=10_000))
+        assert top.items == [changed]
+
+        model.delete([changed.id, 123456], version=9)
+        assert model.version == 9
+        assert len(model) == len(heroes)
+        assert model.get_by_name("renamed") is None
+        assert model.filter(SuperheroQueryFilterSchema(strength_ge=10_000)) is None
+        assert self.read_all(model, SuperheroQueryFilterSchema(limit=50)) == reference_filter(
+            heroes[1:] + [added], SuperheroQueryFilterSchema()
+        )
+
+    def test_stat_overflow(self, model: ColumnarSuperheroes, heroes: List[SuperheroReadSchema]):
+        with pytest.raises(ValueError):
+            model.upsert([heroes[0].model_copy(update={"power": 40_000})])
+
+    def test_snapshot_built_in_chunks(
+        self,
+        model: ColumnarSuperheroes,
+        heroes: List[SuperheroReadSchema],
+    ):
+        rows = [tuple(hero.model_dump().values()) for hero in reversed(heroes)]
+        builder = ColumnarSnapshotBuilder()
+        for start in range(0, len(rows), 700):
+            builder.add(rows[start : start + 700])
+        chunked = ColumnarSuperheroes()
+        chunked.swap(builder.build(), version=7)
+
+        filters = SuperheroQueryFilterSchema(sort_by="speed", speed_ge=3, limit=100)
+        assert len(chunked) == len(heroes)
+        assert self.read_all(chunked, filters) == self.read_all(model, filters)
+        assert chunked.get_by_name(heroes[3].name) == heroes[3]
@@ -0,0 +1,59 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.apps.superheroes.read_model.columnar import ColumnarSuperheroes
+from src.apps.superheroes.read_model.service import ColumnarSuperheroesServiceImpl
+from src.apps.superheroes.schemas.superheroes import SuperheroQueryFilterSchema
+from tests.conftest import make_hero
+
+
+class TestColumnarSuperheroesServiceImpl:
+    @pytest.fixture
+    def delegate(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def model(self) -> ColumnarSuperheroes:
+        model = ColumnarSuperheroes()
+        model.load([tuple(make_hero("Batman", 1).model_dump().values())], version=1)
+        return model
+
+    @pytest.mark.asyncio
+    async def test_reads_from_model(self, delegate: AsyncMock, model: ColumnarSuperheroes):
+        service = ColumnarSuperheroesServiceImpl(delegate, model)
+
+        page = await service.filter_heroes(SuperheroQueryFilterSchema(strength=50))
+        assert [hero.name for hero in page.items] == ["Batman"]
+        assert (await service.find_hero_by_name("Batman")).id == 1
+        delegate.filter_heroes.assert_not_awaited()
+        delegate.find_hero_by_name.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_db(self, delegate: AsyncMock, model: ColumnarSuperheroes):
+        service = ColumnarSuperheroesServiceImpl(delegate, model)
+        delegate.find_hero_by_name.return_value = None
+
+        assert await service.find_hero_by_name("Robin") is None
+        delegate.find_hero_by_name.assert_awaited_once_with("Robin")
+
+        filters = SuperheroQueryFilterSchema(sort_by="name")
+        await service.filter_heroes(filters)
+        delegate.filter_heroes.assert_awaited_once_with(filters)
+
+    @pytest.mark.asyncio
+    async def test_writes_left_to_notifications(
+        self,
+        delegate: AsyncMock,
+        model: ColumnarSuperheroes,
+    ):
+        service = ColumnarSuperheroesServiceImpl(delegate, model)
+        robin = make_hero("Robin", 2)
+        delegate.upsert_heroes.return_value = [robin]
+
+        assert await service.upsert_heroes([]) == [robin]
+        # Model and its version only move together
+        assert model.get_by_name("Robin") is None
+        assert await service.get_version() == 1
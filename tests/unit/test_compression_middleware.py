@@ -0,0 +1,133 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.core.compression import CompressionMiddleware, choose_encoding
+
+PAYLOAD = {"items": [{"name": f"hero-{i}", "power": i % 100} for i in range(500)]}
+
+
+class TestCompressionMiddleware:
+    @pytest.fixture
+    def client(self) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=500, encodings=["gzip"])
+
+        @app.get("/large")
+        async def large():
+            return JSONResponse(PAYLOAD)
+
+        @app.get("/small")
+        async def small():
+            return JSONResponse({"ok": True})
+
+        @app.get("/text-encoded")
+        async def already_encoded():
+            return PlainTextResponse("x" * 1000, headers={"Content-Encoding": "identity"})
+
+        @app.get("/stream")
+        async def stream():
+            async def lines():
+                for i in range(3):
+                    yield json.dumps({"i": i}).encode() + b"\n"
+
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+        return TestClient(app)
+
+    def test_large_body_compressed(self, client: TestClient):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        # httpx decodes transparently
+        assert response.json() == PAYLOAD
+        assert int(response.headers["Content-Length"]) < len(json.dumps(PAYLOAD))
+
+    def test_small_body_as_is(self, client: TestClient):
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.json() == {"ok": True}
+
+    def test_identity_and_encoded(self, client: TestClient):
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "Content-Encoding" not in response.headers
+        assert response.json() == PAYLOAD
+
+        response = client.get("/text-encoded", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "identity"
+
+    def test_stream_decoded(self, client: TestClient):
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        assert response.text.count("\n") == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_flushed_per_chunk(self):
+        async def lines():
+            for i in range(3):
+                yield json.dumps({"i": i}).encode() + b"\n"
+
+        # TestClient buffers streams, drive the ASGI app directly
+        middleware = CompressionMiddleware(
+            StreamingResponse(lines(), media_type="application/x-ndjson"),
+            encodings=["gzip"],
+        )
+        scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+        messages = []
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+
+        await middleware(scope, receive, send)
+
+        raw = [m["body"] for m in messages if m["type"] == "http.response.body"]
+        # Every chunk is decodable on arrival
+        decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        assert decoder.decompress(raw[0]) == b'{"i": 0}\n'
+        assert gzip.decompress(b"".join(raw)).splitlines() == [
+            b'{"i": 0}',
+            b'{"i": 1}',
+            b'{"i": 2}',
+        ]
+
+    def test_choose_encoding(self):
+        encodings = ["zstd", "br", "gzip"]
+        assert choose_encoding("gzip, deflate, br, zstd", encodings) == "zstd"
+        assert choose_encoding("gzip;q=1.0, br;q=0.5", encodings) == "br"
+        assert choose_encoding("zstd;q=0, gzip", encodings) == "gzip"
+        assert choose_encoding("*", ["gzip"]) == "gzip"
+        assert choose_encoding("*, gzip;q=0", ["gzip"]) is None
+        assert choose_encoding("", encodings) is None
+        assert choose_encoding("deflate", encodings) is None
+
+    @pytest.mark.parametrize("encoding, module", [("zstd", "zstandard"), ("br", "brotli")])
+    def test_optional_encodings(self, encoding: str, module: str):
+        codec = pytest.importorskip(module)
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, encodings=[encoding, "gzip"])
+
+        @app.get("/large")
+        async def large():
+            return JSONResponse(PAYLOAD)
+
+        with TestClient(app).stream(
+            "GET", "/large", headers={"Accept-Encoding": f"gzip, {encoding}"}
+        ) as response:
+            assert response.headers["Content-Encoding"] == encoding
+            raw = b"".join(response.iter_raw())
+
+        if encoding == "zstd":
+            body = codec.ZstdDecompressor().decompressobj().decompress(raw)
+        else:
+            body = codec.decompress(raw)
+        assert json.loads(body) == PAYLOAD
@@ -1,6 +1,10 @@
+import asyncio
+from typing import List
+
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
+from src.core.cache.ttl_cache import TTLCache
 from src.apps.superheroes.use_cases.create import CreateSuperheroUseCaseImpl
 from src.apps.superheroes.schemas.superheroes import (
     SuperheroCreateSchema,
@@ -51,8 +55,8 @@ class TestCreateSuperheroUseCaseImpl:
 
         assert result == db_hero
         superheroes_service.find_hero_by_name.assert_awaited_once_with(name="Batman")
-        superheroes_service.create_hero.assert_not_awaited()
-        use_case.superhero_api_service.get_hero_by_name.assert_not_awaited()
+        superheroes_service.upsert_heroes.assert_not_awaited()
+        use_case.superhero_api_service.search_heroes.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_execute_not_in_db_found_in_api(
@@ -72,7 +76,7 @@ class TestCreateSuperheroUseCaseImpl:
             power=100,
             combat=80,
         )
-        superhero_api_service.get_hero_by_name.return_value = api_schema
+        superhero_api_service.search_heroes.return_value = [api_schema]
 
         db_hero = SuperheroReadSchema(
             id=2,
@@ -84,14 +88,14 @@ class TestCreateSuperheroUseCaseImpl:
             power=100,
             combat=80,
         )
-        superheroes_service.create_hero.return_value = db_hero
+        superheroes_service.upsert_heroes.return_value = [db_hero]
 
         result = await use_case.execute(superhero_name="Superman")
 
         assert result == db_hero
         superheroes_service.find_hero_by_name.assert_awaited_once_with(name="Superman")
-        superhero_api_service.get_hero_by_name.assert_awaited_once_with(name="Superman")
-        superheroes_service.create_hero.assert_awaited_once_with(new_hero=api_schema)
+        superhero_api_service.search_heroes.assert_awaited_once_with(name="Superman")
+        superheroes_service.upsert_heroes.assert_awaited_once_with(new_heroes=[api_schema])
 
     @pytest.mark.asyncio
     async def test_execute_not_found_anywhere(
@@ -101,12 +105,169 @@ class TestCreateSuperheroUseCaseImpl:
         superhero_api_service: AsyncMock,
     ):
         superheroes_service.find_hero_by_name.return_value = None
-        superhero_api_service.get_hero_by_name.return_value = None
+        superhero_api_service.search_heroes.return_value = []
 
         with pytest.raises(HeroNotFoundException) as exc_info:
             await use_case.execute("Unknown")
 
         assert "Unknown" in str(exc_info.value)
         superheroes_service.find_hero_by_name.assert_awaited_once_with(name="Unknown")
-        superhero_api_service.get_hero_by_name.assert_awaited_once_with(name="Unknown")
-        superheroes_service.create_hero.assert_not_awaited()
+        superhero_api_service.search_heroes.assert_awaited_once_with(name="Unknown")
+        superheroes_service.upsert_heroes.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_execute_concurrent_same_name_coalesced(
+        self,
+        use_case: CreateSuperheroUseCaseImpl,
+        superheroes_service: AsyncMock,
+        superhero_api_service: AsyncMock,
+    ):
+        superheroes_service.find_hero_by_name.return_value = None
+
+        api_schema = SuperheroCreateSchema(
+            name="Batman",
+            intelligence=100,
+            strength=85,
+            speed=65,
+            durability=85,
+            power=80,
+            combat=90,
+        )
+
+        async def slow_api_call(name: str) -> List[SuperheroCreateSchema]:
+            await asyncio.sleep(0.01)
+            return [api_schema]
+
+        superhero_api_service.search_heroes.side_effect = slow_api_call
+        superheroes_service.upsert_heroes.return_value = [
+            SuperheroReadSchema(id=1, **api_schema.model_dump())
+        ]
+
+        results = await asyncio.gather(
+            use_case.execute("Batman"),
+            use_case.execute("batman "),
+            use_case.execute("BATMAN"),
+        )
+
+        assert {r.id for r in results} == {1}
+        superheroes_service.find_hero_by_name.assert_awaited_once_with(name="Batman")
+        superhero_api_service.search_heroes.assert_awaited_once_with(name="Batman")
+        superheroes_service.upsert_heroes.assert_awaited_once_with(new_heroes=[api_schema])
+
+    @pytest.mark.asyncio
+    async def test_execute_unknown_name_is_cached(
+        self,
+        superheroes_service: AsyncMock,
+        superhero_api_service: AsyncMock,
+    ):
+        use_case = CreateSuperheroUseCaseImpl(
+            superheroes_service=superheroes_service,
+            superhero_api_service=superhero_api_service,
+            unknown_names_cache=TTLCache(max_size=10, ttl=60),
+        )
+        superheroes_service.find_hero_by_name.return_value = None
+        superhero_api_service.search_heroes.return_value = []
+
+        for _ in range(3):
+            with pytest.raises(HeroNotFoundException):
+                await use_case.execute("Unknown")
+
+        superhero_api_service.search_heroes.assert_awaited_once_with(name="Unknown")
+        assert use_case.unknown_names_cache.stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_saves_all_search_results(
+        self,
+        use_case: CreateSuperheroUseCaseImpl,
+        superheroes_service: AsyncMock,
+        superhero_api_service: AsyncMock,
+    ):
+        superheroes_service.find_hero_by_name.return_value = None
+
+        found = [
+            SuperheroCreateSchema(
+                name=name,
+                intelligence=80,
+                strength=40,
+                speed=50,
+                durability=60,
+                power=70,
+                combat=90,
+            )
+            for name in ("Batman II", "Batman", "Batman Beyond")
+        ]
+        superhero_api_service.search_heroes.return_value = found
+        saved = [
+            SuperheroReadSchema(id=hero_id, **hero.model_dump())
+            for hero_id, hero in enumerate(found, start=1)
+        ]
+        superheroes_service.upsert_heroes.return_value = saved
+
+        result = await use_case.execute(superhero_name="batman")
+
+        assert result == saved[1]
+        superheroes_service.upsert_heroes.assert_awaited_once_with(new_heroes=found)
+
+        # Requested hero missing from the saved rows is a not found, not a StopIteration
+        superheroes_service.upsert_heroes.return_value = [saved[0]]
+        with pytest.raises(HeroNotFoundException):
+            await use_case.execute(superhero_name="batman")
+
+    @pytest.mark.asyncio
+    async def test_import_in_one_unit_of_work(
+        self,
+        superheroes_service: AsyncMock,
+        superhero_api_service: AsyncMock,
+    ):
+        events = []
+        unit_of_work = MagicMock()
+        unit_of_work.__aenter__ = AsyncMock(side_effect=lambda: events.append("begin"))
+        unit_of_work.__aexit__ = AsyncMock(side_effect=lambda *exc: events.append("commit"))
+        unit_of_work.checkpoint = AsyncMock(side_effect=lambda: events.append("checkpoint"))
+        use_case = CreateSuperheroUseCaseImpl(
+            superheroes_service=superheroes_service,
+            superhero_api_service=superhero_api_service,
+            unit_of_work=unit_of_work,
+        )
+        api_schema = SuperheroCreateSchema(
+            name="Batman",
+            intelligence=100,
+            strength=85,
+            speed=65,
+            durability=85,
+            power=80,
+            combat=90,
+        )
+
+        async def find_hero_by_name(name: str) -> None:
+            events.append("find")
+
+        async def search_heroes(name: str) -> List[SuperheroCreateSchema]:
+            events.append("search")
+            await asyncio.sleep(0.01)
+            return [api_schema]
+
+        async def upsert_heroes(new_heroes) -> List[SuperheroReadSchema]:
+            events.append("upsert")
+            return [SuperheroReadSchema(id=1, **api_schema.model_dump())]
+
+        superheroes_service.find_hero_by_name.side_effect = find_hero_by_name
+        superhero_api_service.search_heroes.side_effect = search_heroes
+        superheroes_service.upsert_heroes.side_effect = upsert_heroes
+
+        committed_on_return = []
+
+        async def import_hero() -> None:
+            await use_case.execute("Batman")
+            committed_on_return.append(events[-1])
+
+        leader = asyncio.create_task(import_hero())
+        followers = [asyncio.create_task(import_hero()) for _ in range(2)]
+        await asyncio.sleep(0)
+        # Leader gone, the shared import still commits for the followers
+        leader.cancel()
+        await asyncio.gather(*followers)
+
+        # Connection given back before the API call, result committed before shared
+        assert events == ["begin", "find", "checkpoint", "search", "upsert", "commit"]
+        assert committed_on_return == ["commit", "commit"]
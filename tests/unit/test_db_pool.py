@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from src.core.database.pool import InstrumentedAsyncPool
+from src.core.metrics import Histogram
+
+
+class TestInstrumentedAsyncPool:
+    @pytest.fixture
+    def pool(self) -> InstrumentedAsyncPool:
+        return InstrumentedAsyncPool(
+            MagicMock,
+            pool_size=1,
+            max_overflow=0,
+            timeout=0.05,
+            reset_on_return=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_checkout_stats_and_timeout(self, pool: InstrumentedAsyncPool):
+        connection = await greenlet_spawn(pool.connect)
+
+        stats = pool.stats()
+        assert stats["checked_out"] == 1
+        assert stats["checked_in"] == 0
+
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(pool.connect)
+
+        stats = pool.stats()
+        assert stats["timeouts"] == 1
+        assert stats["queue_wait_seconds"]["count"] == 2
+        # Timed out checkout waited for the whole pool timeout
+        assert stats["queue_wait_seconds"]["buckets"]["0.01"] == 1
+        assert stats["queue_wait_seconds"]["sum"] >= 0.05
+        # Opening the one connection is timed apart from waiting
+        assert stats["connect_seconds"]["count"] == 1
+
+        await greenlet_spawn(connection.close)
+        assert pool.stats()["checked_in"] == 1
+
+
+class TestHistogram:
+    def test_cumulative_buckets(self):
+        histogram = Histogram([0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert histogram.snapshot() == {
+            "buckets": {"0.1": 2, "1.0": 3, "+Inf": 4},
+            "count": 4,
+            "sum": pytest.approx(2.65),
+        }
@@ -0,0 +1,53 @@
+import pytest
+
+from src.core.pagination import KeysetCursor, encode_cursor
+from src.apps.superheroes.repositories.superheroes import SuperheroesRepositoryImpl
+from src.apps.superheroes.schemas.superheroes import SuperheroQueryFilterSchema
+
+
+class TestFilterStatementCache:
+    @pytest.fixture
+    def repository(self) -> SuperheroesRepositoryImpl:
+        SuperheroesRepositoryImpl.filter_statements.clear()
+        return SuperheroesRepositoryImpl(session=None)
+
+    def test_same_shape_reuses_statement(self, repository: SuperheroesRepositoryImpl):
+        first, first_params = repository._filter_statement(
+            SuperheroQueryFilterSchema(strength_ge=10, speed=50, limit=5)
+        )
+        second, second_params = repository._filter_statement(
+            SuperheroQueryFilterSchema(strength_ge=90, speed=1, limit=20)
+        )
+
+        assert second is first
+        assert first_params == {"strength_ge": 10, "speed_eq": 50, "limit": 6}
+        assert second_params == {"strength_ge": 90, "speed_eq": 1, "limit": 21}
+        assert len(repository.filter_statements) == 1
+
+    def test_different_shapes(self, repository: SuperheroesRepositoryImpl):
+        cache = repository.filter_statements
+        hits, misses = cache.hits, cache.misses
+        statements = {
+            id(repository._filter_statement(filters)[0])
+            for filters in (
+                SuperheroQueryFilterSchema(strength_ge=10),
+                SuperheroQueryFilterSchema(strength_le=10),
+                SuperheroQueryFilterSchema(strength_ge=10, strength_le=20),
+                SuperheroQueryFilterSchema(strength_ge=10, sort_by="strength"),
+            )
+        }
+        repository._filter_statement(SuperheroQueryFilterSchema(), paged=False)
+
+        assert len(statements) == 4
+        assert cache.misses - misses == 5
+        assert cache.hits == hits
+
+    def test_cursor_params(self, repository: SuperheroesRepositoryImpl):
+        cursor = encode_cursor(KeysetCursor("name", "Batman", 7))
+        statement, params = repository._filter_statement(
+            SuperheroQueryFilterSchema(sort_by="name", cursor=cursor, limit=10),
+            paged=False,
+        )
+
+        assert params == {"cursor_value": "Batman", "cursor_id": 7}
+        assert statement._limit_clause is None
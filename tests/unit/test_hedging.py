@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from src.core.http.hedging import Hedger, LatencyTracker
+
+
+class TestLatencyTracker:
+    def test_percentile(self):
+        tracker = LatencyTracker(window_size=100)
+        assert tracker.percentile(95) is None
+
+        for value in range(1, 101):
+            tracker.record(value / 1000)
+
+        assert tracker.percentile(50) == 0.05
+        assert tracker.percentile(95) == 0.095
+        assert tracker.percentile(100) == 0.1
+
+
+class TestHedger:
+    @pytest.fixture
+    def hedger(self) -> Hedger:
+        return Hedger(initial_delay=0.01, min_samples=1000)
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self, hedger: Hedger):
+        async def fast() -> str:
+            return "primary"
+
+        assert await hedger.run(fast) == "primary"
+        assert hedger.stats()["hedges_fired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self, hedger: Hedger):
+        primary_cancelled = asyncio.Event()
+
+        async def slow() -> str:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+            return "primary"
+
+        async def hedge() -> str:
+            return "hedge"
+
+        assert await hedger.run(slow, hedge) == "hedge"
+        await asyncio.sleep(0)
+
+        assert primary_cancelled.is_set()
+        # The cancelled primary is sampled as well, with at least the delay
+        assert len(hedger._latencies) == 2
+        assert hedger._latencies.percentile(100) >= 0.01
+        stats = hedger.stats()
+        assert stats["hedges_fired"] == 1
+        assert stats["hedges_won"] == 1
+        assert stats["win_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_caller_cancelled_before_hedge(self):
+        hedger = Hedger(initial_delay=1, min_samples=1000)
+        started = asyncio.Event()
+        primary_cancelled = asyncio.Event()
+
+        async def slow() -> str:
+            started.set()
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+            return "primary"
+
+        call = asyncio.create_task(hedger.run(slow))
+        await started.wait()
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        await asyncio.sleep(0)
+
+        assert primary_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_waits_for_primary(self, hedger: Hedger):
+        async def slow() -> str:
+            await asyncio.sleep(0.03)
+            return "primary"
+
+        async def broken() -> str:
+            raise RuntimeError("hedge failed")
+
+        assert await hedger.run(slow, broken) == "primary"
+        assert hedger.stats()["hedges_won"] == 0
+
+    @pytest.mark.asyncio
+    async def test_both_failed(self, hedger: Hedger):
+        async def broken() -> str:
+            await asyncio.sleep(0.02)
+            raise RuntimeError("failed")
+
+        with pytest.raises(RuntimeError):
+            await hedger.run(broken)
+
+    def test_delay_follows_percentile(self):
+        hedger = Hedger(percentile=50, min_delay=0.001, min_samples=3)
+        assert hedger.delay == hedger.initial_delay
+
+        for latency in (0.01, 0.02, 0.03):
+            hedger._latencies.record(latency)
+
+        assert hedger.delay == 0.02
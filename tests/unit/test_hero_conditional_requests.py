@@ -0,0 +1,133 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.responses import etag_matches, weak_etag
+from src.apps.superheroes.router import router
+from src.apps.superheroes.depends import (
+    get_list_superheroes_use_case,
+    get_stream_superheroes_use_case,
+)
+from src.apps.superheroes.use_cases.list import ListSuperheroesUseCaseImpl
+from src.apps.superheroes.schemas.superheroes import (
+    SuperheroReadSchema,
+    SuperheroPageSchema,
+)
+
+
+class TestHeroConditionalRequests:
+    @pytest.fixture
+    def use_case(self) -> MagicMock:
+        use_case = MagicMock()
+        use_case.version = AsyncMock(return_value=1)
+        use_case.execute = AsyncMock(
+            return_value=SuperheroPageSchema(
+                items=[
+                    SuperheroReadSchema(
+                        id=1,
+                        name="Batman",
+                        intelligence=100,
+                        strength=85,
+                        speed=65,
+                        durability=85,
+                        power=80,
+                        combat=90,
+                    )
+                ]
+            )
+        )
+        return use_case
+
+    @pytest.fixture
+    def client(self, use_case: MagicMock) -> TestClient:
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_list_superheroes_use_case] = lambda: use_case
+        return TestClient(app)
+
+    def test_etag_and_not_modified(self, client: TestClient, use_case: MagicMock):
+        response = client.get("/superheroes/hero", params={"power": 80})
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert response.headers["Cache-Control"] == "public, no-cache"
+
+        response = client.get(
+            "/superheroes/hero",
+            params={"power": 80},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        # Query is not run for 304
+        use_case.execute.assert_awaited_once()
+
+    def test_etag_changes(self, client: TestClient, use_case: MagicMock):
+        etag = client.get("/superheroes/hero", params={"power": 80}).headers["ETag"]
+
+        other_filters = client.get("/superheroes/hero", params={"power": 81})
+        assert other_filters.headers["ETag"] != etag
+
+        use_case.version.return_value = 2
+        changed = client.get(
+            "/superheroes/hero",
+            params={"power": 80},
+            headers={"If-None-Match": etag},
+        )
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    def test_stream_reads_in_open_unit_of_work(self, use_case: MagicMock):
+        events = []
+        batman = use_case.execute.return_value.items[0]
+
+        class FakeUnitOfWork:
+            async def __aenter__(self):
+                events.append("open")
+
+            async def __aexit__(self, *exc_info):
+                events.append("close")
+
+        async def get_version():
+            events.append("version")
+            return 1
+
+        async def stream_heroes(filters, chunk_size):
+            for _ in range(3):
+                events.append("row")
+                yield batman
+
+        service = MagicMock(get_version=get_version, stream_heroes=stream_heroes)
+        stream_use_case = ListSuperheroesUseCaseImpl(service, unit_of_work=FakeUnitOfWork())
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_stream_superheroes_use_case] = lambda: stream_use_case
+        client = TestClient(app)
+
+        response = client.get("/superheroes/hero/stream", params={"power": 80})
+
+        assert response.status_code == 200
+        assert len(response.text.splitlines()) == 3
+        # Version and every row are read before the unit of work is closed
+        assert events == ["open", "version", "row", "row", "row", "close"]
+
+        events.clear()
+        not_modified = client.get(
+            "/superheroes/hero/stream",
+            params={"power": 80},
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        assert not_modified.status_code == 304
+        assert events == ["open", "version", "close"]
+
+    def test_etag_matches(self):
+        etag = weak_etag(1, "filters")
+        assert etag == weak_etag(1, "filters")
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('W/"other"', etag)
@@ -0,0 +1,29 @@
+import pytest
+
+from src.core.http.client_provider import HttpClientProvider
+
+
+class TestHttpClientProvider:
+    @pytest.fixture
+    def provider(self) -> HttpClientProvider:
+        return HttpClientProvider(limit=10, limit_per_host=5, ttl_dns_cache=60)
+
+    def test_session_before_startup(self, provider: HttpClientProvider):
+        with pytest.raises(RuntimeError):
+            _ = provider.session
+
+    @pytest.mark.asyncio
+    async def test_startup_reuses_session(self, provider: HttpClientProvider):
+        await provider.startup()
+        session = provider.session
+        await provider.startup()
+
+        assert provider.session is session
+        assert await provider.session_getter() is session
+        assert session.connector.limit == 10
+        assert session.connector.limit_per_host == 5
+
+        await provider.dispose()
+        assert session.closed
+        with pytest.raises(RuntimeError):
+            _ = provider.session
@@ -1,10 +1,11 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 from src.apps.superheroes.use_cases.list import ListSuperheroesUseCaseImpl
 from src.apps.superheroes.schemas.superheroes import (
     SuperheroReadSchema,
     SuperheroQueryFilterSchema,
+    SuperheroPageSchema,
 )
 from src.apps.superheroes.exceptions import (
     HeroNotFoundException,
@@ -62,7 +63,7 @@ class TestListSuperheroesUseCaseImpl:
         )
         result = await use_case.execute(filters)
 
-        assert result == [hero]
+        assert result == SuperheroPageSchema(items=[hero])
         service.find_hero_by_name.assert_awaited_once_with(name="Batman")
         service.filter_heroes.assert_not_awaited()
 
@@ -131,7 +132,9 @@ class TestListSuperheroesUseCaseImpl:
                 combat=80,
             ),
         ]
-        service.filter_heroes.return_value = heroes
+        service.filter_heroes.return_value = SuperheroPageSchema(
+            items=heroes, next_cursor="cursor"
+        )
 
         filters = SuperheroQueryFilterSchema(
             name=None,
@@ -156,7 +159,8 @@ class TestListSuperheroesUseCaseImpl:
         )
         result = await use_case.execute(filters)
 
-        assert result == heroes
+        assert result.items == heroes
+        assert result.next_cursor == "cursor"
         service.filter_heroes.assert_awaited_once_with(filters=filters)
         service.find_hero_by_name.assert_not_awaited()
 
@@ -196,3 +200,50 @@ class TestListSuperheroesUseCaseImpl:
         assert "strength_le" in str(exc.value)
         service.filter_heroes.assert_awaited_once_with(filters=filters)
         service.find_hero_by_name.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stream_filter(
+        self,
+        use_case: ListSuperheroesUseCaseImpl,
+        service: AsyncMock,
+    ):
+        heroes = [
+            SuperheroReadSchema(
+                id=i,
+                name=f"Hero {i}",
+                intelligence=50,
+                strength=50,
+                speed=50,
+                durability=50,
+                power=50,
+                combat=50,
+            )
+            for i in range(3)
+        ]
+
+        async def stream_heroes(filters, chunk_size):
+            for hero in heroes:
+                yield hero
+
+        service.stream_heroes = MagicMock(side_effect=stream_heroes)
+        filters = SuperheroQueryFilterSchema(intelligence=50)
+
+        result = [hero async for hero in use_case.stream(filters, chunk_size=2)]
+
+        assert result == heroes
+        service.stream_heroes.assert_called_once_with(filters=filters, chunk_size=2)
+        service.find_hero_by_name.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stream_by_name_not_found(
+        self,
+        use_case: ListSuperheroesUseCaseImpl,
+        service: AsyncMock,
+    ):
+        service.find_hero_by_name.return_value = None
+
+        filters = SuperheroQueryFilterSchema(name="Unknown")
+        result = [hero async for hero in use_case.stream(filters, chunk_size=2)]
+
+        assert result == []
+        service.find_hero_by_name.assert_awaited_once_with(name="Unknown")
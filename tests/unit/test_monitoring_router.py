@@ -0,0 +1,32 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.settings import settings
+from src.apps.monitoring.router import router
+
+
+class TestMonitoringRouter:
+    @pytest.fixture
+    def client(self) -> TestClient:
+        app = FastAPI()
+        app.include_router(router)
+        return TestClient(app)
+
+    def test_open_without_token(self, client: TestClient, monkeypatch):
+        monkeypatch.setattr(settings.monitoring, "token", None)
+
+        response = client.get("/monitoring/metrics")
+
+        assert response.status_code == 200
+        assert isinstance(response.json(), dict)
+
+    def test_token_required(self, client: TestClient, monkeypatch):
+        monkeypatch.setattr(settings.monitoring, "token", "secret")
+
+        assert client.get("/monitoring/metrics").status_code == 401
+        wrong = client.get("/monitoring/metrics", headers={"Authorization": "Bearer nope"})
+        assert wrong.status_code == 401
+        assert wrong.headers["WWW-Authenticate"] == "Bearer"
+        ok = client.get("/monitoring/metrics", headers={"Authorization": "Bearer secret"})
+        assert ok.status_code == 200
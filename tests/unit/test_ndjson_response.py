@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from src.core.responses import iter_ndjson
+from src.apps.superheroes.schemas.superheroes import SuperheroPageSchema
+
+
+class TestIterNDJSON:
+    @staticmethod
+    async def _pages(count: int, closed: list):
+        try:
+            for i in range(count):
+                yield SuperheroPageSchema(items=[], next_cursor=str(i))
+        finally:
+            closed.append(True)
+
+    @pytest.mark.asyncio
+    async def test_chunks_lines(self):
+        closed = []
+        chunks = [c async for c in iter_ndjson(self._pages(5, closed), chunk_size=2)]
+
+        assert len(chunks) == 3
+        assert all(c.endswith(b"\n") for c in chunks)
+        lines = b"".join(chunks).splitlines()
+        # Lines are serialized by alias like regular JSON responses
+        assert [json.loads(line)["nextCursor"] for line in lines] == ["0", "1", "2", "3", "4"]
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_empty_stream(self):
+        closed = []
+        assert [c async for c in iter_ndjson(self._pages(0, closed))] == []
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_closes_source_on_disconnect(self):
+        closed = []
+        stream = iter_ndjson(self._pages(10, closed), chunk_size=1)
+        await anext(stream)
+        await stream.aclose()
+
+        assert closed == [True]
@@ -0,0 +1,41 @@
+import pytest
+
+from src.core.exceptions.pagination_exceptions import InvalidCursorException
+from src.core.pagination import KeysetCursor, encode_cursor, decode_cursor
+
+
+class TestKeysetCursor:
+    @pytest.mark.parametrize("value", [42, "Batman", None])
+    def test_roundtrip(self, value):
+        cursor = KeysetCursor("strength", value, 7)
+
+        assert decode_cursor(encode_cursor(cursor), "strength") == cursor
+
+    @pytest.mark.parametrize("cursor", ["", "not a cursor", "W10", "WzEsMiwzXQ"])
+    def test_malformed(self, cursor: str):
+        with pytest.raises(InvalidCursorException):
+            decode_cursor(cursor, "strength")
+
+    def test_other_sort_key(self):
+        cursor = encode_cursor(KeysetCursor("speed", 1, 1))
+
+        with pytest.raises(InvalidCursorException):
+            decode_cursor(cursor, "strength")
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            KeysetCursor("strength", "42", 7),
+            KeysetCursor("strength", True, 7),
+            KeysetCursor("strength", None, 7),
+            KeysetCursor("strength", 42, True),
+        ],
+    )
+    def test_wrong_value_type(self, cursor: KeysetCursor):
+        with pytest.raises(InvalidCursorException):
+            decode_cursor(encode_cursor(cursor), "strength", int)
+
+    def test_value_type_checked(self):
+        cursor = KeysetCursor("name", "Batman", 7)
+
+        assert decode_cursor(encode_cursor(cursor), "name", str) == cursor
@@ -0,0 +1,79 @@
+import json
+from typing import List
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.core.responses import PydanticJSONResponse
+from src.apps.superheroes.schemas.superheroes import (
+    SuperheroReadSchema,
+    SuperheroPageSchema,
+    SuperheroBulkItemSchema,
+    SuperheroImportStatus,
+)
+
+
+def make_page() -> SuperheroPageSchema:
+    return SuperheroPageSchema(
+        items=[
+            SuperheroReadSchema(
+                id=i,
+                name=f'Hero "{i}" é',
+                intelligence=1,
+                strength=2,
+                speed=3,
+                durability=4,
+                power=5,
+                combat=6,
+            )
+            for i in range(3)
+        ],
+        next_cursor="abc",
+    )
+
+
+class TestPydanticJSONResponse:
+    def test_same_body_as_response_model_path(self):
+        page = make_page()
+        items = [SuperheroBulkItemSchema(name="Nobody", status=SuperheroImportStatus.NOT_FOUND)]
+        app = FastAPI()
+
+        @app.get("/validated")
+        async def validated() -> SuperheroPageSchema:
+            return page
+
+        @app.get("/fast", response_model=SuperheroPageSchema)
+        async def fast() -> Response:
+            return PydanticJSONResponse(page)
+
+        @app.get("/validated-list")
+        async def validated_list() -> List[SuperheroBulkItemSchema]:
+            return items
+
+        @app.get("/fast-list", response_model=List[SuperheroBulkItemSchema])
+        async def fast_list() -> Response:
+            return PydanticJSONResponse(items)
+
+        client = TestClient(app)
+        for slow_path, fast_path in (("/validated", "/fast"), ("/validated-list", "/fast-list")):
+            slow = client.get(slow_path)
+            fast = client.get(fast_path)
+            assert fast.status_code == 200
+            assert fast.headers["content-type"] == "application/json"
+            assert json.loads(fast.content) == json.loads(slow.content)
+
+        # camelCase serialization aliases of ResponseSchema
+        assert json.loads(client.get("/fast").content)["nextCursor"] == "abc"
+
+    def test_response_schema_rendered_once(self, monkeypatch):
+        page = make_page()
+        body = PydanticJSONResponse(page).body
+        assert page.json_bytes() is page.json_bytes()
+
+        # A rendered instance is not serialized again
+        monkeypatch.setattr("src.core.schemas.http_schemas.to_json", None)
+        assert PydanticJSONResponse(page).body == body
+        monkeypatch.undo()
+        # Rendered body takes no part in comparison and copies
+        assert page == make_page()
+        assert page.model_copy(update={"next_cursor": None}).json_bytes() != body
@@ -0,0 +1,68 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions.http_exceptions import RateLimitExceededException
+from src.core.http.rate_limit import TokenBucket, FileTokenBucket, reserve_token
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_reserve_token(self):
+        assert reserve_token(2, 0, 0, rate=1, capacity=2) == (1, 0)
+        # Refilled, but never above capacity
+        assert reserve_token(0, 0, 10, rate=1, capacity=2) == (1, 0)
+        # Queued caller waits for its token
+        assert reserve_token(0, 0, 0, rate=4, capacity=2) == (-1, 0.25)
+
+    @pytest.mark.asyncio
+    async def test_burst_then_shed(self):
+        timer = FakeTimer()
+        bucket = TokenBucket("test", rate=1, capacity=2, max_wait=0.5, timer=timer)
+
+        await bucket.acquire()
+        await bucket.acquire()
+        with pytest.raises(RateLimitExceededException) as exc:
+            await bucket.acquire()
+
+        assert exc.value.retry_after == pytest.approx(1.0)
+        timer.now = 1.0
+        await bucket.acquire()
+        assert bucket.stats()["acquired"] == 3
+        assert bucket.stats()["shed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_callers_queue_up_to_max_wait(self):
+        bucket = TokenBucket("test", rate=100, capacity=1, max_wait=1)
+
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+        assert bucket.stats()["delayed"] == 2
+        assert bucket.stats()["shed"] == 0
+
+
+class TestFileTokenBucket:
+    @pytest.mark.asyncio
+    async def test_buckets_share_state(self, tmp_path: Path):
+        timer = FakeTimer()
+        path = tmp_path / "bucket"
+        worker_1 = FileTokenBucket("test", path, 1, 2, max_wait=0, timer=timer)
+        worker_2 = FileTokenBucket("test", path, 1, 2, max_wait=0, timer=timer)
+
+        await worker_1.acquire()
+        await worker_2.acquire()
+        with pytest.raises(RateLimitExceededException):
+            await worker_1.acquire()
+        with pytest.raises(RateLimitExceededException):
+            await worker_2.acquire()
+
+        timer.now = 1.0
+        await worker_2.acquire()
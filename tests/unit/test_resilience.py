@@ -0,0 +1,113 @@
+import pytest
+
+from src.core.exceptions.http_exceptions import CircuitOpenException
+from src.core.http.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RetryBudget,
+    jittered_backoff,
+)
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryBudget:
+    def test_budget_is_limited_by_requests(self):
+        budget = RetryBudget(ratio=0.5, capacity=2)
+
+        assert budget.try_withdraw()
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+        budget.deposit()
+        budget.deposit()
+        assert budget.try_withdraw()
+        assert budget.stats() == {"tokens": 0.0, "retries": 3, "exhausted": 1}
+
+    def test_jittered_backoff_is_capped(self):
+        for attempt in range(10):
+            assert 0 <= jittered_backoff(attempt, base=0.1, cap=1.0) <= 1.0
+
+
+class TestCircuitBreaker:
+    @pytest.fixture
+    def timer(self) -> FakeTimer:
+        return FakeTimer()
+
+    @pytest.fixture
+    def breaker(self, timer: FakeTimer) -> CircuitBreaker:
+        return CircuitBreaker(
+            name="test",
+            failure_rate_threshold=0.5,
+            minimum_calls=4,
+            window_size=10,
+            open_seconds=10,
+            half_open_calls=2,
+            timer=timer,
+        )
+
+    def test_opens_on_failure_rate(self, breaker: CircuitBreaker):
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call()
+        assert breaker.stats()["rejected_count"] == 1
+
+    def test_half_open_recovers(self, breaker: CircuitBreaker, timer: FakeTimer):
+        for _ in range(4):
+            breaker.record_failure()
+        timer.now = 10
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.before_call()
+        breaker.before_call()
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call()
+
+        breaker.record_success()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_failure_reopens(
+        self,
+        breaker: CircuitBreaker,
+        timer: FakeTimer,
+    ):
+        for _ in range(4):
+            breaker.record_failure()
+        timer.now = 10
+        breaker.before_call()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.opened_count == 2
+
+    def test_released_trial_slot_reused(
+        self,
+        breaker: CircuitBreaker,
+        timer: FakeTimer,
+    ):
+        for _ in range(4):
+            breaker.record_failure()
+        timer.now = 10
+        breaker.before_call()
+        breaker.before_call()
+
+        breaker.release_call()
+        breaker.before_call()
+        breaker.record_success()
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,118 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from src.core.cache.response_cache import SQLiteResponseCache, ResponseCacheMode
+from src.core.exceptions.http_exceptions import UpstreamUnavailableException
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeUpstream:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def fetch(self) -> Dict[str, Any]:
+        self.calls += 1
+        return {"response": "success", "version": self.calls}
+
+
+class TestSQLiteResponseCache:
+    @pytest.fixture
+    def timer(self) -> FakeTimer:
+        return FakeTimer()
+
+    @pytest.fixture
+    def upstream(self) -> FakeUpstream:
+        return FakeUpstream()
+
+    @pytest.fixture
+    async def cache(self, tmp_path: Path, timer: FakeTimer):
+        cache = SQLiteResponseCache(
+            service_name="test",
+            path=tmp_path / "cache.sqlite3",
+            ttl=10,
+            stale_ttl=100,
+            timer=timer,
+        )
+        yield cache
+        await cache.dispose()
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit(self, cache: SQLiteResponseCache, upstream: FakeUpstream):
+        first = await cache.get_or_fetch("search/batman", upstream.fetch)
+        second = await cache.get_or_fetch("search/batman", upstream.fetch)
+
+        assert first == second == {"response": "success", "version": 1}
+        assert upstream.calls == 1
+        assert cache.stats()["fresh_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(
+        self,
+        cache: SQLiteResponseCache,
+        upstream: FakeUpstream,
+        timer: FakeTimer,
+    ):
+        await cache.get_or_fetch("search/batman", upstream.fetch)
+        timer.now += 50
+
+        stale = await cache.get_or_fetch("search/batman", upstream.fetch)
+        await asyncio.gather(*cache._background)
+        fresh = await cache.get_or_fetch("search/batman", upstream.fetch)
+
+        assert stale["version"] == 1
+        assert fresh["version"] == 2
+        assert upstream.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(
+        self,
+        cache: SQLiteResponseCache,
+        upstream: FakeUpstream,
+        timer: FakeTimer,
+    ):
+        await cache.get_or_fetch("search/batman", upstream.fetch)
+        timer.now += 200
+
+        result = await cache.get_or_fetch("search/batman", upstream.fetch)
+
+        assert result["version"] == 2
+
+    @pytest.mark.asyncio
+    async def test_replay_survives_restart(
+        self,
+        cache: SQLiteResponseCache,
+        upstream: FakeUpstream,
+        timer: FakeTimer,
+    ):
+        await cache.get_or_fetch("search/batman", upstream.fetch)
+        await cache.dispose()
+
+        replay = SQLiteResponseCache(
+            service_name="test",
+            path=cache.path,
+            ttl=10,
+            stale_ttl=100,
+            mode=ResponseCacheMode.REPLAY,
+            timer=timer,
+        )
+        timer.now += 10_000
+        try:
+            assert (await replay.get_or_fetch("search/batman", upstream.fetch))[
+                "version"
+            ] == 1
+            with pytest.raises(UpstreamUnavailableException):
+                await replay.get_or_fetch("search/unknown", upstream.fetch)
+        finally:
+            await replay.dispose()
+
+        assert upstream.calls == 1
@@ -0,0 +1,61 @@
+from src.core.cache.result_cache import VersionedLRUCache, json_size
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestVersionedLRUCache:
+    def test_version_change_misses(self):
+        cache: VersionedLRUCache[str, str] = VersionedLRUCache(max_bytes=100)
+
+        assert cache.get("a", version=1) is None
+        cache.set("a", 1, "value")
+        assert cache.get("a", version=1) == "value"
+        assert cache.get("a", version=2, default="miss") == "miss"
+        assert len(cache) == 0
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["stale"] == 1
+        assert stats["bytes"] == 0
+
+    def test_cached_none(self):
+        cache: VersionedLRUCache[str, None] = VersionedLRUCache(max_bytes=100)
+        miss = object()
+        cache.set("a", 1, None)
+        assert cache.get("a", 1, default=miss) is None
+        assert cache.get("b", 1, default=miss) is miss
+
+    def test_byte_bound_lru_eviction(self):
+        cache: VersionedLRUCache[str, str] = VersionedLRUCache(max_bytes=10, sizeof=len)
+        cache.set("a", 1, "aaaa")
+        cache.set("b", 1, "bbbb")
+        cache.get("a", 1)  # "b" is now least recently used
+        cache.set("c", 1, "cccc")
+
+        assert cache.get("b", 1) is None
+        assert cache.get("a", 1) == "aaaa"
+        assert cache.get("c", 1) == "cccc"
+        assert cache.stats()["bytes"] == 8
+        assert cache.stats()["evictions"] == 1
+
+        # Values over the whole budget are not cached
+        cache.set("d", 1, "d" * 11)
+        assert cache.get("d", 1) is None
+        assert cache.stats()["bytes"] == 8
+
+    def test_ttl(self):
+        timer = FakeTimer()
+        cache: VersionedLRUCache[str, int] = VersionedLRUCache(max_bytes=100, ttl=5, timer=timer)
+        cache.set("a", 1, 1)
+        timer.now = 5.0
+        assert cache.get("a", 1) is None
+
+    def test_json_size(self):
+        assert json_size({"a": [1, 2]}) == len('{"a":[1,2]}')
@@ -0,0 +1,149 @@
+import asyncio
+from typing import List
+
+import pytest
+from aiohttp import web, ClientSession, ClientTimeout
+from aiohttp.test_utils import TestServer
+
+from src.settings import settings
+from src.core.exceptions.http_exceptions import (
+    UpstreamUnavailableException,
+    CircuitOpenException,
+)
+from src.core.http.resilience import CircuitBreaker, RetryBudget
+from src.apps.superheroes.services.superhero_api import SuperHeroApiServiceImpl
+
+
+class FakeUpstream:
+    """
+    Local fake SuperHero API: replies with queued statuses, then success.
+    """
+
+    def __init__(self, superhero_response: dict) -> None:
+        self.superhero_response = superhero_response
+        self.statuses: List[int] = []
+        self.delay = 0.0
+        self.calls = 0
+
+    async def search(self, request: web.Request) -> web.Response:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.statuses:
+            return web.json_response({}, status=self.statuses.pop(0))
+        return web.json_response(self.superhero_response)
+
+
+class TestSuperHeroApiResilience:
+    @pytest.fixture
+    async def upstream(self, mock_superhero_response: dict, monkeypatch):
+        fake = FakeUpstream(mock_superhero_response)
+        app = web.Application()
+        app.router.add_get("/api/{token}/search/{name}", fake.search)
+        async with TestServer(app) as server:
+            monkeypatch.setattr(settings.sh_api, "api_url", str(server.make_url("/api")))
+            monkeypatch.setattr(settings.sh_api, "retry_backoff_base", 0.001)
+            yield fake
+
+    @pytest.fixture
+    async def session(self):
+        async with ClientSession(timeout=ClientTimeout(sock_read=0.05)) as session:
+            yield session
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors(
+        self,
+        upstream: FakeUpstream,
+        session: ClientSession,
+    ):
+        upstream.statuses = [503, 500]
+        service = SuperHeroApiServiceImpl(session=session)
+
+        hero = await service.get_hero_by_name("Batman")
+
+        assert hero is not None and hero.name == "Batman"
+        assert upstream.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_read_timeout_makes_upstream_unavailable(
+        self,
+        upstream: FakeUpstream,
+        session: ClientSession,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(settings.sh_api, "max_retries", 1)
+        upstream.delay = 0.2
+        service = SuperHeroApiServiceImpl(session=session)
+
+        with pytest.raises(UpstreamUnavailableException):
+            await service.get_hero_by_name("Batman")
+
+        assert upstream.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_limits_retries(
+        self,
+        upstream: FakeUpstream,
+        session: ClientSession,
+    ):
+        upstream.statuses = [500] * 10
+        service = SuperHeroApiServiceImpl(
+            session=session,
+            retry_budget=RetryBudget(ratio=0, capacity=1),
+        )
+
+        for _ in range(2):
+            with pytest.raises(UpstreamUnavailableException):
+                await service.get_hero_by_name("Batman")
+
+        # One retry for the first call, none for the second
+        assert upstream.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_fails_fast(
+        self,
+        upstream: FakeUpstream,
+        session: ClientSession,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(settings.sh_api, "max_retries", 0)
+        upstream.statuses = [500] * 2
+        breaker = CircuitBreaker(name="test", minimum_calls=2, open_seconds=60)
+        service = SuperHeroApiServiceImpl(session=session, circuit_breaker=breaker)
+
+        for _ in range(2):
+            with pytest.raises(UpstreamUnavailableException):
+                await service.get_hero_by_name("Batman")
+        with pytest.raises(CircuitOpenException):
+            await service.get_hero_by_name("Batman")
+
+        assert upstream.calls == 2
+        assert breaker.stats()["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_call_releases_breaker_slot(
+        self,
+        upstream: FakeUpstream,
+        session: ClientSession,
+    ):
+        breaker = CircuitBreaker(
+            name="test",
+            minimum_calls=1,
+            open_seconds=0,
+            half_open_calls=1,
+        )
+        breaker.record_failure()
+        service = SuperHeroApiServiceImpl(session=session, circuit_breaker=breaker)
+        upstream.delay = 0.02
+
+        task = asyncio.create_task(service.get_hero_by_name("Batman"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        upstream.delay = 0
+        hero = await service.get_hero_by_name("Batman")
+
+        assert hero is not None
+        assert breaker.stats()["state"] == "closed"
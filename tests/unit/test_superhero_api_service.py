@@ -1,14 +1,18 @@
 import pytest
+from aiohttp import ClientSession
 from aioresponses import aioresponses
 
 from src.apps.superheroes.services.superhero_api import SuperHeroApiServiceImpl
+from src.core.cache.response_cache import SQLiteResponseCache
+from src.core.exceptions.http_exceptions import UpstreamUnavailableException
 from src.apps.superheroes.schemas.superheroes import SuperheroCreateSchema
 
 
 class TestSuperHeroApiServiceImpl:
     @pytest.fixture
-    def service(self):
-        return SuperHeroApiServiceImpl()
+    async def service(self):
+        async with ClientSession() as session:
+            yield SuperHeroApiServiceImpl(session=session)
 
     @pytest.mark.asyncio
     async def test_get_hero_by_name_success(
@@ -44,6 +48,38 @@ class TestSuperHeroApiServiceImpl:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_search_heroes_error_response(self, service: SuperHeroApiServiceImpl):
+        url = service._search_url + "Batman"
+
+        with aioresponses() as m:
+            m.get(url, payload={"response": "error", "error": "access denied"})
+
+            # Not a "no such hero" answer, must not be taken (and cached) as one
+            with pytest.raises(UpstreamUnavailableException):
+                await service.search_heroes("Batman")
+
+    @pytest.mark.asyncio
+    async def test_only_found_and_not_found_responses_cached(
+        self,
+        tmp_path,
+        mock_not_found_response: dict,
+    ):
+        cache = SQLiteResponseCache("SuperHero API", tmp_path / "cache.db", ttl=60, stale_ttl=0)
+        async with ClientSession() as session:
+            service = SuperHeroApiServiceImpl(session=session, response_cache=cache)
+            with aioresponses() as m:
+                m.get(service._search_url + "Batman", payload={"response": "error", "error": "x"})
+                m.get(service._search_url + "Nobody", payload=mock_not_found_response)
+
+                with pytest.raises(UpstreamUnavailableException):
+                    await service.search_heroes("Batman")
+                assert await service.search_heroes("Nobody") == []
+
+        assert await cache.get("search/batman") is None
+        assert (await cache.get("search/nobody"))[0] == mock_not_found_response
+        await cache.dispose()
+
     @pytest.mark.asyncio
     async def test_get_hero_with_null_values(
         self,
@@ -65,4 +101,76 @@ class TestSuperHeroApiServiceImpl:
         assert result.speed == 0
         assert result.durability == 50
         assert result.power == 75
-        assert result.combat == 25
\ No newline at end of file
+        assert result.combat == 25
+
+    @pytest.mark.asyncio
+    async def test_get_hero_by_id(
+        self,
+        service: SuperHeroApiServiceImpl,
+        mock_superhero_response: dict,
+    ):
+        url = service._base_url + "69"
+        raw_hero = mock_superhero_response["results"][0]
+
+        with aioresponses() as m:
+            m.get(url, payload={"response": "success", "id": "69", **raw_hero})
+
+            result = await service.get_hero_by_id(69)
+
+        assert result is not None
+        assert result.name == "Batman"
+        assert result.combat == 90
+
+    @pytest.mark.asyncio
+    async def test_get_hero_by_id_not_found(self, service: SuperHeroApiServiceImpl):
+        url = service._base_url + "9999"
+
+        with aioresponses() as m:
+            m.get(url, payload={"response": "error", "error": "invalid id"})
+
+            result = await service.get_hero_by_id(9999)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_search_heroes_returns_all_results(
+        self,
+        service: SuperHeroApiServiceImpl,
+        mock_superhero_response: dict,
+    ):
+        batman = mock_superhero_response["results"][0]
+        mock_superhero_response["results"] = [
+            {**batman, "name": "Batman II"},
+            batman,
+        ]
+        url = service._search_url + "batman"
+
+        with aioresponses() as m:
+            m.get(url, payload=mock_superhero_response, repeat=True)
+
+            heroes = await service.search_heroes("batman")
+            hero = await service.get_hero_by_name("batman")
+
+        assert [h.name for h in heroes] == ["Batman II", "Batman"]
+        assert hero.name == "Batman"
+
+    @pytest.mark.asyncio
+    async def test_get_hero_by_name_duplicates_last_wins(
+        self,
+        service: SuperHeroApiServiceImpl,
+        mock_superhero_response: dict,
+    ):
+        batman = mock_superhero_response["results"][0]
+        mock_superhero_response["results"] = [
+            batman,
+            {**batman, "powerstats": {**batman["powerstats"], "intelligence": "50"}},
+        ]
+        url = service._search_url + "batman"
+
+        with aioresponses() as m:
+            m.get(url, payload=mock_superhero_response)
+
+            hero = await service.get_hero_by_name("batman")
+
+        # Same one as saved by upsert_many
+        assert hero.intelligence == 50
@@ -7,6 +7,7 @@ from src.apps.superheroes.schemas.superheroes import (
     SuperheroCreateSchema,
     SuperheroReadSchema,
     SuperheroQueryFilterSchema,
+    SuperheroPageSchema,
 )
 from src.apps.superheroes.exceptions import (
     DBHeroNotFoundException,
@@ -81,6 +82,31 @@ class TestSuperheroesServiceImpl:
 
         repo.create.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_get_or_create_heroes(
+        self,
+        service: SuperheroesServiceImpl,
+        repo: AsyncMock,
+    ):
+        schema = SuperheroCreateSchema(
+            name="Batman",
+            intelligence=100,
+            strength=85,
+            speed=65,
+            durability=85,
+            power=80,
+            combat=90,
+        )
+        saved = SuperheroReadSchema(id=1, **schema.model_dump())
+        repo.get_or_create_many.return_value = [(saved, False)]
+
+        result = await service.get_or_create_heroes([schema])
+
+        assert result == [(saved, False)]
+        repo.get_or_create_many.assert_awaited_once_with(
+            [schema], conflict_fields=("name",)
+        )
+
     @pytest.mark.asyncio
     async def test_find_hero_by_name_exists(
         self,
@@ -144,28 +170,30 @@ class TestSuperheroesServiceImpl:
             combat_ge=None,
             combat_le=None,
         )
-        repo_return = [
-            SuperheroReadSchema(
-                id=1,
-                name="Batman",
-                intelligence=100,
-                strength=85,
-                speed=65,
-                durability=85,
-                power=80,
-                combat=90,
-            ),
-            SuperheroReadSchema(
-                id=2,
-                name="Superman",
-                intelligence=95,
-                strength=100,
-                speed=100,
-                durability=95,
-                power=100,
-                combat=80,
-            ),
-        ]
+        repo_return = SuperheroPageSchema(
+            items=[
+                SuperheroReadSchema(
+                    id=1,
+                    name="Batman",
+                    intelligence=100,
+                    strength=85,
+                    speed=65,
+                    durability=85,
+                    power=80,
+                    combat=90,
+                ),
+                SuperheroReadSchema(
+                    id=2,
+                    name="Superman",
+                    intelligence=95,
+                    strength=100,
+                    speed=100,
+                    durability=95,
+                    power=100,
+                    combat=80,
+                ),
+            ]
+        )
         repo.filter_all.return_value = repo_return
 
         result = await service.filter_heroes(filters)
@@ -0,0 +1,46 @@
+from src.core.cache.ttl_cache import TTLCache
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_get_set_and_counters(self):
+        cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=60)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_entries_expire(self):
+        timer = FakeTimer()
+        cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=5, timer=timer)
+        cache.set("a", 1)
+
+        timer.now = 4.9
+        assert cache.get("a") == 1
+        timer.now = 5.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
@@ -0,0 +1,125 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.database.table_versions import table_versions
+from src.core.database.unit_of_work import UNIT_OF_WORK_KEY, UnitOfWork
+from src.apps.superheroes.repositories.superheroes import SuperheroesRepositoryImpl
+
+
+class TestUnitOfWork:
+    @pytest.fixture
+    def transaction(self) -> MagicMock:
+        transaction = MagicMock(is_active=True)
+        transaction.commit = AsyncMock()
+        transaction.rollback = AsyncMock()
+        return transaction
+
+    @pytest.fixture
+    def session(self, transaction: MagicMock) -> MagicMock:
+        session = MagicMock(info={})
+        session.begin = AsyncMock(return_value=transaction)
+        session.close = AsyncMock()
+        return session
+
+    @pytest.mark.asyncio
+    async def test_commit(self, session: MagicMock, transaction: MagicMock):
+        async with UnitOfWork(session) as uow:
+            assert uow.active
+            assert session.info[UNIT_OF_WORK_KEY] is uow
+
+        transaction.commit.assert_awaited_once()
+        transaction.rollback.assert_not_awaited()
+        session.close.assert_awaited_once()
+        assert UNIT_OF_WORK_KEY not in session.info
+        assert not uow.active
+
+    @pytest.mark.asyncio
+    async def test_rollback_on_error(self, session: MagicMock, transaction: MagicMock):
+        with pytest.raises(ValueError):
+            async with UnitOfWork(session):
+                raise ValueError("boom")
+
+        transaction.rollback.assert_awaited_once()
+        transaction.commit.assert_not_awaited()
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_isolation_level(self, session: MagicMock):
+        session.connection = AsyncMock()
+
+        async with UnitOfWork(session, isolation_level="REPEATABLE READ"):
+            # Connection checked out on entry, with the level set
+            session.connection.assert_awaited_once_with(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
+
+    @pytest.mark.asyncio
+    async def test_repository_joins_transaction(self, session: MagicMock):
+        repository = SuperheroesRepositoryImpl(session=session)
+
+        async with UnitOfWork(session):
+            async with repository._session_scope(begin=True) as s:
+                assert s is session
+
+        # No own session scope or nested transaction inside the unit of work
+        session.__aenter__.assert_not_called()
+        session.begin.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_repository_write_bumps_table_version(self, session: MagicMock):
+        repository = SuperheroesRepositoryImpl(session=session)
+        table = repository.model_type.__tablename__
+        version = table_versions.get(table)
+
+        async with UnitOfWork(session):
+            async with repository._session_scope(begin=True):
+                pass
+            # Once for the write, once more after commit
+            assert table_versions.get(table) == version + 1
+        assert table_versions.get(table) == version + 2
+
+        async with repository._session_scope():
+            pass
+        assert table_versions.get(table) == version + 2
+
+    @pytest.mark.asyncio
+    async def test_on_commit_callbacks(self, session: MagicMock, transaction: MagicMock):
+        calls = []
+        async with UnitOfWork(session) as uow:
+            uow.on_commit(lambda: calls.append("committed"))
+            transaction.commit.assert_not_awaited()
+            assert calls == []
+        assert calls == ["committed"]
+
+        # Outside of a unit of work there is nothing to wait for
+        uow.on_commit(lambda: calls.append("now"))
+        assert calls == ["committed", "now"]
+
+    @pytest.mark.asyncio
+    async def test_on_commit_dropped_on_rollback(self, session: MagicMock):
+        calls = []
+        with pytest.raises(ValueError):
+            async with UnitOfWork(session) as uow:
+                uow.on_commit(lambda: calls.append("committed"))
+                raise ValueError("boom")
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_checkpoint(self, session: MagicMock, transaction: MagicMock):
+        calls = []
+        async with UnitOfWork(session) as uow:
+            uow.on_commit(lambda: calls.append("first"))
+            await uow.checkpoint()
+            # Work so far is committed, the unit of work goes on
+            assert calls == ["first"]
+            assert uow.active
+            assert session.info[UNIT_OF_WORK_KEY] is uow
+            uow.on_commit(lambda: calls.append("second"))
+
+        assert transaction.commit.await_count == 2
+        assert session.begin.await_count == 2
+        assert calls == ["first", "second"]
+
+        with pytest.raises(RuntimeError):
+            await uow.checkpoint()